@@ -1,3 +1,39 @@
+# 모든 도구에 공통으로 추가되는 파라미터
+fields_annotations = {
+    "fields": {
+        "type": "array",
+        "required": False,
+        "description": "반환할 출력 필드 목록 (생략 시 전체 필드, 사용 가능한 필드는 kis://fields 리소스 참고)",
+        "examples": [["last", "rate", "tvol"]]
+    }
+}
+
+# 연속조회를 지원하는 도구에 공통으로 추가되는 파라미터
+pagination_annotations = {
+    "max_pages": {
+        "type": "integer",
+        "required": False,
+        "description": "연속조회로 가져올 최대 페이지 수 (1이면 한 페이지만 조회, 최대 50)",
+        "examples": [1, 5]
+    },
+    "max_rows": {
+        "type": "integer",
+        "required": False,
+        "description": "이 건수 이상 모이면 조회 중단 (0이면 제한 없음)",
+        "examples": [0, 500]
+    }
+}
+
+
+# 숫자형 컬럼 응답을 지원하는 도구에 공통으로 추가되는 파라미터
+columnar_annotations = {
+    "columnar": {
+        "type": "boolean",
+        "required": False,
+        "description": "True이면 output2를 필드별 숫자형 컬럼 배열로 변환하여 반환",
+        "examples": [False, True]
+    }
+}
 
 period_rights_annotations = {
     "rght_type_cd": {
@@ -49,7 +85,9 @@ period_rights_annotations = {
         "required": False,
         "description": "연속조회검색조건키50 (선택사항)",
         "examples": [""]
-    }
+    },
+    **pagination_annotations,
+    **fields_annotations
 }
 
 price_annotations = {
@@ -64,13 +102,38 @@ price_annotations = {
         "required": True,
         "description": "거래소코드",
         "examples": ["NAS", "NYS", "AMS"],
-        "enum": ["NYS:뉴욕", "NAS:나스닥", "AMS:아멕스", "HKS:홍콩", "SHS:상해", "SZS:심천", "HSX:호치민", "HNX:하노이", "TSE:도쿄"]
+        "enum": ["NYS:뉴욕", "NAS:나스닥", "AMS:아멕스", "HKS:홍콩", "SHS:상해", "SZS:심천", "SHI:상해지수", "SZI:심천지수", "HSX:호치민", "HNX:하노이", "TSE:도쿄", "BAY:뉴욕(주간)", "BAQ:나스닥(주간)", "BAA:아멕스(주간)"]
     },
     "symb": {
         "type": "string",
         "required": True,
         "description": "종목코드 (티커 심볼)",
         "examples": ["AAPL", "MSFT", "GOOGL", "TSLA"]
+    },
+    **fields_annotations
+}
+
+realtime_subscribe_annotations = {
+    "symbols": {
+        "type": "array",
+        "required": True,
+        "description": "종목 목록 (거래소코드:종목코드 형식)",
+        "examples": [["NAS:AAPL", "NAS:TSLA"]]
+    },
+    "quotes": {
+        "type": "boolean",
+        "required": False,
+        "description": "실시간호가(미국)도 함께 구독할지 여부",
+        "examples": [False, True]
+    }
+}
+
+realtime_unsubscribe_annotations = {
+    "symbols": {
+        "type": "array",
+        "required": True,
+        "description": "종목 목록 (거래소코드:종목코드 형식)",
+        "examples": [["NAS:AAPL"]]
     }
 }
 
@@ -129,7 +192,8 @@ brknews_title_annotations = {
         "required": False,
         "description": "입력일련번호 (선택사항)",
         "examples": [""]
-    }
+    },
+    **fields_annotations
 }
 
 inquire_ccnl_annotations = {
@@ -164,7 +228,9 @@ inquire_ccnl_annotations = {
         "required": False,
         "description": "NEXT KEY BUFF (선택사항)",
         "examples": [""]
-    }
+    },
+    **pagination_annotations,
+    **fields_annotations
 }
 
 price_detail_annotations = {
@@ -179,14 +245,37 @@ price_detail_annotations = {
         "required": True,
         "description": "거래소명",
         "examples": ["NYS", "NAS", "AMS"],
-        "enum": ["NYS:뉴욕", "NAS:나스닥", "AMS:아멕스", "HKS:홍콩", "SHS:상해", "SZS:심천", "HSX:호치민", "HNX:하노이", "TSE:도쿄"]
+        "enum": ["NYS:뉴욕", "NAS:나스닥", "AMS:아멕스", "HKS:홍콩", "SHS:상해", "SZS:심천", "SHI:상해지수", "SZI:심천지수", "HSX:호치민", "HNX:하노이", "TSE:도쿄", "BAY:뉴욕(주간)", "BAQ:나스닥(주간)", "BAA:아멕스(주간)"]
     },
     "symb": {
         "type": "string",
         "required": True,
         "description": "종목코드 (티커 심볼)",
         "examples": ["TSLA", "AAPL", "MSFT", "GOOGL"]
-    }
+    },
+    **fields_annotations
+}
+
+batch_price_annotations = {
+    "symbols": {
+        "type": "array",
+        "required": True,
+        "description": "종목 목록 (거래소코드:종목코드 형식)",
+        "examples": [["NAS:AAPL", "NAS:TSLA", "NYS:KO"]]
+    },
+    "detail": {
+        "type": "boolean",
+        "required": False,
+        "description": "현재가상세 조회 여부 (False: 현재체결가, True: 현재가상세)",
+        "examples": [False, True]
+    },
+    "auth": {
+        "type": "string",
+        "required": False,
+        "description": "사용자권한정보",
+        "examples": [""]
+    },
+    **fields_annotations
 }
 
 news_title_annotations = {
@@ -239,7 +328,9 @@ news_title_annotations = {
         "required": True,
         "description": "다음키 (연속조회용, 처음조회시 공백)",
         "examples": ["", "20241014120000001"]
-    }
+    },
+    **pagination_annotations,
+    **fields_annotations
 }
 
 inquire_time_itemchartprice_annotations = {
@@ -299,7 +390,56 @@ inquire_time_itemchartprice_annotations = {
         "required": True,
         "description": "NEXT KEY BUFF (처음조회시 공백, 다음조회시 YYYYMMDDHHMMSS 형식)",
         "examples": ["", "20241014140100"]
-    }
+    },
+    **pagination_annotations,
+    **columnar_annotations,
+    **fields_annotations
+}
+
+backfill_time_itemchartprice_annotations = {
+    "symbols": {
+        "type": "array",
+        "required": True,
+        "description": "종목 목록 (거래소코드:종목코드 형식)",
+        "examples": [["NAS:AAPL", "NAS:TSLA", "NYS:KO"]]
+    },
+    "start": {
+        "type": "string",
+        "required": True,
+        "description": "조회시작시각, 거래소 현지 시각 (YYYYMMDD, YYYYMMDDHHMM 또는 YYYYMMDDHHMMSS)",
+        "examples": ["20250106", "202501060930"]
+    },
+    "nmin": {
+        "type": "string",
+        "required": False,
+        "description": "분단위 (1: 1분봉, 2: 2분봉, 5: 5분봉 등)",
+        "examples": ["1", "5"]
+    },
+    "store": {
+        "type": "boolean",
+        "required": False,
+        "description": "확정된 분봉을 로컬 저장소에 저장할지 여부",
+        "examples": [False, True]
+    },
+    "include_rows": {
+        "type": "boolean",
+        "required": False,
+        "description": "분봉 데이터 반환 여부 (False이면 종목별 건수만 반환)",
+        "examples": [True, False]
+    },
+    "max_pages": {
+        "type": "integer",
+        "required": False,
+        "description": "종목당 최대 조회 페이지 수 (1페이지 최대 120건)",
+        "examples": [200, 50]
+    },
+    "auth": {
+        "type": "string",
+        "required": False,
+        "description": "사용자권한정보 (공백으로 입력)",
+        "examples": [""]
+    },
+    **fields_annotations
 }
 
 inquire_time_indexchartprice_annotations = {
@@ -329,7 +469,8 @@ inquire_time_indexchartprice_annotations = {
         "description": "과거 데이터 포함 여부",
         "examples": ["Y", "N"],
         "enum": ["Y:포함", "N:미포함"]
-    }
+    },
+    **fields_annotations
 }
 
 inquire_search_annotations = {
@@ -495,7 +636,9 @@ inquire_search_annotations = {
         "required": True,
         "description": "NEXT KEY BUFF (공백 입력)",
         "examples": [""]
-    }
+    },
+    **pagination_annotations,
+    **fields_annotations
 }
 
 search_info_annotations = {
@@ -511,7 +654,8 @@ search_info_annotations = {
         "required": True,
         "description": "상품번호 (종목코드/티커)",
         "examples": ["AAPL", "MSFT", "TSLA", "GOOGL"]
-    }
+    },
+    **fields_annotations
 }
 
 dailyprice_annotations = {
@@ -553,7 +697,9 @@ dailyprice_annotations = {
         "description": "수정주가반영여부",
         "examples": ["0", "1"],
         "enum": ["0:미반영", "1:반영"]
-    }
+    },
+    **columnar_annotations,
+    **fields_annotations
 }
 
 industry_theme_annotations = {
@@ -588,7 +734,9 @@ industry_theme_annotations = {
         "required": False,
         "description": "NEXT KEY BUFF (선택사항)",
         "examples": [""]
-    }
+    },
+    **pagination_annotations,
+    **fields_annotations
 }
 
 inquire_asking_price_annotations = {
@@ -610,7 +758,24 @@ inquire_asking_price_annotations = {
         "required": True,
         "description": "종목코드 (티커 심볼)",
         "examples": ["TSLA", "AAPL", "MSFT", "GOOGL"]
-    }
+    },
+    **fields_annotations
+}
+
+orderbook_summary_annotations = {
+    "symbols": {
+        "type": "array",
+        "required": True,
+        "description": "종목 목록 (거래소코드:종목코드 형식)",
+        "examples": [["NAS:AAPL", "NAS:TSLA"]]
+    },
+    "auth": {
+        "type": "string",
+        "required": False,
+        "description": "사용자권한정보",
+        "examples": [""]
+    },
+    **fields_annotations
 }
 
 quot_inquire_ccnl_annotations = {
@@ -645,7 +810,9 @@ quot_inquire_ccnl_annotations = {
         "required": False,
         "description": "NEXT KEY BUFF (선택사항)",
         "examples": [""]
-    }
+    },
+    **pagination_annotations,
+    **fields_annotations
 }
 
 inquire_daily_chartprice_annotations = {
@@ -680,7 +847,9 @@ inquire_daily_chartprice_annotations = {
         "description": "FID 기간 분류 코드",
         "examples": ["D", "W", "M", "Y"],
         "enum": ["D:일", "W:주", "M:월", "Y:년"]
-    }
+    },
+    **columnar_annotations,
+    **fields_annotations
 }
 
 industry_price_annotations = {
@@ -696,7 +865,8 @@ industry_price_annotations = {
         "required": False,
         "description": "사용자권한정보 (선택사항)",
         "examples": [""]
-    }
+    },
+    **fields_annotations
 }
 
 volume_surge_annotations = {
@@ -732,7 +902,10 @@ volume_surge_annotations = {
         "required": False,
         "description": "사용자권한정보 (선택사항)",
         "examples": [""]
-    }
+    },
+    **pagination_annotations,
+    **columnar_annotations,
+    **fields_annotations
 }
 
 volume_power_annotations = {
@@ -768,7 +941,10 @@ volume_power_annotations = {
         "required": False,
         "description": "NEXT KEY BUFF (선택사항)",
         "examples": [""]
-    }
+    },
+    **pagination_annotations,
+    **columnar_annotations,
+    **fields_annotations
 }
 
 updown_rate_annotations = {
@@ -811,7 +987,10 @@ updown_rate_annotations = {
         "required": False,
         "description": "NEXT KEY BUFF (선택사항)",
         "examples": [""]
-    }
+    },
+    **pagination_annotations,
+    **columnar_annotations,
+    **fields_annotations
 }
 
 trade_vol_annotations = {
@@ -859,7 +1038,10 @@ trade_vol_annotations = {
         "required": False,
         "description": "가격 필터 종료 (선택사항)",
         "examples": [""]
-    }
+    },
+    **pagination_annotations,
+    **columnar_annotations,
+    **fields_annotations
 }
 
 trade_turnover_annotations = {
@@ -895,7 +1077,10 @@ trade_turnover_annotations = {
         "required": False,
         "description": "사용자권한정보",
         "examples": [""]
-    }
+    },
+    **pagination_annotations,
+    **columnar_annotations,
+    **fields_annotations
 }
 
 trade_pbmn_annotations = {
@@ -943,7 +1128,10 @@ trade_pbmn_annotations = {
         "required": False,
         "description": "현재가 필터범위 끝",
         "examples": [""]
-    }
+    },
+    **pagination_annotations,
+    **columnar_annotations,
+    **fields_annotations
 }
 
 trade_growth_annotations = {
@@ -979,7 +1167,10 @@ trade_growth_annotations = {
         "required": False,
         "description": "NEXT KEY BUFF",
         "examples": [""]
-    }
+    },
+    **pagination_annotations,
+    **columnar_annotations,
+    **fields_annotations
 }
 
 price_fluct_annotations = {
@@ -1022,7 +1213,10 @@ price_fluct_annotations = {
         "required": False,
         "description": "사용자권한정보",
         "examples": [""]
-    }
+    },
+    **pagination_annotations,
+    **columnar_annotations,
+    **fields_annotations
 }
 
 new_highlow_annotations = {
@@ -1072,7 +1266,10 @@ new_highlow_annotations = {
         "required": False,
         "description": "사용자권한정보",
         "examples": [""]
-    }
+    },
+    **pagination_annotations,
+    **columnar_annotations,
+    **fields_annotations
 }
 
 market_cap_annotations = {
@@ -1101,5 +1298,8 @@ market_cap_annotations = {
         "required": False,
         "description": "사용자권한정보 (선택사항)",
         "examples": [""]
-    }
+    },
+    **pagination_annotations,
+    **columnar_annotations,
+    **fields_annotations
 }
@@ -0,0 +1,113 @@
+import asyncio
+from typing import Awaitable, Callable, NamedTuple, Optional
+
+from pagination import MINUTE_BAR_SCHEME, NEXT_PAGE, Fetch
+from resilience import KisApiError
+
+# 종목 하나를 채우기 위해 보낼 최대 요청 수 (1분봉 120건 x 200 = 약 2주치 확장시간 포함)
+MAX_BACKFILL_PAGES = 200
+# 동시에 채우는 종목 수 (실제 요청 속도는 rate limiter가 제한)
+DEFAULT_CONCURRENCY = 8
+
+
+def bar_stamp(row: dict) -> str:
+    """Timestamp of a minute bar (YYYYMMDDHHMMSS, exchange local time)"""
+    return row.get("xymd", "") + row.get("xhms", "")
+
+
+class Backfill(NamedTuple):
+    """Stitched minute-bar series of one symbol"""
+    excd: str
+    symb: str
+    rows: list[dict]  # newest first, one row per timestamp
+    pages: int
+    complete: bool  # True if the series reached start (or the first listed bar)
+    error: Optional[str] = None
+
+
+async def backfill_symbol(fetch: Fetch, params: dict, start: str, max_pages: int = MAX_BACKFILL_PAGES) -> Backfill:
+    """
+    Walk KEYB backwards from the latest bar until start
+
+    다음 페이지의 KEYB는 이전 페이지의 가장 오래된 분봉 시각에서 NMIN분을 뺀 값이며,
+    페이지 경계에서 겹치는 분봉은 시각 기준으로 한 번만 남깁니다.
+
+    Args:
+        fetch: Coroutine function sending one 해외주식분봉조회 request
+        params: Parameters of the first page (uppercase keys)
+        start: Oldest timestamp to collect (YYYYMMDDHHMMSS)
+        max_pages: Maximum number of requests for this symbol
+
+    Returns:
+        Backfill: Bars at or after start, newest first
+    """
+    bars: dict[str, dict] = {}
+    pages = 0
+    complete = False
+    tr_cont = ""
+    error = None
+    try:
+        while pages < max_pages:
+            body, response_tr_cont = await fetch(params, tr_cont)
+            pages += 1
+            rows = body.get("output2") or []
+            for row in rows:
+                stamp = bar_stamp(row)
+                if len(stamp) == 14 and stamp >= start:
+                    bars.setdefault(stamp, row)
+            stamps = [bar_stamp(row) for row in rows]
+            if any(stamp < start for stamp in stamps if stamp):
+                complete = True
+                break
+            next_params = MINUTE_BAR_SCHEME.next_params(params, body, response_tr_cont)
+            if next_params is None:
+                # 더 이전 데이터가 없음
+                complete = True
+                break
+            params = next_params
+            tr_cont = NEXT_PAGE
+    except KisApiError as e:
+        error = str(e)
+
+    rows = [bars[stamp] for stamp in sorted(bars, reverse=True)]
+    return Backfill(params["EXCD"], params["SYMB"], rows, pages, complete, error)
+
+
+async def backfill_many(
+    fetch: Fetch,
+    requests: list[dict],
+    start: str,
+    max_pages: int = MAX_BACKFILL_PAGES,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    on_done: Optional[Callable[[Backfill], Awaitable[None]]] = None,
+) -> list[Backfill]:
+    """
+    Backfill several symbols concurrently
+
+    Args:
+        fetch: Coroutine function sending one 해외주식분봉조회 request
+        requests: First-page parameters of each symbol
+        start: Oldest timestamp to collect (YYYYMMDDHHMMSS)
+        max_pages: Maximum number of requests per symbol
+        concurrency: Number of symbols walked at the same time
+        on_done: Coroutine function called with each finished series (e.g. to store it)
+
+    Returns:
+        list[Backfill]: One result per request, in request order (an on_done failure is reported in
+            that symbol's error, like a fetch error)
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(params: dict) -> Backfill:
+        async with semaphore:
+            result = await backfill_symbol(fetch, params, start, max_pages)
+        if on_done is not None:
+            try:
+                await on_done(result)
+            except Exception as e:
+                # 한 종목의 저장 실패(SQLite 오류 등)로 다른 종목의 결과까지 잃지 않도록 종목별로 보고
+                error = f"{type(e).__name__}: {e}"
+                result = result._replace(error=f"{result.error}; {error}" if result.error else error)
+        return result
+
+    return await asyncio.gather(*(run(params) for params in requests))
@@ -0,0 +1,397 @@
+import asyncio
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional
+
+if TYPE_CHECKING:
+    import sqlite3
+
+logger = logging.getLogger("mcp-server")
+
+# KIS 일봉 API가 한 번에 반환하는 최대 건수
+PAGE_SIZE = 100
+# 한 번의 도구 호출에서 빈 구간을 채우기 위해 보낼 최대 요청 수
+MAX_GAP_FETCHES = 10
+# 이보다 앞선 데이터가 없음을 나타내는 구간 시작값
+SERIES_START = "00000000"
+
+LOCAL_MSG = "로컬 저장소에서 조회되었습니다"
+
+# 로컬 응답의 output1에 다시 쓸 수 있는 필드 (저장 시점의 시세가 아닌 종목 정보)
+STATIC_OUTPUT1 = {
+    "dailyprice": ("rsym", "zdiv"),
+    "chartprice": ("hts_kor_isnm", "stck_shrn_iscd"),
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS bars (
+    source TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    excd TEXT NOT NULL,
+    period TEXT NOT NULL,
+    modp TEXT NOT NULL,
+    date TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (source, symbol, excd, period, modp, date)
+);
+CREATE TABLE IF NOT EXISTS coverage (
+    source TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    excd TEXT NOT NULL,
+    period TEXT NOT NULL,
+    modp TEXT NOT NULL,
+    start TEXT NOT NULL,
+    end TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS coverage_series ON coverage (source, symbol, excd, period, modp);
+CREATE TABLE IF NOT EXISTS meta (
+    source TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    excd TEXT NOT NULL,
+    period TEXT NOT NULL,
+    modp TEXT NOT NULL,
+    output1 TEXT NOT NULL,
+    PRIMARY KEY (source, symbol, excd, period, modp)
+);
+"""
+
+Fetch = Callable[[dict], Awaitable[dict]]
+Series = tuple[str, str, str, str, str]  # (source, symbol, excd, period, modp)
+
+
+def last_closed_date() -> str:
+    """
+    Latest date whose daily bar is final (YYYYMMDD)
+
+    모든 거래소의 장 마감과 KIS의 일봉 확정 지연을 감안해 UTC 기준 이틀 전까지만 확정으로 봅니다.
+    """
+    return (datetime.now(timezone.utc) - timedelta(days=2)).strftime("%Y%m%d")
+
+
+def _shift(date: str, days: int) -> str:
+    return (datetime.strptime(date, "%Y%m%d") + timedelta(days=days)).strftime("%Y%m%d")
+
+
+def _is_date(value) -> bool:
+    return isinstance(value, str) and len(value) == 8 and value.isdigit()
+
+
+class BarStore:
+    """
+    SQLite store for closed historical bars
+
+    - 확정된 날짜의 일봉만 (symbol, excd, period, modp) 단위로 저장
+    - 조회한 날짜 구간(coverage)을 함께 기록하여 휴장일과 미조회 구간을 구분
+      (일봉이 하나도 없는 종목의 빈 응답은 기록하지 않아 다음 조회 때 KIS에 다시 요청)
+    - 로컬 응답의 output1에는 종목 정보만 담고 저장 시점의 시세는 돌려주지 않음
+    - 저장된 구간은 로컬에서 응답하고 빠진 구간만 KIS에 요청
+    - SQLite 작업은 asyncio.to_thread로 이벤트 루프 밖에서 수행
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._conn: Optional["sqlite3.Connection"] = None
+        self._lock = threading.Lock()
+        self.local_hits = 0
+        self.upstream_fetches = 0
+        self.minute_bars_stored = 0
+
+    @classmethod
+    def from_env(cls, default_path: Path) -> Optional["BarStore"]:
+        """
+        Environment:
+            KIS_BAR_STORE: SQLite 파일 경로, "off"이면 비활성화 (default: default_path)
+        """
+        path = os.environ.get("KIS_BAR_STORE", str(default_path))
+        if path.lower() in ("off", "false", "0", ""):
+            return None
+        return cls(Path(path))
+
+    def _connection(self) -> "sqlite3.Connection":
+        if self._conn is None:
+            # sqlite3는 분봉 저장소를 처음 사용할 때 불러옴 (서버 시작 시간 단축)
+            import sqlite3
+
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.executescript(SCHEMA)
+        return self._conn
+
+    async def _run(self, fn, *args):
+        def locked():
+            with self._lock:
+                return fn(*args)
+        return await asyncio.to_thread(locked)
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # --- synchronous storage primitives (called on a worker thread) ---
+
+    def _coverage(self, series: Series) -> list[tuple[str, str]]:
+        rows = self._connection().execute(
+            "SELECT start, end FROM coverage WHERE source=? AND symbol=? AND excd=? AND period=? AND modp=? "
+            "ORDER BY start",
+            series,
+        ).fetchall()
+        return [(start, end) for start, end in rows]
+
+    def _covering(self, series: Series, date: str) -> Optional[tuple[str, str]]:
+        for start, end in self._coverage(series):
+            if start <= date <= end:
+                return start, end
+        return None
+
+    def _missing(self, series: Series, start: str, end: str) -> list[tuple[str, str]]:
+        gaps = []
+        cursor = start
+        for cov_start, cov_end in self._coverage(series):
+            if cov_end < cursor:
+                continue
+            if cov_start > end:
+                break
+            if cov_start > cursor:
+                gaps.append((cursor, _shift(cov_start, -1)))
+            cursor = max(cursor, _shift(cov_end, 1))
+            if cursor > end:
+                break
+        if cursor <= end:
+            gaps.append((cursor, end))
+        return gaps
+
+    def _put(self, series: Series, rows: list[dict], date_field: str, start: str, end: str,
+             output1: Optional[dict]):
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO bars VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(*series, row[date_field], json.dumps(row, ensure_ascii=False)) for row in rows],
+            )
+            if output1:
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta VALUES (?, ?, ?, ?, ?, ?)",
+                    (*series, json.dumps(output1, ensure_ascii=False)),
+                )
+            if start > end:
+                return
+            # 겹치거나 맞닿은 구간을 하나로 병합
+            merged_start, merged_end = start, end
+            for cov_start, cov_end in self._coverage(series):
+                if cov_start <= _shift(merged_end, 1) and _shift(cov_end, 1) >= merged_start:
+                    merged_start = min(merged_start, cov_start)
+                    merged_end = max(merged_end, cov_end)
+                    conn.execute(
+                        "DELETE FROM coverage WHERE source=? AND symbol=? AND excd=? AND period=? AND modp=? "
+                        "AND start=? AND end=?",
+                        (*series, cov_start, cov_end),
+                    )
+            conn.execute("INSERT INTO coverage VALUES (?, ?, ?, ?, ?, ?, ?)", (*series, merged_start, merged_end))
+
+    def _bars(self, series: Series, start: str, end: str, limit: int = -1) -> list[dict]:
+        rows = self._connection().execute(
+            "SELECT data FROM bars WHERE source=? AND symbol=? AND excd=? AND period=? AND modp=? "
+            "AND date BETWEEN ? AND ? ORDER BY date DESC LIMIT ?",
+            (*series, start, end, limit),
+        ).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def _has_bars(self, series: Series) -> bool:
+        row = self._connection().execute(
+            "SELECT 1 FROM bars WHERE source=? AND symbol=? AND excd=? AND period=? AND modp=? LIMIT 1",
+            series,
+        ).fetchone()
+        return row is not None
+
+    def _meta(self, series: Series) -> dict:
+        row = self._connection().execute(
+            "SELECT output1 FROM meta WHERE source=? AND symbol=? AND excd=? AND period=? AND modp=?",
+            series,
+        ).fetchone()
+        if not row:
+            return {}
+        # 현재가, 전일대비 등 저장 시점의 시세는 제외
+        output1 = json.loads(row[0])
+        return {field: output1[field] for field in STATIC_OUTPUT1.get(series[0], ()) if field in output1}
+
+    def _local_response(self, series: Series, output2: list[dict], output1: Optional[dict] = None,
+                        msg1: str = LOCAL_MSG) -> dict:
+        return {
+            "rt_cd": "0",
+            "msg_cd": "",
+            "msg1": msg1,
+            "output1": output1 if output1 is not None else self._meta(series),
+            "output2": output2,
+        }
+
+    # --- dailyprice (해외주식 기간별시세) ---
+
+    def _serve_dailyprice(self, series: Series, bymd: str) -> Optional[dict]:
+        covered = self._covering(series, bymd)
+        if covered is None:
+            return None
+        bars = self._bars(series, covered[0], bymd, PAGE_SIZE)
+        if len(bars) < PAGE_SIZE and covered[0] != SERIES_START:
+            return None
+        return self._local_response(series, bars, {**self._meta(series), "nrec": str(len(bars))})
+
+    def _store_dailyprice(self, series: Series, bymd: str, body: dict, last_closed: str):
+        rows = [row for row in body.get("output2") or [] if _is_date(row.get("xymd"))]
+        if not rows:
+            return
+        end = min(bymd or last_closed, last_closed)
+        # 요청 건수보다 적게 왔다면 상장 이후 전체 구간을 받은 것
+        start = SERIES_START if len(rows) < PAGE_SIZE else min(row["xymd"] for row in rows)
+        closed = [row for row in rows if row["xymd"] <= last_closed]
+        self._put(series, closed, "xymd", start, end, body.get("output1"))
+
+    async def dailyprice(self, params: dict, fetch: Fetch) -> dict:
+        """
+        Serve 해외주식 기간별시세 from the store when the requested window is known
+
+        일봉(GUBN=0)이면서 조회기준일자(BYMD)가 확정된 날짜일 때만 로컬에서 응답합니다.
+        그 외에는 KIS에 요청하고 확정된 일봉을 저장합니다.
+
+        Args:
+            params: Request parameters of the dailyprice API (uppercase keys)
+            fetch: Coroutine function sending the request to KIS
+
+        Returns:
+            dict: KIS-shaped response
+        """
+        if params.get("GUBN") != "0":
+            return await fetch(params)
+
+        series = ("dailyprice", params["SYMB"], params["EXCD"], "D", params.get("MODP", ""))
+        bymd = params.get("BYMD", "")
+        last_closed = last_closed_date()
+        if bymd and bymd <= last_closed:
+            local = await self._run(self._serve_dailyprice, series, bymd)
+            if local is not None:
+                self.local_hits += 1
+                return local
+
+        self.upstream_fetches += 1
+        body = await fetch(params)
+        await self._run(self._store_dailyprice, series, bymd, body, last_closed)
+        return body
+
+    # --- inquire-daily-chartprice (종목/지수/환율 기간별시세) ---
+
+    def _store_chartprice(self, series: Series, start: str, end: str, body: dict, last_closed: str) -> list[dict]:
+        rows = [row for row in body.get("output2") or [] if _is_date(row.get("stck_bsop_date"))]
+        # 잘못된 종목/거래소도 rt_cd "0"과 빈 output2로 응답하므로, 저장된 일봉이 없는 종목의 빈 응답은
+        # 조회 구간으로 기록하지 않음 (일봉이 있는 종목의 빈 구간은 휴장일)
+        if not rows and not self._has_bars(series):
+            return rows
+        # 한 번에 PAGE_SIZE 건을 받았다면 start 쪽 일부가 잘렸을 수 있음
+        if len(rows) >= PAGE_SIZE:
+            start = min(row["stck_bsop_date"] for row in rows)
+        closed = [row for row in rows if row["stck_bsop_date"] <= last_closed]
+        self._put(series, closed, "stck_bsop_date", start, min(end, last_closed), body.get("output1"))
+        return rows
+
+    async def daily_chartprice(self, params: dict, fetch: Fetch) -> dict:
+        """
+        Serve 해외주식 종목_지수_환율기간별시세 from the store, fetching only missing days
+
+        일봉(FID_PERIOD_DIV_CODE=D)만 저장합니다. 확정된 날짜 구간 중 저장되지 않은 부분과
+        아직 확정되지 않은 최근 구간만 KIS에 요청합니다.
+
+        Args:
+            params: Request parameters of the inquire-daily-chartprice API (uppercase keys)
+            fetch: Coroutine function sending the request to KIS
+
+        Returns:
+            dict: KIS-shaped response with every bar in the requested range (newest first)
+        """
+        start, end = params.get("FID_INPUT_DATE_1", ""), params.get("FID_INPUT_DATE_2", "")
+        if params.get("FID_PERIOD_DIV_CODE") != "D" or not (_is_date(start) and _is_date(end)) or start > end:
+            return await fetch(params)
+
+        series = ("chartprice", params["FID_INPUT_ISCD"], params["FID_COND_MRKT_DIV_CODE"], "D", "")
+        last_closed = last_closed_date()
+        closed_end = min(end, last_closed)
+        output1 = None
+        fetches = 0
+
+        if start <= closed_end:
+            gaps = await self._run(self._missing, series, start, closed_end)
+            for gap_start, gap_end in gaps:
+                cursor = gap_end
+                while cursor >= gap_start and fetches < MAX_GAP_FETCHES:
+                    fetches += 1
+                    body = await fetch({**params, "FID_INPUT_DATE_1": gap_start, "FID_INPUT_DATE_2": cursor})
+                    output1 = body.get("output1")
+                    rows = await self._run(self._store_chartprice, series, gap_start, cursor, body, last_closed)
+                    if len(rows) < PAGE_SIZE:
+                        break
+                    cursor = _shift(min(row["stck_bsop_date"] for row in rows), -1)
+
+        recent = []
+        if end > last_closed:
+            fetches += 1
+            body = await fetch({**params, "FID_INPUT_DATE_1": max(start, _shift(last_closed, 1))})
+            output1 = body.get("output1")
+            recent = [row for row in body.get("output2") or [] if _is_date(row.get("stck_bsop_date"))]
+
+        if fetches:
+            self.upstream_fetches += fetches
+        else:
+            self.local_hits += 1
+
+        def assemble():
+            msg1 = LOCAL_MSG
+            bars = []
+            if start <= closed_end:
+                bars = self._bars(series, start, closed_end)
+                if fetches >= MAX_GAP_FETCHES and self._missing(series, start, closed_end):
+                    msg1 = f"요청 수 제한({MAX_GAP_FETCHES}회)으로 일부 구간이 누락되었습니다. 기간을 나누어 다시 조회하세요"
+            return self._local_response(series, recent + bars, output1, msg1)
+
+        return await self._run(assemble)
+
+    # --- inquire-time-itemchartprice (해외주식분봉조회) ---
+
+    def _store_minute_bars(self, series: Series, rows: list[dict]):
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO bars VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(*series, row["xymd"] + row["xhms"], json.dumps(row, ensure_ascii=False)) for row in rows],
+            )
+
+    async def store_minute_bars(self, excd: str, symb: str, nmin: str, rows: list[dict]) -> int:
+        """
+        Save backfilled minute bars
+
+        date 컬럼에 거래소 현지 시각(YYYYMMDDHHMMSS)을, period에 "{nmin}m"을 저장합니다.
+        가장 최근 분봉은 아직 진행 중일 수 있어 저장하지 않습니다.
+
+        Args:
+            excd: 거래소코드
+            symb: 종목코드
+            nmin: 분간격
+            rows: output2 rows, newest first
+
+        Returns:
+            int: Number of bars written
+        """
+        closed = [row for row in rows[1:] if _is_date(row.get("xymd")) and len(row.get("xhms", "")) == 6]
+        if closed:
+            await self._run(self._store_minute_bars, ("itemchart", symb, excd, f"{nmin}m", ""), closed)
+            self.minute_bars_stored += len(closed)
+        return len(closed)
+
+    def stats(self) -> dict:
+        return {
+            "path": str(self.path),
+            "local_hits": self.local_hits,
+            "upstream_fetches": self.upstream_fetches,
+            "minute_bars_stored": self.minute_bars_stored,
+        }
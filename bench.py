@@ -0,0 +1,232 @@
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Awaitable, Callable, NamedTuple, Optional, Union
+
+# 벤치마크는 로컬 KIS 대체 서버를 사용하므로 요청 제한/캐시/분봉 저장을 끄고 시작
+os.environ.setdefault("KIS_APP_KEY", "bench-appkey")
+os.environ.setdefault("KIS_APP_SECRET", "bench-appsecret")
+os.environ.setdefault("KIS_RATE_LIMIT", "1000000")
+os.environ.setdefault("KIS_RATE_BURST", "1000000")
+os.environ.setdefault("KIS_CACHE", "false")
+os.environ.setdefault("KIS_BAR_STORE", "off")
+
+import codec
+import server
+from fake_kis import FakeKis
+from fields import project
+from http_pool import get_pool
+
+# 각 측정의 최소 실행 시간 (초)와 반복 횟수
+DEFAULT_MIN_TIME = 0.2
+DEFAULT_REPEAT = 5
+# 기준값 대비 이 비율 이상 느려지면 회귀로 판단
+DEFAULT_THRESHOLD = 1.25
+
+QUOTATIONS = "/uapi/overseas-price/v1/quotations"
+RANKING = "/uapi/overseas-stock/v1/ranking"
+
+Stage = Union[Callable[[], object], Callable[[], Awaitable[object]]]
+
+
+class Result(NamedTuple):
+    median_ns: float  # 1회 실행 시간 중앙값 (나노초)
+    min_ns: float  # 1회 실행 시간 최소값 (나노초)
+    number: int  # 반복 측정 1회당 실행 횟수
+
+
+async def measure(stage: Stage, is_async: bool, min_time: float, repeat: int) -> Result:
+    """
+    Time a stage like timeit: calibrate a loop count filling min_time, then repeat it
+
+    Args:
+        stage: Function (or coroutine function) running the stage once
+        is_async: True if stage returns an awaitable
+        min_time: Minimum seconds per timed loop
+        repeat: Number of timed loops
+
+    Returns:
+        Result: Per-call timings
+    """
+    async def loop(number: int) -> int:
+        started = time.perf_counter_ns()
+        if is_async:
+            for _ in range(number):
+                await stage()
+        else:
+            for _ in range(number):
+                stage()
+        return time.perf_counter_ns() - started
+
+    number = 1
+    while True:
+        elapsed = await loop(number)
+        if elapsed >= min_time * 1e9 or number >= 1 << 24:
+            break
+        number = max(number * 2, int(number * min_time * 1e9 / max(elapsed, 1)))
+    timings = [await loop(number) / number for _ in range(repeat)]
+    return Result(statistics.median(timings), min(timings), number)
+
+
+class Bench:
+    """Hot-path stages of a tool call, run against an in-process FakeKis"""
+
+    def __init__(self):
+        self.fake = FakeKis()
+        self._tmp = tempfile.TemporaryDirectory()
+        # 벤치마크가 token.json을 덮어쓰지 않도록 임시 파일 사용 (FakeKis에서 발급받아 저장됨)
+        server.TOKEN_FILE = Path(self._tmp.name) / "token.json"
+        get_pool().mount(self.fake.transport())
+        self.payloads: dict[str, bytes] = {}
+        self.stages: dict[str, tuple[Stage, bool]] = {}
+
+    async def setup(self):
+        token = await server.get_access_token()
+        domain = server.TrIdManager.get_domain("buy")
+        client = get_pool().get_client(domain)
+        for name, path, tr_id, params in (
+            ("price", f"{QUOTATIONS}/price", "HHDFS00000300", {"AUTH": "", "EXCD": "NAS", "SYMB": "AAPL"}),
+            ("dailyprice", f"{QUOTATIONS}/dailyprice", "HHDFS76240000",
+             {"AUTH": "", "EXCD": "NAS", "SYMB": "AAPL", "GUBN": "0", "BYMD": "", "MODP": "1"}),
+            ("trade_vol", f"{RANKING}/trade-vol", "HHDFS76310010",
+             {"AUTH": "", "EXCD": "NAS", "NDAY": "0", "VOL_RANG": "0", "KEYB": ""}),
+        ):
+            response = await client.get(path, headers=server.api_headers(token, tr_id), params=params)
+            self.payloads[name] = response.content
+
+        price_params = {"AUTH": "", "EXCD": "NAS", "SYMB": "AAPL"}
+        price_url = f"{QUOTATIONS}/price"
+        price_body = codec.loads_response(self.payloads["price"])
+        daily_body = codec.loads_response(self.payloads["dailyprice"])
+        ranking_body = codec.loads_response(self.payloads["trade_vol"])
+
+        def sync(name: str, stage: Callable[[], object]):
+            self.stages[name] = (stage, False)
+
+        def coroutine(name: str, stage: Callable[[], Awaitable[object]]):
+            self.stages[name] = (stage, True)
+
+        sync("load_token", server.load_token)
+        coroutine("token_manager.get_token", server.get_access_token)
+        sync("get_domain", lambda: server.TrIdManager.get_domain("buy"))
+        sync("pool.get_client", lambda: get_pool().get_client(domain))
+        sync("api_headers", lambda: server.api_headers(token, "HHDFS00000300"))
+        coroutine("rate_limiter.acquire", lambda: server.rate_limiter.acquire(os.environ["KIS_APP_KEY"], "HHDFS00000300"))
+        for name, payload in self.payloads.items():
+            sync(f"loads.{name} ({len(payload)}B)", lambda payload=payload: codec.loads_response(payload))
+        sync("dumps.price (raw passthrough)", lambda: codec.dumps(price_body))
+        sync("dumps.dailyprice (re-encode)", lambda: codec.dumps(dict(daily_body)))
+        sync("dumps.trade_vol (re-encode)", lambda: codec.dumps(dict(ranking_body)))
+        sync("project.trade_vol", lambda: project(ranking_body, ["symb", "last", "rate", "tvol"]))
+        coroutine("http.get price (fake)", lambda: client.get(
+            price_url, headers=server.api_headers(token, "HHDFS00000300"), params=price_params))
+        coroutine("send_api_request price", lambda: server.send_api_request(domain, price_url, "HHDFS00000300", price_params))
+        coroutine("make_api_request price", lambda: server.make_api_request(price_url, "HHDFS00000300", price_params))
+
+        async def cached_request():
+            server.response_cache.enabled = True
+            try:
+                return await server.make_api_request(price_url, "HHDFS00000300", price_params)
+            finally:
+                server.response_cache.enabled = False
+
+        coroutine("make_api_request price (cache hit)", cached_request)
+        coroutine("tool price", lambda: server.mcp.call_tool("price", {"auth": "", "excd": "NAS", "symb": "AAPL"}))
+        coroutine("tool dailyprice", lambda: server.mcp.call_tool(
+            "dailyprice", {"auth": "", "excd": "NAS", "symb": "AAPL", "gubn": "0", "bymd": "", "modp": "1"}))
+        coroutine("tool trade_vol", lambda: server.mcp.call_tool("trade-vol", {"excd": "NAS", "nday": "0", "vol_rang": "0"}))
+
+    async def run(self, pattern: str = "", min_time: float = DEFAULT_MIN_TIME, repeat: int = DEFAULT_REPEAT) -> dict:
+        """
+        Returns:
+            dict: {"meta": ..., "results": {stage: Result as dict}}
+        """
+        results = {}
+        async with server.lifespan(server.mcp):
+            await self.setup()
+            for name, (stage, is_async) in self.stages.items():
+                if pattern and pattern not in name:
+                    continue
+                result = await measure(stage, is_async, min_time, repeat)
+                results[name] = result._asdict()
+                print(f"{name:45s} {format_ns(result.median_ns):>10s}  (min {format_ns(result.min_ns)}, n={result.number})",
+                      file=sys.stderr)
+        self._tmp.cleanup()
+        return {
+            "meta": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "json": codec.BACKEND,
+                "created_at": datetime.now().isoformat(timespec="seconds"),
+            },
+            "results": results,
+        }
+
+
+def format_ns(ns: float) -> str:
+    if ns >= 1e6:
+        return f"{ns / 1e6:.2f}ms"
+    if ns >= 1e3:
+        return f"{ns / 1e3:.2f}us"
+    return f"{ns:.0f}ns"
+
+
+def compare(current: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> list[str]:
+    """
+    Compare median timings with a saved baseline
+
+    Args:
+        current: Output of Bench.run
+        baseline: Saved output of an earlier run
+        threshold: Ratio (current / baseline) above which a stage counts as a regression
+
+    Returns:
+        list[str]: Names of regressed stages
+    """
+    regressions = []
+    print(f"\n{'stage':45s} {'baseline':>10s} {'current':>10s} {'ratio':>7s}", file=sys.stderr)
+    for name, result in current["results"].items():
+        before: Optional[dict] = baseline["results"].get(name)
+        if before is None:
+            print(f"{name:45s} {'-':>10s} {format_ns(result['median_ns']):>10s}", file=sys.stderr)
+            continue
+        ratio = result["median_ns"] / before["median_ns"]
+        flag = "  REGRESSION" if ratio > threshold else ""
+        print(f"{name:45s} {format_ns(before['median_ns']):>10s} {format_ns(result['median_ns']):>10s} {ratio:6.2f}x{flag}",
+              file=sys.stderr)
+        if ratio > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-benchmarks of the KIS request hot path")
+    parser.add_argument("-k", "--filter", default="", help="이 문자열을 포함하는 단계만 측정")
+    parser.add_argument("-o", "--output", help="결과를 저장할 JSON 파일")
+    parser.add_argument("-b", "--baseline", help="비교할 기준 결과 JSON 파일")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="회귀로 판단할 배율 (default: 1.25)")
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME, help="측정 1회의 최소 시간(초)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="측정 반복 횟수")
+    args = parser.parse_args()
+
+    current = asyncio.run(Bench().run(args.filter, args.min_time, args.repeat))
+    if args.output:
+        Path(args.output).write_text(json.dumps(current, indent=2))
+    if args.baseline:
+        regressions = compare(current, json.loads(Path(args.baseline).read_text()), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} stage(s) slower than {args.threshold}x baseline: {', '.join(regressions)}",
+                  file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import json
+import logging
+import os
+from typing import Any
+
+logger = logging.getLogger("mcp-server")
+
+try:
+    import orjson
+except ImportError:  # orjson은 선택 의존성 (pip install -e ".[fast]")
+    orjson = None
+
+# KIS_JSON=stdlib이면 orjson이 설치되어 있어도 표준 json 사용
+BACKEND = "orjson" if orjson is not None and os.environ.get("KIS_JSON", "").lower() != "stdlib" else "json"
+
+
+class RawResponse(dict):
+    """
+    Decoded KIS response that keeps the bytes it was decoded from
+
+    도구가 응답을 변환하지 않고 그대로 반환하면 다시 인코딩하지 않고 원본 bytes를 사용합니다.
+    필드 선택, 페이지 병합 등으로 만든 응답은 일반 dict이므로 새로 인코딩됩니다.
+    """
+
+    __slots__ = ("raw",)
+
+    def __init__(self, body: dict, raw: bytes):
+        super().__init__(body)
+        self.raw = raw
+
+
+def loads(data: bytes) -> Any:
+    """
+    Decode JSON straight from response bytes
+
+    Raises:
+        ValueError: If data is not valid JSON
+    """
+    if BACKEND == "orjson":
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def loads_response(data: bytes) -> Any:
+    """
+    Decode a KIS response body, keeping the raw bytes when it is a JSON object
+
+    Raises:
+        ValueError: If data is not valid JSON
+    """
+    body = loads(data)
+    return RawResponse(body, data) if isinstance(body, dict) else body
+
+
+def dumps(value: Any) -> str:
+    """
+    Encode a tool result as compact JSON text
+
+    RawResponse는 원본 bytes를 그대로 사용합니다.
+    """
+    if isinstance(value, RawResponse):
+        return value.raw.decode()
+    if BACKEND == "orjson":
+        return orjson.dumps(value, default=str).decode()
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
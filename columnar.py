@@ -0,0 +1,105 @@
+import math
+from array import array
+from typing import Union
+
+# 컬럼 타입: array typecode
+FLOAT = "d"
+INT = "q"
+TYPE_NAMES = {FLOAT: "float", INT: "int", None: "str"}
+
+Column = Union[array, list]
+
+# 엔드포인트별 숫자 필드 스키마 (목록에 없는 필드는 문자열 컬럼)
+DAILYPRICE_SCHEMA = {
+    "clos": FLOAT, "diff": FLOAT, "rate": FLOAT, "open": FLOAT, "high": FLOAT, "low": FLOAT,
+    "tvol": INT, "tamt": FLOAT, "pbid": FLOAT, "vbid": INT, "pask": FLOAT, "vask": INT,
+}
+DAILY_CHARTPRICE_SCHEMA = {
+    "ovrs_nmix_prpr": FLOAT, "ovrs_nmix_oprc": FLOAT, "ovrs_nmix_hgpr": FLOAT, "ovrs_nmix_lwpr": FLOAT,
+    "acml_vol": INT,
+}
+TIME_ITEMCHARTPRICE_SCHEMA = {
+    "open": FLOAT, "high": FLOAT, "low": FLOAT, "last": FLOAT, "evol": INT, "eamt": FLOAT,
+}
+RANKING_SCHEMA = {
+    "last": FLOAT, "diff": FLOAT, "rate": FLOAT, "pask": FLOAT, "pbid": FLOAT,
+    "tvol": INT, "tamt": FLOAT, "a_tvol": INT, "a_tamt": FLOAT,
+    "n_base": FLOAT, "n_diff": FLOAT, "n_rate": FLOAT, "n_tvol": INT,
+    "tpow": FLOAT, "powx": FLOAT, "shar": INT, "tover": FLOAT,
+    "mcap": FLOAT, "tomv": FLOAT, "grav": FLOAT, "valx": FLOAT, "rank": INT,
+}
+
+
+def _column(values: list[str], typecode: str) -> Column:
+    # 정수 컬럼에 빈 값이나 소수가 있으면 실수 컬럼으로, 숫자가 아닌 값이 있으면 원본 유지
+    for code in (INT, FLOAT) if typecode == INT else (FLOAT,):
+        try:
+            return array(code, (
+                (int(value) if code == INT else float(value)) if value != "" else math.nan
+                for value in values
+            ))
+        except (TypeError, ValueError):
+            continue
+    return values
+
+
+def to_columns(rows: list[dict], schema: dict[str, str]) -> dict[str, Column]:
+    """
+    Transpose rows of string fields into typed columns
+
+    숫자 필드는 array('d'/'q')에 담고, 빈 값은 NaN으로 처리합니다.
+
+    Args:
+        rows: Rows of a KIS list output
+        schema: Field -> array typecode of numeric fields
+
+    Returns:
+        dict[str, Column]: Field -> column, in first-seen field order
+    """
+    fields: dict[str, None] = {}
+    for row in rows:
+        fields.update(dict.fromkeys(row))
+
+    columns: dict[str, Column] = {}
+    for field in fields:
+        values = [row.get(field, "") for row in rows]
+        typecode = schema.get(field)
+        columns[field] = values if typecode is None else _column(values, typecode)
+    return columns
+
+
+def column_types(columns: dict[str, Column]) -> dict[str, str]:
+    return {field: TYPE_NAMES[column.typecode if isinstance(column, array) else None] for field, column in columns.items()}
+
+
+def _jsonable(column: Column) -> list:
+    if isinstance(column, array) and column.typecode == FLOAT:
+        # JSON에는 NaN이 없으므로 null로 변환
+        return [None if math.isnan(value) else value for value in column]
+    return column.tolist() if isinstance(column, array) else column
+
+
+def columnar_response(body: dict, schema: dict[str, str], key: str = "output2") -> dict:
+    """
+    Replace a list output of a KIS response with typed columns
+
+    Args:
+        body: KIS response (shared, not mutated)
+        schema: Field -> array typecode of numeric fields
+        key: List output to convert
+
+    Returns:
+        dict: Copy of body with key as {"count", "types", "columns"}
+    """
+    rows = body.get(key)
+    if not isinstance(rows, list):
+        return body
+    columns = to_columns(rows, schema)
+    return {
+        **body,
+        key: {
+            "count": len(rows),
+            "types": column_types(columns),
+            "columns": {field: _jsonable(column) for field, column in columns.items()},
+        },
+    }
@@ -0,0 +1,424 @@
+from datetime import date, datetime
+from typing import Callable, Optional, Union
+
+import annotations as tool_annotations
+from annotations import columnar_annotations, fields_annotations, pagination_annotations
+from columnar import DAILY_CHARTPRICE_SCHEMA, DAILYPRICE_SCHEMA, RANKING_SCHEMA, TIME_ITEMCHARTPRICE_SCHEMA
+from fields import (
+    ASKING_PRICE_OUTPUTS, BRKNEWS_TITLE_OUTPUTS, CCNL_OUTPUTS, DAILY_CHARTPRICE_OUTPUTS, DAILYPRICE_OUTPUTS,
+    INDUSTRY_PRICE_OUTPUTS, INDUSTRY_THEME_OUTPUTS, NEWS_TITLE_OUTPUTS, PERIOD_RIGHTS_OUTPUTS, PRICE_DETAIL_OUTPUTS,
+    PRICE_OUTPUTS, SEARCH_INFO_OUTPUTS, SEARCH_OUTPUTS, TIME_INDEXCHARTPRICE_OUTPUTS, TIME_ITEMCHARTPRICE_OUTPUTS,
+    Outputs, ranking_outputs,
+)
+from pagination import KEYB_SCHEME, MINUTE_BAR_SCHEME, NEWS_SCHEME, PERIOD_RIGHTS_SCHEME, PageScheme
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+QUOTATIONS = "/uapi/overseas-price/v1/quotations"
+RANKING = "/uapi/overseas-stock/v1/ranking"
+
+# 도구에만 있고 KIS 요청 파라미터가 아닌 인자 (annotations.py 공통 정의)
+TOOL_OPTIONS = frozenset({*fields_annotations, *pagination_annotations, *columnar_annotations})
+
+# 대소문자 구분 없이 받아 대문자로 요청하는 인자 (거래소/시장/기간 코드, 종목코드)
+CASE_INSENSITIVE = frozenset({"excd", "symb", "pdno", "fid_cond_mrkt_div_code", "fid_input_iscd", "fid_period_div_code"})
+
+# 해외주식 거래소코드 (API마다 문서의 코드표가 달라 excd는 도구와 관계없이 이 목록으로 검사)
+EXCHANGE_CODES = ("NYS", "NAS", "AMS", "HKS", "SHS", "SZS", "SHI", "SZI", "HSX", "HNX", "TSE", "BAY", "BAQ", "BAA")
+SHARED_CODES = {"excd": EXCHANGE_CODES}
+
+# 고정 TTL(초) 또는 요청 파라미터로 TTL을 계산하는 함수
+TtlPolicy = Union[float, Callable[[dict], float]]
+
+
+def _period_rights_ttl(params: dict) -> float:
+    # 종료일이 지난 기간의 권리정보는 거의 바뀌지 않음
+    end = params.get("INQR_END_DT", "")
+    if end and end < datetime.now().strftime("%Y%m%d"):
+        return DAY
+    return 10 * MINUTE
+
+
+def _time_itemchartprice_ttl(params: dict) -> float:
+    # KEYB가 있으면 과거 구간 조회이므로 길게 보관
+    return HOUR if params.get("KEYB") else 10
+
+
+def _hint(spec: dict) -> str:
+    if spec.get("enum"):
+        return ", ".join(spec["enum"])
+    examples = spec.get("examples") or [""]
+    return str(examples[0])
+
+
+def _is_date(value: str) -> bool:
+    if len(value) != 8 or not value.isdigit():
+        return False
+    try:
+        date(int(value[:4]), int(value[4:6]), int(value[6:]))
+    except ValueError:
+        return False
+    return True
+
+
+def _is_time(value: str) -> bool:
+    return len(value) == 6 and value.isdigit() and value[:2] < "24" and value[2:4] < "60" and value[4:] < "60"
+
+
+def _is_datetime(value: str) -> bool:
+    return _is_date(value[:8]) and _is_time(value[8:])
+
+
+# annotations.py description의 "... 형식" 표기 -> 형식 검사 함수 (긴 표기부터 확인)
+FORMATS: tuple[tuple[str, Callable[[str], bool]], ...] = (
+    ("YYYYMMDDHHMMSS", _is_datetime),
+    ("YYYYMMDD", _is_date),
+    ("HHMMSS", _is_time),
+)
+
+Check = tuple[str, Callable[[str], bool], str]  # (인자, 검사 함수, 오류 메시지 형식)
+
+
+def _enum_codes(spec: dict) -> frozenset[str]:
+    # "NAS:나스닥" -> "NAS", "공백:전체" -> ""
+    codes = (value.split(":", 1)[0] for value in spec["enum"])
+    return frozenset("" if code == "공백" else code for code in codes)
+
+
+def _compile_checks(annotations: dict, exhaustive: tuple[str, ...],
+                    limits: dict[str, tuple[int, Optional[int]]]) -> tuple[Check, ...]:
+    """
+    Value checks derived from the annotations (enum codes, YYYYMMDD/HHMMSS formats) and integer limits
+
+    enum은 exhaustive에 포함된 인자(API 문서의 전체 코드표)만 검사합니다.
+    그 외의 enum은 예시 값이므로 KIS가 판단하도록 그대로 전달합니다.
+    """
+    unknown = [arg for arg in exhaustive if not annotations.get(arg, {}).get("enum")]
+    if unknown:
+        raise ValueError(f"exhaustive arguments without an enum in annotations: {unknown}")
+    checks = []
+    for arg, spec in annotations.items():
+        if arg in TOOL_OPTIONS:
+            continue
+        if spec.get("enum"):
+            if arg in exhaustive:
+                codes = SHARED_CODES.get(arg)
+                hint = ", ".join(codes) if codes else _hint(spec)
+                message = f"{arg} must be one of {hint} (got '{{}}')"
+                checks.append((arg, (frozenset(codes) if codes else _enum_codes(spec)).__contains__, message))
+            continue
+        for token, check in FORMATS:
+            if f"{token} 형식" in spec.get("description", ""):
+                example = next((example for example in spec.get("examples", []) if example), "")
+                checks.append((arg, check, f"{arg} must be a valid {token} value (e.g. '{example}', got '{{}}')"))
+                break
+    # 검사 함수가 annotations.py의 예시 값을 거부하면 등록 시점에 알림
+    for arg, check, message in checks:
+        for example in annotations[arg].get("examples", []):
+            if example and not check(example):
+                raise ValueError(f"Invalid example in annotations: {message.format(example)}")
+    for arg, (low, high) in limits.items():
+        def in_range(value: str, low: int = low, high: Optional[int] = high) -> bool:
+            return value.isdigit() and low <= int(value) and (high is None or int(value) <= high)
+        bounds = f"between {low} and {high}" if high is not None else f"of at least {low}"
+        checks.append((arg, in_range, f"{arg} must be an integer {bounds} (got '{{}}')"))
+    return tuple(checks)
+
+
+class Endpoint:
+    """
+    Declarative description of a KIS quotation endpoint
+
+    요청 파라미터는 annotations.py의 도구 인자 정의에서 가져오며 (fields, max_pages 등 도구 전용 인자 제외,
+    파라미터 이름은 인자 이름의 대문자), 파라미터 목록과 필수값 오류 메시지는 등록 시 한 번만 만듭니다.
+    전체 코드표인 enum(exhaustive), description의 날짜/시각 형식, 정수 범위, 기간 순서도 등록 시 검사 함수로 만들어 두고
+    build()에서 KIS에 요청하기 전에 확인합니다.
+    """
+
+    __slots__ = ("tr_id", "path", "operation", "required", "outputs", "scheme", "columnar", "ttl", "rate_limit",
+                 "_params", "_upper", "_messages", "_checks", "_ranges")
+
+    def __init__(
+        self,
+        tr_id: str,
+        path: str,
+        annotations: dict,
+        outputs: Outputs,
+        exhaustive: tuple[str, ...] = (),
+        required: tuple[str, ...] = (),
+        renames: Optional[dict[str, str]] = None,
+        limits: Optional[dict[str, tuple[int, Optional[int]]]] = None,
+        ranges: tuple[tuple[str, str], ...] = (),
+        operation: str = "buy",
+        scheme: Optional[PageScheme] = None,
+        columnar: Optional[dict[str, str]] = None,
+        ttl: TtlPolicy = 0,
+        rate_limit: float = 0,
+    ):
+        """
+        Args:
+            tr_id: Transaction ID
+            path: API endpoint URL path
+            annotations: Tool argument definitions from annotations.py
+            outputs: Output key -> fields of the response (KIS API documentation), checked against fields arguments
+            exhaustive: Arguments whose annotation enum is the complete code table (other enums are only examples)
+            required: Arguments that must not be empty
+            renames: Argument -> request parameter, where it is not the upper-cased argument name
+            limits: Integer arguments -> inclusive (min, max) bounds (max None: no upper bound)
+            ranges: (start, end) date argument pairs where start must not be after end
+            operation: Operation type for domain selection (TrIdManager.get_domain)
+            scheme: Continuation scheme (None: single page only)
+            columnar: Numeric field schema for columnar responses
+            ttl: Response cache TTL in seconds, or a function of the request parameters (0: not cached)
+            rate_limit: Extra per-second request limit for this tr_id (0: appkey limit only)
+        """
+        renames = renames or {}
+        self.tr_id = tr_id
+        self.path = path
+        self.operation = operation
+        self.required = required
+        self.outputs = outputs
+        self.scheme = scheme
+        self.columnar = columnar
+        self.ttl = ttl
+        self.rate_limit = rate_limit
+        self._params = tuple(
+            (arg, renames.get(arg, arg.upper())) for arg in annotations if arg not in TOOL_OPTIONS
+        )
+        self._upper = tuple(arg for arg, _ in self._params if arg in CASE_INSENSITIVE)
+        self._messages = {arg: f"{arg} is required (e.g. '{_hint(annotations[arg])}')" for arg in required}
+        self._checks = _compile_checks(annotations, exhaustive, limits or {})
+        self._ranges = ranges
+
+    @property
+    def params(self) -> tuple[str, ...]:
+        """Request parameter names in order"""
+        return tuple(param for _, param in self._params)
+
+    def build(self, **arguments) -> dict:
+        """
+        Check arguments locally and map tool arguments to request parameters
+
+        거래소코드, 종목코드 등 CASE_INSENSITIVE 인자는 검사 전에 공백을 제거하고 대문자로 바꿉니다.
+
+        Args:
+            arguments: Tool arguments, one per request parameter
+
+        Returns:
+            dict: Request parameters
+
+        Raises:
+            ValueError: If a required argument is empty, a value is not one of its enum codes or not in
+                its date/time format, an integer is out of bounds or a date range is reversed
+        """
+        for arg in self._upper:
+            arguments[arg] = arguments[arg].strip().upper()
+        for arg in self.required:
+            if not arguments[arg]:
+                raise ValueError(self._messages[arg])
+        # 빈 값은 필수값 검사에서만 확인 (선택 인자는 공백 허용)
+        for arg, check, message in self._checks:
+            value = arguments[arg]
+            if value and not check(value):
+                raise ValueError(message.format(value))
+        for start, end in self._ranges:
+            if arguments[start] and arguments[end] and arguments[start] > arguments[end]:
+                raise ValueError(f"{start} must not be after {end} (got '{arguments[start]}' > '{arguments[end]}')")
+        return {param: arguments[arg] for arg, param in self._params}
+
+
+# 도구 이름 -> 엔드포인트
+ENDPOINTS: dict[str, Endpoint] = {
+    # 기본시세
+    "price": Endpoint(
+        "HHDFS00000300", f"{QUOTATIONS}/price", tool_annotations.price_annotations,
+        outputs=PRICE_OUTPUTS,
+        exhaustive=("excd",),
+        required=("excd", "symb"), ttl=2,
+    ),
+    "price-detail": Endpoint(
+        "HHDFS76200200", f"{QUOTATIONS}/price-detail", tool_annotations.price_detail_annotations,
+        outputs=PRICE_DETAIL_OUTPUTS,
+        exhaustive=("excd",),
+        required=("excd", "symb"), ttl=2,
+    ),
+    "inquire-asking-price": Endpoint(
+        "HHDFS76200100", f"{QUOTATIONS}/inquire-asking-price", tool_annotations.inquire_asking_price_annotations,
+        outputs=ASKING_PRICE_OUTPUTS,
+        required=("excd", "symb"), ttl=1,
+    ),
+    "inquire-ccnl": Endpoint(
+        "HHDFS76200300", f"{QUOTATIONS}/inquire-ccnl", tool_annotations.inquire_ccnl_annotations,
+        outputs=CCNL_OUTPUTS,
+        exhaustive=("excd", "tday"),
+        required=("excd", "tday", "symb"), scheme=KEYB_SCHEME, ttl=5,
+    ),
+    "quot-inquire-ccnl": Endpoint(
+        "HHDFS76200300", f"{QUOTATIONS}/inquire-ccnl", tool_annotations.quot_inquire_ccnl_annotations,
+        outputs=CCNL_OUTPUTS,
+        exhaustive=("excd", "tday"),
+        required=("excd", "tday", "symb"), scheme=KEYB_SCHEME, ttl=5,
+    ),
+    "inquire-time-itemchartprice": Endpoint(
+        "HHDFS76950200", f"{QUOTATIONS}/inquire-time-itemchartprice",
+        tool_annotations.inquire_time_itemchartprice_annotations,
+        outputs=TIME_ITEMCHARTPRICE_OUTPUTS,
+        exhaustive=("excd", "pinc", "next"),
+        required=("excd", "symb", "nmin", "pinc", "nrec"), limits={"nmin": (1, None), "nrec": (1, 120)},
+        scheme=MINUTE_BAR_SCHEME,
+        columnar=TIME_ITEMCHARTPRICE_SCHEMA, ttl=_time_itemchartprice_ttl,
+    ),
+    "inquire-time-indexchartprice": Endpoint(
+        "FHKST03030200", f"{QUOTATIONS}/inquire-time-indexchartprice",
+        tool_annotations.inquire_time_indexchartprice_annotations,
+        outputs=TIME_INDEXCHARTPRICE_OUTPUTS,
+        exhaustive=("fid_cond_mrkt_div_code", "fid_hour_cls_code", "fid_pw_data_incu_yn"),
+        required=("fid_cond_mrkt_div_code", "fid_input_iscd", "fid_hour_cls_code", "fid_pw_data_incu_yn"), ttl=10,
+    ),
+    "dailyprice": Endpoint(
+        "HHDFS76240000", f"{QUOTATIONS}/dailyprice", tool_annotations.dailyprice_annotations,
+        outputs=DAILYPRICE_OUTPUTS,
+        exhaustive=("gubn", "modp"),
+        required=("excd", "symb", "gubn", "modp"), columnar=DAILYPRICE_SCHEMA, ttl=MINUTE,
+    ),
+    "inquire-daily-chartprice": Endpoint(
+        "FHKST03030100", f"{QUOTATIONS}/inquire-daily-chartprice", tool_annotations.inquire_daily_chartprice_annotations,
+        outputs=DAILY_CHARTPRICE_OUTPUTS,
+        exhaustive=("fid_cond_mrkt_div_code", "fid_period_div_code"),
+        required=("fid_cond_mrkt_div_code", "fid_input_iscd", "fid_input_date_1", "fid_input_date_2",
+                  "fid_period_div_code"),
+        ranges=(("fid_input_date_1", "fid_input_date_2"),),
+        columnar=DAILY_CHARTPRICE_SCHEMA, ttl=MINUTE,
+    ),
+    "inquire-search": Endpoint(
+        "HHDFS76410000", f"{QUOTATIONS}/inquire-search", tool_annotations.inquire_search_annotations,
+        outputs=SEARCH_OUTPUTS,
+        exhaustive=("excd",),
+        required=("excd",), scheme=KEYB_SCHEME, ttl=10,
+    ),
+    "industry-theme": Endpoint(
+        "HHDFS76370000", f"{QUOTATIONS}/industry-theme", tool_annotations.industry_theme_annotations,
+        outputs=INDUSTRY_THEME_OUTPUTS,
+        exhaustive=("excd", "vol_rang"),
+        required=("excd", "icod", "vol_rang"), scheme=KEYB_SCHEME, ttl=10,
+    ),
+    "industry-price": Endpoint(
+        "HHDFS76370100", f"{QUOTATIONS}/industry-price", tool_annotations.industry_price_annotations,
+        outputs=INDUSTRY_PRICE_OUTPUTS,
+        exhaustive=("excd",),
+        required=("excd",), ttl=6 * HOUR,  # 업종코드 목록
+    ),
+    "search-info": Endpoint(
+        "CTPF1702R", f"{QUOTATIONS}/search-info", tool_annotations.search_info_annotations,
+        outputs=SEARCH_INFO_OUTPUTS,
+        required=("prdt_type_cd", "pdno"), ttl=DAY,
+    ),
+    # 시세분석
+    "period_rights": Endpoint(
+        "CTRGT011R", f"{QUOTATIONS}/period-rights", tool_annotations.period_rights_annotations,
+        outputs=PERIOD_RIGHTS_OUTPUTS,
+        exhaustive=("rght_type_cd", "inqr_dvsn_cd"),
+        required=("rght_type_cd", "inqr_dvsn_cd", "inqr_strt_dt", "inqr_end_dt"),
+        renames={"NK50": "CTX_AREA_NK50", "FK50": "CTX_AREA_FK50"}, ranges=(("inqr_strt_dt", "inqr_end_dt"),),
+        scheme=PERIOD_RIGHTS_SCHEME, ttl=_period_rights_ttl,
+    ),
+    "news-title": Endpoint(
+        "HHPSTH60100C1", f"{QUOTATIONS}/news-title", tool_annotations.news_title_annotations,
+        outputs=NEWS_TITLE_OUTPUTS,
+        exhaustive=("info_gb",),
+        scheme=NEWS_SCHEME, ttl=30,
+    ),
+    "brknews-title": Endpoint(
+        "FHKST01011801", f"{QUOTATIONS}/brknews-title", tool_annotations.brknews_title_annotations,
+        outputs=BRKNEWS_TITLE_OUTPUTS,
+        required=("fid_news_ofer_entp_code", "fid_cond_scr_div_code"), ttl=30,
+    ),
+    # 시세분석 순위
+    "volume-surge": Endpoint(
+        "HHDFS76270000", f"{RANKING}/volume-surge", tool_annotations.volume_surge_annotations,
+        outputs=ranking_outputs("n_tvol", "n_diff", "n_rate"),
+        exhaustive=("excd", "mixn", "vol_rang"),
+        required=("excd", "mixn", "vol_rang"), scheme=KEYB_SCHEME, columnar=RANKING_SCHEMA, ttl=10,
+    ),
+    "volume-power": Endpoint(
+        "HHDFS76280000", f"{RANKING}/volume-power", tool_annotations.volume_power_annotations,
+        outputs=ranking_outputs("tpow", "powx"),
+        exhaustive=("excd", "nday", "vol_rang"),
+        required=("excd", "nday", "vol_rang"), scheme=KEYB_SCHEME, columnar=RANKING_SCHEMA, ttl=10,
+    ),
+    "updown-rate": Endpoint(
+        "HHDFS76290000", f"{RANKING}/updown-rate", tool_annotations.updown_rate_annotations,
+        outputs=ranking_outputs("n_base", "n_diff", "n_rate"),
+        exhaustive=("excd", "nday", "gubn", "vol_rang"),
+        required=("excd", "nday", "gubn", "vol_rang"), scheme=KEYB_SCHEME, columnar=RANKING_SCHEMA, ttl=10,
+    ),
+    "trade-vol": Endpoint(
+        "HHDFS76310010", f"{RANKING}/trade-vol", tool_annotations.trade_vol_annotations,
+        outputs=ranking_outputs("tamt", "a_tvol"),
+        exhaustive=("excd", "nday", "vol_rang"),
+        required=("excd", "nday", "vol_rang"), scheme=KEYB_SCHEME, columnar=RANKING_SCHEMA, ttl=10,
+    ),
+    "trade-turnover": Endpoint(
+        "HHDFS76340000", f"{RANKING}/trade-turnover", tool_annotations.trade_turnover_annotations,
+        outputs=ranking_outputs("n_tvol", "shar", "tover"),
+        exhaustive=("excd", "nday", "vol_rang"),
+        required=("excd", "nday", "vol_rang"), scheme=KEYB_SCHEME, columnar=RANKING_SCHEMA, ttl=10,
+    ),
+    "trade-pbmn": Endpoint(
+        "HHDFS76320010", f"{RANKING}/trade-pbmn", tool_annotations.trade_pbmn_annotations,
+        outputs=ranking_outputs("tamt", "a_tamt"),
+        exhaustive=("excd", "nday", "vol_rang"),
+        required=("excd", "nday", "vol_rang"), scheme=KEYB_SCHEME, columnar=RANKING_SCHEMA, ttl=10,
+    ),
+    "trade-growth": Endpoint(
+        "HHDFS76330000", f"{RANKING}/trade-growth", tool_annotations.trade_growth_annotations,
+        outputs=ranking_outputs("n_tvol", "n_rate"),
+        exhaustive=("excd", "nday", "vol_rang"),
+        required=("excd", "nday", "vol_rang"), scheme=KEYB_SCHEME, columnar=RANKING_SCHEMA, ttl=10,
+    ),
+    "price-fluct": Endpoint(
+        "HHDFS76260000", f"{RANKING}/price-fluct", tool_annotations.price_fluct_annotations,
+        outputs=ranking_outputs("n_base", "n_diff", "n_rate"),
+        exhaustive=("excd", "gubn", "mixn", "vol_rang"),
+        required=("excd", "gubn", "mixn", "vol_rang"), scheme=KEYB_SCHEME, columnar=RANKING_SCHEMA, ttl=10,
+    ),
+    "new-highlow": Endpoint(
+        "HHDFS76300000", f"{RANKING}/new-highlow", tool_annotations.new_highlow_annotations,
+        outputs=ranking_outputs("n_base", "n_diff", "n_rate"),
+        exhaustive=("excd", "mixn", "vol_rang", "gubn", "gubn2"),
+        required=("excd", "mixn", "vol_rang", "gubn", "gubn2"), scheme=KEYB_SCHEME, columnar=RANKING_SCHEMA,
+        ttl=10,
+    ),
+    "market-cap": Endpoint(
+        "HHDFS76350100", f"{RANKING}/market-cap", tool_annotations.market_cap_annotations,
+        outputs=ranking_outputs("shar", "tomv", "grav", "mcap"),
+        exhaustive=("excd", "vol_rang"),
+        required=("excd", "vol_rang"), scheme=KEYB_SCHEME, columnar=RANKING_SCHEMA, ttl=10,
+    ),
+}
+
+
+def cache_ttls() -> dict[str, TtlPolicy]:
+    """
+    Returns:
+        dict[str, TtlPolicy]: tr_id -> response cache TTL policy of every cached endpoint
+    """
+    return {endpoint.tr_id: endpoint.ttl for endpoint in ENDPOINTS.values() if endpoint.ttl}
+
+
+def output_fields() -> dict[str, Outputs]:
+    """
+    Returns:
+        dict[str, Outputs]: tr_id -> declared output fields of every endpoint
+    """
+    return {endpoint.tr_id: endpoint.outputs for endpoint in ENDPOINTS.values()}
+
+
+def rate_limits() -> dict[str, float]:
+    """
+    Returns:
+        dict[str, float]: tr_id -> extra per-second limit of every endpoint that has one
+    """
+    return {endpoint.tr_id: endpoint.rate_limit for endpoint in ENDPOINTS.values() if endpoint.rate_limit}
@@ -0,0 +1,674 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+import zlib
+from collections import Counter, deque
+from datetime import datetime, timedelta
+from typing import Callable, NamedTuple
+
+import httpx
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route, WebSocketRoute
+from starlette.websockets import WebSocket, WebSocketDisconnect
+
+from realtime import FIELDS, QUOTE_TR_ID, TRADE_TR_ID
+
+# 기본 설정
+DEFAULT_PAGES = 3  # 연속조회 엔드포인트의 전체 페이지 수
+DEFAULT_PAGE_SIZE = 20  # 순위/목록 엔드포인트의 페이지당 건수
+DEFAULT_BARS = 1950  # 종목별 제공하는 분봉 수 (5거래일)
+DEFAULT_TICK_INTERVAL = 1.0  # 실시간 시세 전송 간격 (초)
+
+RATE_LIMIT_CODE = "EGW00201"
+RATE_LIMIT_MSG = "초당 거래건수를 초과하였습니다."
+# error_rate로 무작위 발생시키는 오류
+DEFAULT_ERROR_CODE = "EGW00001"
+ERROR_MESSAGES = {
+    "EGW00001": "일시적인 오류가 발생했습니다.",
+    "EGW00002": "서버 에러가 발생했습니다.",
+    "EGW00121": "유효하지 않은 token 입니다.",
+    "EGW00123": "기간이 만료된 token 입니다.",
+    "EGW00201": RATE_LIMIT_MSG,
+    "EGW00203": "OPS라우팅 중 오류가 발생했습니다.",
+    "OPSQ2001": "입력값이 올바르지 않습니다.",
+}
+SUCCESS_MSG = "정상처리 되었습니다."
+
+# 시세 생성 기준 시각 (미국 정규장 마감)
+ANCHOR = datetime(2025, 1, 10, 16, 0)
+
+
+def _seed(*parts) -> int:
+    return zlib.crc32("|".join(map(str, parts)).encode())
+
+
+def _symbol(params: dict) -> str:
+    return params.get("SYMB") or params.get("FID_INPUT_ISCD") or params.get("PDNO") or "AAPL"
+
+
+def _base_price(symb: str) -> float:
+    """Stable reference price of a symbol"""
+    return 10 + _seed(symb) % 50000 / 100
+
+
+def _bar(symb: str, stamp: datetime) -> dict:
+    """OHLCV of one minute, derived from the symbol and the minute"""
+    rng = random.Random(_seed(symb, stamp.strftime("%Y%m%d%H%M")))
+    base = _base_price(symb) * (1 + (stamp.toordinal() % 7 - 3) / 100)
+    open_ = base * (1 + rng.uniform(-0.01, 0.01))
+    last = open_ * (1 + rng.uniform(-0.002, 0.002))
+    return {
+        "open": round(open_, 4),
+        "high": round(max(open_, last) * (1 + rng.uniform(0, 0.001)), 4),
+        "low": round(min(open_, last) * (1 - rng.uniform(0, 0.001)), 4),
+        "last": round(last, 4),
+        "evol": rng.randint(100, 50000),
+    }
+
+
+def _quote(symb: str) -> dict:
+    """Current price fields shared by the price endpoints"""
+    bar = _bar(symb, ANCHOR)
+    base = round(_base_price(symb), 4)
+    diff = round(bar["last"] - base, 4)
+    return {
+        "base": f"{base:.4f}",
+        "last": f"{bar['last']:.4f}",
+        "open": f"{bar['open']:.4f}",
+        "high": f"{bar['high']:.4f}",
+        "low": f"{bar['low']:.4f}",
+        "sign": "2" if diff > 0 else "5" if diff < 0 else "3",
+        "diff": f"{abs(diff):.4f}",
+        "rate": f"{diff / base * 100:.2f}",
+        "tvol": str(bar["evol"] * 390),
+        "tamt": str(int(bar["evol"] * 390 * bar["last"])),
+    }
+
+
+def _ticker(index: int) -> str:
+    """Synthetic ticker for list endpoints (AAAA, AAAB, ...)"""
+    letters = []
+    for _ in range(4):
+        index, remainder = divmod(index, 26)
+        letters.append(chr(ord("A") + remainder))
+    return "".join(reversed(letters))
+
+
+# ---------------------------------------------------------------------------
+# 엔드포인트별 응답 생성
+# ---------------------------------------------------------------------------
+
+class Page(NamedTuple):
+    body: dict
+    more: bool  # 다음 페이지 존재 여부 (응답 헤더 tr_cont: M/D)
+
+
+def _price(params: dict, kis: "FakeKis") -> Page:
+    symb = _symbol(params)
+    quote = _quote(symb)
+    return Page({"output": {
+        "rsym": f"D{params.get('EXCD', 'NAS')}{symb}", "zdiv": "4", "base": quote["base"], "pvol": quote["tvol"],
+        "last": quote["last"], "sign": quote["sign"], "diff": quote["diff"], "rate": quote["rate"],
+        "tvol": quote["tvol"], "tamt": quote["tamt"], "ordy": "매도불가",
+    }}, False)
+
+
+def _price_detail(params: dict, kis: "FakeKis") -> Page:
+    symb = _symbol(params)
+    quote = _quote(symb)
+    last = float(quote["last"])
+    return Page({"output": {
+        "rsym": f"D{params.get('EXCD', 'NAS')}{symb}", "pvol": quote["tvol"], "open": quote["open"],
+        "high": quote["high"], "low": quote["low"], "last": quote["last"], "base": quote["base"],
+        "tomv": str(int(last * 1e9)), "pamt": quote["tamt"], "uplp": "0.0000", "dnlp": "0.0000",
+        "h52p": f"{last * 1.3:.4f}", "h52d": "20240716", "l52p": f"{last * 0.7:.4f}", "l52d": "20240419",
+        "perx": "30.12", "pbrx": "12.40", "epsx": f"{last / 30.12:.2f}", "bpsx": f"{last / 12.4:.2f}",
+        "shar": "1000000000", "mcap": "1000000", "curr": "USD", "zdiv": "4", "vnit": "1",
+        "t_xprc": f"{last * 1450:.0f}", "t_xdif": "0", "t_xrat": quote["rate"], "p_xprc": f"{float(quote['base']) * 1450:.0f}",
+        "p_xdif": "0", "p_xrat": "0.00", "t_rate": "1450.00", "p_rate": "1450.00", "t_xsgn": quote["sign"],
+        "p_xsng": "3", "e_ordyn": "매매 가능", "e_hogau": "0.0100", "e_icod": "정보기술", "e_parp": "0.0000",
+        "tvol": quote["tvol"], "tamt": quote["tamt"], "etyp_nm": "",
+    }}, False)
+
+
+def _asking_price(params: dict, kis: "FakeKis") -> Page:
+    symb = _symbol(params)
+    quote = _quote(symb)
+    last = float(quote["last"])
+    rng = random.Random(_seed(symb, "asking"))
+    levels = {}
+    for n in range(1, 11):
+        levels.update({
+            f"pbid{n}": f"{last - n * 0.01:.4f}", f"pask{n}": f"{last + n * 0.01:.4f}",
+            f"vbid{n}": str(rng.randint(1, 500)), f"vask{n}": str(rng.randint(1, 500)),
+            f"dbid{n}": "0", f"dask{n}": "0",
+        })
+    return Page({
+        "output1": {
+            "rsym": f"D{params.get('EXCD', 'NAS')}{symb}", "zdiv": "4", "curr": "USD", "base": quote["base"],
+            "open": quote["open"], "high": quote["high"], "low": quote["low"], "last": quote["last"],
+            "dymd": ANCHOR.strftime("%Y%m%d"), "dhms": ANCHOR.strftime("%H%M%S"),
+            "bvol": str(sum(int(levels[f"vbid{n}"]) for n in range(1, 11))),
+            "avol": str(sum(int(levels[f"vask{n}"]) for n in range(1, 11))),
+            "bdvl": "0", "advl": "0", "code": symb, "ropen": quote["open"], "rhigh": quote["high"],
+            "rlow": quote["low"], "rclose": quote["last"],
+        },
+        "output2": levels,
+        "output3": {"vstm": "", "vsmp": "", "vsqn": ""},
+    }, False)
+
+
+def _dailyprice(params: dict, kis: "FakeKis") -> Page:
+    symb = _symbol(params)
+    end = datetime.strptime(params["BYMD"], "%Y%m%d") if params.get("BYMD") else ANCHOR
+    rows = []
+    day = end
+    while len(rows) < 100:
+        if day.weekday() < 5:
+            bar = _bar(symb, day.replace(hour=16, minute=0))
+            rows.append({
+                "xymd": day.strftime("%Y%m%d"), "clos": f"{bar['last']:.4f}", "sign": "2", "diff": "0.0000",
+                "rate": "0.00", "open": f"{bar['open']:.4f}", "high": f"{bar['high']:.4f}", "low": f"{bar['low']:.4f}",
+                "tvol": str(bar["evol"] * 390), "tamt": str(int(bar["evol"] * 390 * bar["last"])),
+                "pbid": f"{bar['last'] - 0.01:.4f}", "vbid": "100", "pask": f"{bar['last'] + 0.01:.4f}", "vask": "100",
+            })
+        day -= timedelta(days=1)
+    return Page({"output1": {"rsym": f"D{params.get('EXCD', 'NAS')}{symb}", "zdiv": "4", "nrec": str(len(rows))}, "output2": rows}, False)
+
+
+def _daily_chartprice(params: dict, kis: "FakeKis") -> Page:
+    symb = _symbol(params)
+    start = params.get("FID_INPUT_DATE_1") or (ANCHOR - timedelta(days=30)).strftime("%Y%m%d")
+    end = params.get("FID_INPUT_DATE_2") or ANCHOR.strftime("%Y%m%d")
+    day, first = datetime.strptime(end, "%Y%m%d"), datetime.strptime(start, "%Y%m%d")
+    rows = []
+    while day >= first and len(rows) < 100:
+        if day.weekday() < 5:
+            bar = _bar(symb, day.replace(hour=16, minute=0))
+            rows.append({
+                "stck_bsop_date": day.strftime("%Y%m%d"), "ovrs_nmix_prpr": f"{bar['last']:.2f}",
+                "ovrs_nmix_oprc": f"{bar['open']:.2f}", "ovrs_nmix_hgpr": f"{bar['high']:.2f}",
+                "ovrs_nmix_lwpr": f"{bar['low']:.2f}", "acml_vol": str(bar["evol"] * 390), "mod_yn": "N",
+            })
+        day -= timedelta(days=1)
+    quote = _quote(symb)
+    return Page({
+        "output1": {
+            "ovrs_nmix_prdy_vrss": quote["diff"], "prdy_vrss_sign": quote["sign"], "prdy_ctrt": quote["rate"],
+            "ovrs_nmix_prdy_clpr": quote["base"], "acml_vol": quote["tvol"], "hts_kor_isnm": symb,
+            "ovrs_nmix_prpr": quote["last"], "stck_shrn_iscd": symb, "ovrs_prod_oprc": quote["open"],
+            "ovrs_prod_hgpr": quote["high"], "ovrs_prod_lwpr": quote["low"],
+        },
+        "output2": rows,
+    }, False)
+
+
+def _minute_bars(params: dict, kis: "FakeKis") -> Page:
+    """해외주식분봉조회: KEYB 시각부터 NMIN분 간격으로 과거 방향 NREC건"""
+    symb = _symbol(params)
+    nmin = int(params.get("NMIN") or 1)
+    nrec = min(int(params.get("NREC") or 120), 120)
+    newest = datetime.strptime(params["KEYB"], "%Y%m%d%H%M%S") if params.get("KEYB") else ANCHOR
+    oldest = ANCHOR - timedelta(minutes=kis.bars)
+    rows = []
+    stamp = newest.replace(second=0)
+    while len(rows) < nrec and stamp > oldest:
+        bar = _bar(symb, stamp)
+        rows.append({
+            "tymd": stamp.strftime("%Y%m%d"), "xymd": stamp.strftime("%Y%m%d"), "xhms": stamp.strftime("%H%M%S"),
+            "kymd": (stamp + timedelta(hours=14)).strftime("%Y%m%d"), "khms": (stamp + timedelta(hours=14)).strftime("%H%M%S"),
+            "open": f"{bar['open']:.4f}", "high": f"{bar['high']:.4f}", "low": f"{bar['low']:.4f}",
+            "last": f"{bar['last']:.4f}", "evol": str(bar["evol"]), "eamt": str(int(bar["evol"] * bar["last"])),
+        })
+        stamp -= timedelta(minutes=nmin)
+    more = stamp > oldest
+    return Page({
+        "output1": {
+            "rsym": f"D{params.get('EXCD', 'NAS')}{symb}", "zdiv": "4", "stim": "093000", "etim": "160000",
+            "sktm": "233000", "ektm": "060000", "next": "1" if more else "0", "more": "1" if more else "0",
+            "nrec": str(len(rows)),
+        },
+        "output2": rows,
+    }, more)
+
+
+def _index_minute_bars(params: dict, kis: "FakeKis") -> Page:
+    symb = _symbol(params)
+    rows = []
+    for index in range(102):
+        stamp = ANCHOR - timedelta(minutes=index)
+        bar = _bar(symb, stamp)
+        rows.append({
+            "stck_bsop_date": stamp.strftime("%Y%m%d"), "stck_cntg_hour": stamp.strftime("%H%M%S"),
+            "optn_prpr": f"{bar['last']:.2f}", "optn_oprc": f"{bar['open']:.2f}", "optn_hgpr": f"{bar['high']:.2f}",
+            "optn_lwpr": f"{bar['low']:.2f}", "cntg_vol": str(bar["evol"]),
+        })
+    quote = _quote(symb)
+    return Page({
+        "output1": {
+            "ovrs_nmix_prdy_vrss": quote["diff"], "prdy_vrss_sign": quote["sign"], "hts_kor_isnm": symb,
+            "prdy_ctrt": quote["rate"], "ovrs_nmix_prdy_clpr": quote["base"], "acml_vol": quote["tvol"],
+            "ovrs_nmix_prpr": quote["last"], "stck_shrn_iscd": symb, "ovrs_prod_oprc": quote["open"],
+            "ovrs_prod_hgpr": quote["high"], "ovrs_prod_lwpr": quote["low"],
+        },
+        "output2": rows,
+    }, False)
+
+
+def _keyb_pages(row: Callable[[int, dict], dict]) -> Callable[[dict, "FakeKis"], Page]:
+    """Build a KEYB-continued list endpoint (순위, 체결추이, 조건검색 ...)"""
+
+    def handler(params: dict, kis: "FakeKis") -> Page:
+        page = int(params["KEYB"]) if params.get("KEYB", "").isdigit() else 0
+        start = page * kis.page_size
+        rows = [row(start + index, params) for index in range(kis.page_size)]
+        more = page + 1 < kis.pages
+        return Page({
+            "output1": {
+                "zdiv": "4", "stat": "0", "crec": str(len(rows)), "trec": str(kis.pages * kis.page_size),
+                "nrec": str(len(rows)), "keyb": str(page + 1) if more else "",
+            },
+            "output2": rows,
+        }, more)
+
+    return handler
+
+
+def _ranking_row(index: int, params: dict) -> dict:
+    symb = _ticker(index)
+    quote = _quote(symb)
+    excd = params.get("EXCD") or "NAS"
+    return {
+        "rsym": f"D{excd}{symb}", "excd": excd, "symb": symb, "name": f"{symb} Inc", "ename": f"{symb} INC",
+        "last": quote["last"], "sign": quote["sign"], "diff": quote["diff"], "rate": quote["rate"],
+        "pask": f"{float(quote['last']) + 0.01:.4f}", "pbid": f"{float(quote['last']) - 0.01:.4f}",
+        "tvol": quote["tvol"], "tamt": quote["tamt"], "a_tvol": quote["tvol"], "a_tamt": quote["tamt"],
+        "n_base": quote["base"], "n_diff": quote["diff"], "n_rate": quote["rate"], "n_tvol": quote["tvol"],
+        "tpow": "100.00", "powx": "100.00", "shar": "1000000000", "tover": "1.23", "mcap": "1000000",
+        "tomv": str(int(float(quote["last"]) * 1e9)), "grav": "0.10", "valx": "1000000", "e_ordyn": "○",
+        "rank": str(index + 1),
+    }
+
+
+def _ccnl_row(index: int, params: dict) -> dict:
+    symb = _symbol(params)
+    stamp = ANCHOR - timedelta(seconds=index * 5)
+    bar = _bar(symb, stamp)
+    return {
+        "khms": (stamp + timedelta(hours=14)).strftime("%H%M%S"), "last": f"{bar['last']:.4f}", "sign": "2",
+        "diff": "0.0000", "rate": "0.00", "evol": str(bar["evol"] // 100 + 1), "tvol": str(bar["evol"] * 390),
+        "mtyp": "1", "pbid": f"{bar['last'] - 0.01:.4f}", "pask": f"{bar['last'] + 0.01:.4f}", "vpow": "100.00",
+    }
+
+
+def _search_row(index: int, params: dict) -> dict:
+    row = _ranking_row(index, params)
+    return {
+        "rsym": row["rsym"], "excd": row["excd"], "name": row["name"], "symb": row["symb"], "last": row["last"],
+        "shar": row["shar"], "valx": row["valx"], "plow": row["last"], "phigh": row["last"], "per": "30.12",
+        "eps": "1.00", "tvol": row["tvol"], "tamt": row["tamt"], "rate": row["rate"], "diff": row["diff"],
+        "sign": row["sign"], "avol": row["tvol"], "eps_tr": "", "e_ordyn": "○", "rank": row["rank"],
+    }
+
+
+def _theme_row(index: int, params: dict) -> dict:
+    row = _ranking_row(index, params)
+    return {key: row[key] for key in ("rsym", "excd", "symb", "name", "ename", "last", "sign", "diff", "rate", "tvol", "pask", "pbid", "e_ordyn")}
+
+
+def _industry_price(params: dict, kis: "FakeKis") -> Page:
+    return Page({"output1": {"nrec": "20"}, "output2": [
+        {"icod": f"{code:03d}", "name": f"업종{code:03d}"} for code in range(1, 21)
+    ]}, False)
+
+
+def _search_info(params: dict, kis: "FakeKis") -> Page:
+    symb = _symbol(params)
+    return Page({"output": {
+        "std_pdno": f"US{_seed(symb) % 10 ** 10:010d}", "prdt_eng_name": f"{symb} INC", "natn_cd": "840",
+        "natn_name": "미국", "tr_mket_cd": "01", "tr_mket_name": "나스닥", "ovrs_excg_cd": "NASD",
+        "ovrs_excg_name": "나스닥", "tr_crcy_cd": "USD", "ovrs_papr": "0.00000", "crcy_name": "US달러",
+        "ovrs_stck_dvsn_cd": "01", "prdt_clsf_cd": "101210", "prdt_clsf_name": "해외주식", "sll_unit_qty": "1",
+        "buy_unit_qty": "1", "tr_unit_amt": "0", "lstg_stck_num": "1000000000", "lstg_dt": "19801212",
+        "ovrs_stck_tr_stop_dvsn_cd": "01", "lstg_abol_item_yn": "N", "ovrs_stck_prdt_grp_no": "",
+        "lstg_yn": "Y", "tax_levy_yn": "N", "ovrs_stck_erlm_rosn_cd": "", "ovrs_stck_hist_rght_dvsn_cd": "",
+        "chng_bf_pdno": "", "prdt_type_cd_2": "", "ovrs_item_name": f"{symb} Inc", "sedol_no": "",
+        "blbg_tckr_text": f"{symb} US", "ovrs_stck_etf_risk_drtp_cd": "", "etp_chas_erng_rt_dbnb": "",
+        "istt_usge_isin_cd": "", "mint_svc_yn": "Y", "mint_svc_yn_chng_dt": "", "prdt_name": f"{symb}",
+        "lei_cd": "", "ovrs_stck_stop_rson_cd": "", "lstg_abol_dt": "", "mini_stk_tr_stat_dvsn_cd": "",
+        "mint_frst_svc_erlm_dt": "", "mint_dcpt_trad_psbl_yn": "Y", "mint_fnum_trad_psbl_yn": "Y",
+        "mint_cblc_cvsn_ipsb_yn": "N", "ptp_item_yn": "N", "ptp_item_trfx_exmt_yn": "N",
+        "ptp_item_trfx_exmt_strt_dt": "", "ptp_item_trfx_exmt_end_dt": "", "dtm_tr_psbl_yn": "Y",
+        "sdrf_stop_ecls_yn": "N", "sdrf_stop_ecls_erlm_dt": "",
+    }}, False)
+
+
+def _period_rights(params: dict, kis: "FakeKis") -> Page:
+    page = int(params["CTX_AREA_NK50"]) if params.get("CTX_AREA_NK50", "").isdigit() else 0
+    more = page + 1 < kis.pages
+    rows = [{
+        "bass_dt": (ANCHOR - timedelta(days=7 * (page * kis.page_size + index))).strftime("%Y%m%d"),
+        "rght_type_cd": params.get("RGHT_TYPE_CD") or "03", "pdno": _ticker(index), "prdt_name": f"{_ticker(index)} Inc",
+        "prdt_type_cd": "512", "std_pdno": "", "acpl_bass_dt": "", "sbsc_strt_dt": "", "sbsc_end_dt": "",
+        "cash_alct_rt": "0.25", "stck_alct_rt": "0", "crcy_cd": "USD", "crcy_cd2": "", "crcy_cd3": "", "crcy_cd4": "",
+        "alct_frcr_unpr": "0.2500", "stkp_dvdn_frcr_amt2": "", "stkp_dvdn_frcr_amt3": "", "stkp_dvdn_frcr_amt4": "",
+        "dfnt_yn": "Y",
+    } for index in range(kis.page_size)]
+    return Page({
+        "ctx_area_nk50": str(page + 1) if more else "",
+        "ctx_area_fk50": str(page + 1) if more else "",
+        "output": rows,
+    }, more)
+
+
+def _news_title(params: dict, kis: "FakeKis") -> Page:
+    page = int(params["CTS"]) if params.get("CTS", "").isdigit() else 0
+    more = page + 1 < kis.pages
+    rows = []
+    for index in range(kis.page_size):
+        stamp = ANCHOR - timedelta(minutes=10 * (page * kis.page_size + index))
+        symb = _ticker(index)
+        rows.append({
+            "info_gb": "1", "news_key": f"{stamp:%Y%m%d%H%M%S}{index:04d}", "data_dt": stamp.strftime("%Y%m%d"),
+            "data_tm": stamp.strftime("%H%M%S"), "class_cd": "01", "class_name": "종목", "source": "모의뉴스",
+            "nation_cd": "US", "exchange_cd": "NAS", "symb": symb, "symb_name": f"{symb} Inc",
+            "title": f"{symb} 관련 뉴스 {page * kis.page_size + index + 1}",
+        })
+    return Page({"cts": str(page + 1) if more else "", "outblock1": rows}, more)
+
+
+def _brknews_title(params: dict, kis: "FakeKis") -> Page:
+    rows = []
+    for index in range(40):
+        stamp = ANCHOR - timedelta(minutes=3 * index)
+        rows.append({
+            "cntt_usiq_srno": f"{stamp:%Y%m%d%H%M%S}{index:04d}", "news_ofer_entp_code": "2",
+            "data_dt": stamp.strftime("%Y%m%d"), "data_tm": stamp.strftime("%H%M%S"),
+            "hts_pbnt_titl_cntt": f"속보 {index + 1}", "news_lrdv_code": "", "dorg": "모의뉴스",
+            "iscd1": _ticker(index), "iscd2": "", "iscd3": "", "iscd4": "", "iscd5": "",
+        })
+    return Page({"output": rows}, False)
+
+
+QUOTATIONS = "/uapi/overseas-price/v1/quotations"
+RANKING = "/uapi/overseas-stock/v1/ranking"
+
+# path -> 응답 생성 함수
+ENDPOINTS: dict[str, Callable[[dict, "FakeKis"], Page]] = {
+    f"{QUOTATIONS}/price": _price,
+    f"{QUOTATIONS}/price-detail": _price_detail,
+    f"{QUOTATIONS}/inquire-asking-price": _asking_price,
+    f"{QUOTATIONS}/dailyprice": _dailyprice,
+    f"{QUOTATIONS}/inquire-daily-chartprice": _daily_chartprice,
+    f"{QUOTATIONS}/inquire-time-itemchartprice": _minute_bars,
+    f"{QUOTATIONS}/inquire-time-indexchartprice": _index_minute_bars,
+    f"{QUOTATIONS}/inquire-ccnl": _keyb_pages(_ccnl_row),
+    f"{QUOTATIONS}/inquire-search": _keyb_pages(_search_row),
+    f"{QUOTATIONS}/industry-theme": _keyb_pages(_theme_row),
+    f"{QUOTATIONS}/industry-price": _industry_price,
+    f"{QUOTATIONS}/search-info": _search_info,
+    f"{QUOTATIONS}/period-rights": _period_rights,
+    f"{QUOTATIONS}/news-title": _news_title,
+    f"{QUOTATIONS}/brknews-title": _brknews_title,
+    **{
+        f"{RANKING}/{name}": _keyb_pages(_ranking_row)
+        for name in (
+            "volume-surge", "volume-power", "updown-rate", "trade-vol", "trade-turnover",
+            "trade-pbmn", "trade-growth", "price-fluct", "new-highlow", "market-cap",
+        )
+    },
+}
+
+
+class FakeKis:
+    """
+    Configurable KIS API stand-in
+
+    도구가 사용하는 KIS REST 엔드포인트(토큰, 해시키, 해외주식 시세/순위)와 실시간 WebSocket을 흉내냅니다.
+    응답은 종목코드와 시각에서 결정적으로 생성되므로 같은 요청에는 항상 같은 값이 반환됩니다.
+
+    - latency/jitter: 응답마다 지연(초)을 추가
+    - rate_limit: appkey별 초당 요청 수를 넘으면 EGW00201 반환 (0: 제한 없음)
+    - error_rate: 이 비율로 error_code 오류를 무작위 반환, fail()로 특정 경로의 다음 N건을 실패시킬 수 있음
+    - pages/page_size/bars: 연속조회 페이지 수와 페이지당 건수, 종목별 분봉 수
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        rate_limit: int = 0,
+        error_rate: float = 0.0,
+        error_code: str = DEFAULT_ERROR_CODE,
+        pages: int = DEFAULT_PAGES,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        bars: int = DEFAULT_BARS,
+        tick_interval: float = DEFAULT_TICK_INTERVAL,
+        seed: int = 0,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit = rate_limit
+        self.error_rate = error_rate
+        self.error_code = error_code
+        self.pages = pages
+        self.page_size = page_size
+        self.bars = bars
+        self.tick_interval = tick_interval
+        self._random = random.Random(seed)
+        self._tokens: set[str] = set()
+        self._windows: dict[str, deque] = {}  # appkey -> 최근 1초간 요청 시각
+        self._failures: dict[str, deque] = {}  # path -> 반환할 msg_cd 목록
+        self.calls: Counter = Counter()  # path -> 요청 수
+        self.errors: Counter = Counter()  # msg_cd -> 반환한 오류 수
+        self.app = Starlette(routes=[
+            Route("/oauth2/tokenP", self._token, methods=["POST"]),
+            Route("/oauth2/Approval", self._approval, methods=["POST"]),
+            Route("/uapi/hashkey", self._hashkey, methods=["POST"]),
+            *(Route(path, self._endpoint, methods=["GET"]) for path in ENDPOINTS),
+            WebSocketRoute("/", self._realtime),
+        ])
+
+    @classmethod
+    def from_env(cls) -> "FakeKis":
+        """
+        Environment:
+            KIS_FAKE_LATENCY: 응답 지연(초) (default: 0)
+            KIS_FAKE_JITTER: 추가 지연의 최대값(초), 0~jitter 사이 무작위 (default: 0)
+            KIS_FAKE_RATE_LIMIT: appkey별 초당 허용 요청 수 (default: 0, 제한 없음)
+            KIS_FAKE_ERROR_RATE: 무작위 오류 비율 0~1 (default: 0)
+            KIS_FAKE_ERROR_CODE: 무작위 오류의 msg_cd (default: EGW00001)
+            KIS_FAKE_PAGES: 연속조회 엔드포인트의 전체 페이지 수 (default: 3)
+            KIS_FAKE_PAGE_SIZE: 페이지당 건수 (default: 20)
+            KIS_FAKE_SEED: 지연/오류 난수 시드 (default: 0)
+        """
+        return cls(
+            latency=float(os.environ.get("KIS_FAKE_LATENCY", 0)),
+            jitter=float(os.environ.get("KIS_FAKE_JITTER", 0)),
+            rate_limit=int(os.environ.get("KIS_FAKE_RATE_LIMIT", 0)),
+            error_rate=float(os.environ.get("KIS_FAKE_ERROR_RATE", 0)),
+            error_code=os.environ.get("KIS_FAKE_ERROR_CODE", DEFAULT_ERROR_CODE),
+            pages=int(os.environ.get("KIS_FAKE_PAGES", DEFAULT_PAGES)),
+            page_size=int(os.environ.get("KIS_FAKE_PAGE_SIZE", DEFAULT_PAGE_SIZE)),
+            seed=int(os.environ.get("KIS_FAKE_SEED", 0)),
+        )
+
+    def transport(self) -> httpx.AsyncBaseTransport:
+        """In-process transport for HttpPool.mount (no sockets)"""
+        return httpx.ASGITransport(app=self.app)
+
+    def fail(self, path: str, msg_cd: str = DEFAULT_ERROR_CODE, times: int = 1):
+        """
+        Make the next requests to path fail
+
+        Args:
+            path: API path (e.g. "/uapi/overseas-price/v1/quotations/price")
+            msg_cd: KIS message code to return (e.g. "EGW00201", "EGW00123", "OPSQ2001")
+            times: Number of consecutive requests to fail
+        """
+        self._failures.setdefault(path, deque()).extend([msg_cd] * times)
+
+    def expire_tokens(self):
+        """Invalidate every issued access token (the next request gets EGW00123)"""
+        self._tokens.clear()
+
+    def stats(self) -> dict:
+        return {"calls": dict(self.calls), "total": sum(self.calls.values()), "errors": dict(self.errors)}
+
+    async def _delay(self):
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0)
+        if delay:
+            await asyncio.sleep(delay)
+
+    def _error(self, msg_cd: str, tr_id: str = "") -> JSONResponse:
+        self.errors[msg_cd] += 1
+        # KIS는 게이트웨이 오류를 HTTP 500과 본문의 msg_cd로 함께 알려줌
+        return JSONResponse(
+            {"rt_cd": "1", "msg_cd": msg_cd, "msg1": ERROR_MESSAGES.get(msg_cd, "오류가 발생했습니다.")},
+            status_code=500 if msg_cd.startswith("EGW") else 200,
+            headers={"tr_id": tr_id, "tr_cont": ""},
+        )
+
+    def _rate_limited(self, appkey: str) -> bool:
+        if not self.rate_limit:
+            return False
+        now = time.monotonic()
+        window = self._windows.setdefault(appkey, deque())
+        while window and now - window[0] >= 1.0:
+            window.popleft()
+        if len(window) >= self.rate_limit:
+            return True
+        window.append(now)
+        return False
+
+    async def _token(self, request: Request) -> JSONResponse:
+        await self._delay()
+        self.calls[request.url.path] += 1
+        token = f"fake-token-{self.calls[request.url.path]}"
+        self._tokens.add(token)
+        expires = datetime.now() + timedelta(hours=24)
+        return JSONResponse({
+            "access_token": token,
+            "access_token_token_expired": expires.strftime("%Y-%m-%d %H:%M:%S"),
+            "token_type": "Bearer",
+            "expires_in": 86400,
+        })
+
+    async def _approval(self, request: Request) -> JSONResponse:
+        await self._delay()
+        self.calls[request.url.path] += 1
+        return JSONResponse({"approval_key": f"fake-approval-{self.calls[request.url.path]}"})
+
+    async def _hashkey(self, request: Request) -> JSONResponse:
+        await self._delay()
+        self.calls[request.url.path] += 1
+        body = await request.body()
+        return JSONResponse({"BODY": json.loads(body or b"{}"), "HASH": f"{zlib.crc32(body):08x}" * 8})
+
+    async def _endpoint(self, request: Request) -> JSONResponse:
+        path = request.url.path
+        tr_id = request.headers.get("tr_id", "")
+        self.calls[path] += 1
+        await self._delay()
+
+        if self._rate_limited(request.headers.get("appkey", "")):
+            return self._error(RATE_LIMIT_CODE, tr_id)
+        failures = self._failures.get(path)
+        if failures:
+            return self._error(failures.popleft(), tr_id)
+        if self.error_rate and self._random.random() < self.error_rate:
+            return self._error(self.error_code, tr_id)
+        authorization = request.headers.get("authorization", "")
+        if authorization.removeprefix("Bearer ") not in self._tokens:
+            return self._error("EGW00123", tr_id)
+
+        page = ENDPOINTS[path](dict(request.query_params), self)
+        body = {"rt_cd": "0", "msg_cd": "MCA00000", "msg1": SUCCESS_MSG, **page.body}
+        return JSONResponse(body, headers={"tr_id": tr_id, "tr_cont": "M" if page.more else "D"})
+
+    # -----------------------------------------------------------------------
+    # 실시간 (로컬 프로세스로 실행할 때만 사용 가능)
+    # -----------------------------------------------------------------------
+
+    def _frame(self, tr_id: str, key: str, tick: int) -> str:
+        symb = key[4:]
+        quote = _quote(symb)
+        last = float(quote["last"]) * (1 + random.Random(_seed(key, tick)).uniform(-0.001, 0.001))
+        now = datetime.now()
+        values = {
+            "rsym": key, "symb": symb, "zdiv": "4", "tymd": now.strftime("%Y%m%d"), "xymd": now.strftime("%Y%m%d"),
+            "xhms": now.strftime("%H%M%S"), "kymd": now.strftime("%Y%m%d"), "khms": now.strftime("%H%M%S"),
+            "open": quote["open"], "high": quote["high"], "low": quote["low"], "last": f"{last:.4f}",
+            "sign": quote["sign"], "diff": quote["diff"], "rate": quote["rate"], "pbid": f"{last - 0.01:.4f}",
+            "pask": f"{last + 0.01:.4f}", "vbid": "100", "vask": "100", "evol": "10", "tvol": quote["tvol"],
+            "tamt": quote["tamt"], "bivl": "0", "asvl": "0", "strn": "100.00", "mtyp": "1",
+            "bvol": "1000", "avol": "1000", "bdvl": "0", "advl": "0",
+        }
+        for n in range(1, 11):
+            values.update({
+                f"pbid{n}": f"{last - n * 0.01:.4f}", f"pask{n}": f"{last + n * 0.01:.4f}",
+                f"vbid{n}": "100", f"vask{n}": "100", f"dbid{n}": "0", f"dask{n}": "0",
+            })
+        return f"0|{tr_id}|001|" + "^".join(values[field] for field in FIELDS[tr_id])
+
+    async def _realtime(self, websocket: WebSocket):
+        await websocket.accept()
+        subscriptions: dict[tuple[str, str], asyncio.Task] = {}
+
+        async def stream(tr_id: str, key: str):
+            tick = 0
+            while True:
+                await websocket.send_text(self._frame(tr_id, key, tick))
+                tick += 1
+                await asyncio.sleep(self.tick_interval)
+
+        try:
+            while True:
+                message = json.loads(await websocket.receive_text())
+                header, body = message.get("header", {}), message.get("body", {}).get("input", {})
+                tr_id, key = body.get("tr_id", ""), body.get("tr_key", "")
+                self.calls[f"ws:{tr_id}"] += 1
+                subscribe = header.get("tr_type") == "1"
+                await websocket.send_text(json.dumps({
+                    "header": {"tr_id": tr_id, "tr_key": key, "encrypt": "N"},
+                    "body": {"rt_cd": "0", "msg_cd": "OPSP0000" if subscribe else "OPSP0001",
+                             "msg1": "SUBSCRIBE SUCCESS" if subscribe else "UNSUBSCRIBE SUCCESS"},
+                }))
+                if subscribe and tr_id in (TRADE_TR_ID, QUOTE_TR_ID) and (tr_id, key) not in subscriptions:
+                    subscriptions[(tr_id, key)] = asyncio.create_task(stream(tr_id, key))
+                elif not subscribe and (tr_id, key) in subscriptions:
+                    subscriptions.pop((tr_id, key)).cancel()
+        except WebSocketDisconnect:
+            pass
+        finally:
+            for task in subscriptions.values():
+                task.cancel()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local KIS Open API stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, help="응답 지연(초)")
+    parser.add_argument("--jitter", type=float, help="추가 무작위 지연의 최대값(초)")
+    parser.add_argument("--rate-limit", type=int, help="appkey별 초당 허용 요청 수")
+    parser.add_argument("--error-rate", type=float, help="무작위 오류 비율 (0~1)")
+    parser.add_argument("--pages", type=int, help="연속조회 엔드포인트의 전체 페이지 수")
+    args = parser.parse_args()
+
+    fake = FakeKis.from_env()
+    for name in ("latency", "jitter", "rate_limit", "error_rate", "pages"):
+        if getattr(args, name) is not None:
+            setattr(fake, name, getattr(args, name))
+
+    import uvicorn
+    uvicorn.run(fake.app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+from typing import Optional
+
+# 응답 상태 필드는 필드 목록과 관계없이 항상 유지
+STATUS_KEYS = ("rt_cd", "msg_cd", "msg1", "pages", "continuation")
+
+Outputs = dict[str, tuple[str, ...]]  # 출력 키 (output, output1 ...) -> 필드
+
+# 엔드포인트별 출력 필드 (KIS API 문서 기준)
+RANKING_SUMMARY = ("zdiv", "stat", "crec", "trec", "nrec")
+RANKING_ROW = ("rsym", "excd", "symb", "name", "ename", "last", "sign", "diff", "rate", "tvol", "pask", "pbid",
+               "e_ordyn", "rank")
+
+PRICE_OUTPUTS: Outputs = {
+    "output": ("rsym", "zdiv", "base", "pvol", "last", "sign", "diff", "rate", "tvol", "tamt", "ordy"),
+}
+PRICE_DETAIL_OUTPUTS: Outputs = {
+    "output": (
+        "rsym", "pvol", "open", "high", "low", "last", "base", "tomv", "pamt", "uplp", "dnlp", "h52p", "h52d",
+        "l52p", "l52d", "perx", "pbrx", "epsx", "bpsx", "shar", "mcap", "curr", "zdiv", "vnit", "t_xprc", "t_xdif",
+        "t_xrat", "p_xprc", "p_xdif", "p_xrat", "t_rate", "p_rate", "t_xsgn", "p_xsng", "e_ordyn", "e_hogau",
+        "e_icod", "e_parp", "tvol", "tamt", "etyp_nm",
+    ),
+}
+ASKING_PRICE_OUTPUTS: Outputs = {
+    "output1": (
+        "rsym", "zdiv", "curr", "base", "open", "high", "low", "last", "dymd", "dhms", "bvol", "avol", "bdvl",
+        "advl", "code", "ropen", "rhigh", "rlow", "rclose",
+    ),
+    "output2": tuple(
+        f"{side}{n}" for n in range(1, 11) for side in ("pbid", "pask", "vbid", "vask", "dbid", "dask")
+    ),
+    "output3": ("vstm", "vsmp", "vsqn"),
+}
+CCNL_OUTPUTS: Outputs = {
+    "output1": ("rsym", "zdiv", "nrec", "keyb"),
+    "output2": ("khms", "last", "sign", "diff", "rate", "evol", "tvol", "mtyp", "pbid", "pask", "vpow"),
+}
+TIME_ITEMCHARTPRICE_OUTPUTS: Outputs = {
+    "output1": ("rsym", "zdiv", "stim", "etim", "sktm", "ektm", "next", "more", "nrec"),
+    "output2": ("tymd", "xymd", "xhms", "kymd", "khms", "open", "high", "low", "last", "evol", "eamt"),
+}
+INDEX_SUMMARY = (
+    "ovrs_nmix_prdy_vrss", "prdy_vrss_sign", "prdy_ctrt", "ovrs_nmix_prdy_clpr", "acml_vol", "hts_kor_isnm",
+    "ovrs_nmix_prpr", "stck_shrn_iscd", "prdy_vol", "ovrs_prod_oprc", "ovrs_prod_hgpr", "ovrs_prod_lwpr",
+)
+TIME_INDEXCHARTPRICE_OUTPUTS: Outputs = {
+    "output1": INDEX_SUMMARY,
+    "output2": ("stck_bsop_date", "stck_cntg_hour", "optn_prpr", "optn_oprc", "optn_hgpr", "optn_lwpr", "cntg_vol"),
+}
+DAILYPRICE_OUTPUTS: Outputs = {
+    "output1": ("rsym", "zdiv", "nrec"),
+    "output2": ("xymd", "clos", "sign", "diff", "rate", "open", "high", "low", "tvol", "tamt", "pbid", "vbid",
+                "pask", "vask"),
+}
+DAILY_CHARTPRICE_OUTPUTS: Outputs = {
+    "output1": INDEX_SUMMARY,
+    "output2": ("stck_bsop_date", "ovrs_nmix_prpr", "ovrs_nmix_oprc", "ovrs_nmix_hgpr", "ovrs_nmix_lwpr",
+                "acml_vol", "mod_yn"),
+}
+SEARCH_OUTPUTS: Outputs = {
+    "output1": RANKING_SUMMARY,
+    "output2": ("rsym", "excd", "name", "ename", "symb", "last", "shar", "valx", "plow", "phigh", "popen", "tvol",
+                "tamt", "rate", "diff", "sign", "avol", "eps", "per", "eps_tr", "e_ordyn", "rank"),
+}
+INDUSTRY_THEME_OUTPUTS: Outputs = {
+    "output1": RANKING_SUMMARY,
+    "output2": ("rsym", "excd", "symb", "name", "ename", "last", "sign", "diff", "rate", "tvol", "vask", "pask",
+                "pbid", "vbid", "seqn", "e_ordyn"),
+}
+INDUSTRY_PRICE_OUTPUTS: Outputs = {"output1": ("nrec",), "output2": ("icod", "name")}
+SEARCH_INFO_OUTPUTS: Outputs = {
+    "output": (
+        "std_pdno", "prdt_eng_name", "natn_cd", "natn_name", "tr_mket_cd", "tr_mket_name", "ovrs_excg_cd",
+        "ovrs_excg_name", "tr_crcy_cd", "ovrs_papr", "crcy_name", "ovrs_stck_dvsn_cd", "prdt_clsf_cd",
+        "prdt_clsf_name", "sll_unit_qty", "buy_unit_qty", "tr_unit_amt", "lstg_stck_num", "lstg_dt",
+        "ovrs_stck_tr_stop_dvsn_cd", "lstg_abol_item_yn", "ovrs_stck_prdt_grp_no", "lstg_yn", "tax_levy_yn",
+        "ovrs_stck_erlm_rosn_cd", "ovrs_stck_hist_rght_dvsn_cd", "chng_bf_pdno", "prdt_type_cd_2",
+        "ovrs_item_name", "sedol_no", "blbg_tckr_text", "ovrs_stck_etf_risk_drtp_cd", "etp_chas_erng_rt_dbnb",
+        "istt_usge_isin_cd", "mint_svc_yn", "mint_svc_yn_chng_dt", "prdt_name", "lei_cd", "ovrs_stck_stop_rson_cd",
+        "lstg_abol_dt", "mini_stk_tr_stat_dvsn_cd", "mint_frst_svc_erlm_dt", "mint_dcpt_trad_psbl_yn",
+        "mint_fnum_trad_psbl_yn", "mint_cblc_cvsn_ipsb_yn", "ptp_item_yn", "ptp_item_trfx_exmt_yn",
+        "ptp_item_trfx_exmt_strt_dt", "ptp_item_trfx_exmt_end_dt", "dtm_tr_psbl_yn", "sdrf_stop_ecls_yn",
+        "sdrf_stop_ecls_erlm_dt",
+    ),
+}
+PERIOD_RIGHTS_OUTPUTS: Outputs = {
+    "output": (
+        "bass_dt", "rght_type_cd", "pdno", "prdt_name", "prdt_type_cd", "std_pdno", "acpl_bass_dt", "sbsc_strt_dt",
+        "sbsc_end_dt", "cash_alct_rt", "stck_alct_rt", "crcy_cd", "crcy_cd2", "crcy_cd3", "crcy_cd4",
+        "alct_frcr_unpr", "stkp_dvdn_frcr_amt2", "stkp_dvdn_frcr_amt3", "stkp_dvdn_frcr_amt4", "dfnt_yn",
+    ),
+}
+NEWS_TITLE_OUTPUTS: Outputs = {
+    "outblock1": ("info_gb", "news_key", "data_dt", "data_tm", "class_cd", "class_name", "source", "nation_cd",
+                  "exchange_cd", "symb", "symb_name", "title"),
+}
+BRKNEWS_TITLE_OUTPUTS: Outputs = {
+    "output": (
+        "cntt_usiq_srno", "news_ofer_entp_code", "data_dt", "data_tm", "hts_pbnt_titl_cntt", "news_lrdv_code",
+        "dorg", *(f"iscd{n}" for n in range(1, 11)), *(f"kor_isnm{n}" for n in range(1, 11)),
+    ),
+}
+
+
+def ranking_outputs(*fields: str) -> Outputs:
+    """
+    Args:
+        fields: Row fields of a ranking endpoint besides the ones every ranking returns
+
+    Returns:
+        Outputs: Output fields of the ranking endpoint
+    """
+    return {"output1": RANKING_SUMMARY, "output2": RANKING_ROW + fields}
+
+
+def _output_fields(value) -> Optional[list[str]]:
+    if isinstance(value, dict):
+        return list(value)
+    if isinstance(value, list) and value and isinstance(value[0], dict):
+        return list(value[0])
+    return None
+
+
+class FieldCatalogue:
+    """
+    Output fields returned by each endpoint
+
+    엔드포인트 레지스트리에 선언된 tr_id별 출력 필드(output, output1, output2 ...)로 시작하며,
+    실제 응답에서 문서에 없는 필드가 오면 추가로 기록합니다.
+    선언된 tr_id는 첫 요청 전부터 fields 인자를 검증할 수 있습니다.
+    """
+
+    def __init__(self, declared: Optional[dict[str, Outputs]] = None):
+        """
+        Args:
+            declared: tr_id -> output fields declared in the endpoint registry
+        """
+        self._fields: dict[str, dict[str, list[str]]] = {  # tr_id -> output key -> fields
+            tr_id: {key: list(fields) for key, fields in outputs.items()}
+            for tr_id, outputs in (declared or {}).items()
+        }
+
+    def record(self, tr_id: str, body: dict):
+        """
+        Args:
+            tr_id: Transaction ID of the response
+            body: Decoded KIS response
+        """
+        outputs = self._fields.setdefault(tr_id, {})
+        for key, value in body.items():
+            if key in STATUS_KEYS:
+                continue
+            fields = _output_fields(value)
+            if fields is None:
+                continue
+            known = outputs.setdefault(key, [])
+            known.extend(field for field in fields if field not in known)
+
+    def fields(self, tr_id: str) -> Optional[set[str]]:
+        """
+        Returns:
+            Optional[set[str]]: Every output field seen for tr_id, or None if none was recorded yet
+        """
+        outputs = self._fields.get(tr_id)
+        if not outputs:
+            return None
+        return {field for fields in outputs.values() for field in fields}
+
+    def validate(self, tr_id: str, fields: Optional[list[str]]):
+        """
+        Raises:
+            ValueError: If fields contains a name the endpoint does not return, or the endpoint declares no fields
+        """
+        if not fields:
+            return
+        known = self.fields(tr_id)
+        if known is None:
+            # 검증할 수 없는 필드를 project()가 조용히 버리지 않도록 거부
+            raise ValueError(f"Output fields of {tr_id} are not declared, omit fields to get the full response")
+        unknown = [field for field in fields if field not in known]
+        if unknown:
+            raise ValueError(f"Unknown fields {unknown} for {tr_id} (available: {', '.join(sorted(known))})")
+
+    def snapshot(self) -> dict:
+        return {tr_id: {key: list(fields) for key, fields in outputs.items()} for tr_id, outputs in self._fields.items()}
+
+
+def project(body: dict, fields: list[str]) -> dict:
+    """
+    Keep only the requested fields in each output of a KIS response
+
+    요청한 필드가 하나도 없는 출력은 응답에서 제외합니다.
+
+    Args:
+        body: KIS response (shared, not mutated)
+        fields: Output field names to keep
+
+    Returns:
+        dict: Projected copy of body
+    """
+    wanted = set(fields)
+    projected = {}
+    for key, value in body.items():
+        if key in STATUS_KEYS:
+            projected[key] = value
+        elif isinstance(value, dict):
+            kept = {field: item for field, item in value.items() if field in wanted}
+            if kept:
+                projected[key] = kept
+        elif isinstance(value, list) and value and isinstance(value[0], dict):
+            names = [field for field in value[0] if field in wanted]
+            if names:
+                projected[key] = [{field: row.get(field, "") for field in names} for row in value]
+        else:
+            projected[key] = value
+    return projected
@@ -0,0 +1,135 @@
+import asyncio
+import importlib.util
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import httpx
+
+logger = logging.getLogger("mcp-server")
+
+# Pool defaults (환경변수로 재정의 가능)
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_KEEPALIVE = 10
+DEFAULT_KEEPALIVE_EXPIRY = 30.0  # seconds
+DEFAULT_TIMEOUT = 10.0  # seconds
+
+
+class HttpPool:
+    """Process-wide pool of httpx clients, one per KIS domain (실전/모의)"""
+
+    def __init__(
+        self,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive: int = DEFAULT_MAX_KEEPALIVE,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        timeout: float = DEFAULT_TIMEOUT,
+        http2: bool = False,
+    ):
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("KIS_HTTP2 is enabled but 'h2' is not installed, falling back to HTTP/1.1")
+            http2 = False
+
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.timeout = httpx.Timeout(timeout)
+        self.http2 = http2
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._transport: Optional[httpx.AsyncBaseTransport] = None
+        self._users = 0
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def from_env(cls) -> "HttpPool":
+        """
+        Build a pool from environment variables
+
+        Environment:
+            KIS_HTTP_MAX_CONNECTIONS: 도메인별 최대 동시 연결 수 (default: 20)
+            KIS_HTTP_MAX_KEEPALIVE: 유지할 keep-alive 연결 수 (default: 10)
+            KIS_HTTP_KEEPALIVE_EXPIRY: keep-alive 연결 유지 시간(초) (default: 30)
+            KIS_HTTP_TIMEOUT: 요청 타임아웃(초) (default: 10)
+            KIS_HTTP2: "true"이면 HTTP/2 사용 (h2 패키지 필요)
+        """
+        return cls(
+            max_connections=int(os.environ.get("KIS_HTTP_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS)),
+            max_keepalive=int(os.environ.get("KIS_HTTP_MAX_KEEPALIVE", DEFAULT_MAX_KEEPALIVE)),
+            keepalive_expiry=float(os.environ.get("KIS_HTTP_KEEPALIVE_EXPIRY", DEFAULT_KEEPALIVE_EXPIRY)),
+            timeout=float(os.environ.get("KIS_HTTP_TIMEOUT", DEFAULT_TIMEOUT)),
+            http2=os.environ.get("KIS_HTTP2", "false").lower() in ("1", "true", "yes"),
+        )
+
+    def get_client(self, domain: str) -> httpx.AsyncClient:
+        """
+        Get the shared client for the given domain, creating it on first use
+
+        Args:
+            domain: Base URL (e.g. DOMAIN, VIRTUAL_DOMAIN)
+
+        Returns:
+            httpx.AsyncClient: Pooled client bound to the domain
+        """
+        client = self._clients.get(domain)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                base_url=domain,
+                limits=self.limits,
+                timeout=self.timeout,
+                http2=self.http2,
+                transport=self._transport,
+            )
+            self._clients[domain] = client
+            logger.debug(f"Opened HTTP pool for {domain} (http2={self.http2})")
+        return client
+
+    def mount(self, transport: Optional[httpx.AsyncBaseTransport]):
+        """
+        Route the pooled clients through transport instead of the network
+
+        서버 시작 전(첫 요청 전)에 호출해야 합니다.
+
+        Args:
+            transport: Transport replacing the network (e.g. FakeKis.transport()), None to restore it
+        """
+        self._transport = transport
+
+    async def aclose(self):
+        """Close every pooled client"""
+        clients, self._clients = self._clients, {}
+        for domain, client in clients.items():
+            await client.aclose()
+            logger.debug(f"Closed HTTP pool for {domain}")
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator["HttpPool"]:
+        """
+        Keep the pool open while at least one server lifespan is active
+
+        FastMCP enters the lifespan once per run (and once per session on HTTP
+        transports), so the pool is reference counted and only closed when the
+        last user leaves.
+        """
+        async with self._lock:
+            self._users += 1
+        try:
+            yield self
+        finally:
+            async with self._lock:
+                self._users -= 1
+                if self._users == 0:
+                    await self.aclose()
+
+
+_default_pool: Optional[HttpPool] = None
+
+
+def get_pool() -> HttpPool:
+    """Return the process-wide pool, building it from the environment on first call"""
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = HttpPool.from_env()
+    return _default_pool
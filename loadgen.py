@@ -0,0 +1,181 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+
+# 부하 테스트는 로컬 KIS 대체 서버를 사용하며 분봉 저장은 끄고 시작
+os.environ.setdefault("KIS_APP_KEY", "loadgen-appkey")
+os.environ.setdefault("KIS_APP_SECRET", "loadgen-appsecret")
+os.environ.setdefault("KIS_BAR_STORE", "off")
+
+from mcp.shared.memory import create_connected_server_and_client_session
+
+import server
+from fake_kis import FakeKis
+from http_pool import get_pool
+
+DEFAULT_CLIENTS = 10
+DEFAULT_DURATION = 10.0  # seconds
+DEFAULT_MIX = "price=6,dailyprice=2,trade-vol=1,inquire-time-itemchartprice=1"
+DEFAULT_SYMBOLS = "NAS:AAPL,NAS:MSFT,NAS:NVDA,NAS:AMZN,NAS:GOOGL,NAS:META,NAS:TSLA,NYS:KO,NYS:JPM,NYS:V"
+PERCENTILES = (50, 95, 99)
+
+
+def tool_arguments(tool: str, excd: str, symb: str) -> dict:
+    """Arguments of one call of a tool in the mix"""
+    if tool == "price":
+        return {"auth": "", "excd": excd, "symb": symb}
+    if tool == "dailyprice":
+        return {"auth": "", "excd": excd, "symb": symb, "gubn": "0", "bymd": "", "modp": "1"}
+    if tool == "trade-vol":
+        return {"excd": excd, "nday": "0", "vol_rang": "0"}
+    if tool == "inquire-time-itemchartprice":
+        return {"auth": "", "excd": excd, "symb": symb, "nmin": "1", "pinc": "0", "next": "",
+                "nrec": "120", "fill": "", "keyb": ""}
+    raise ValueError(f"Unsupported tool in mix: {tool}")
+
+
+def parse_mix(mix: str) -> dict[str, float]:
+    """
+    Args:
+        mix: "tool=weight,..." (e.g. "price=6,dailyprice=2")
+
+    Returns:
+        dict[str, float]: Tool name -> relative weight
+    """
+    weights = {}
+    for item in mix.split(","):
+        tool, _, weight = item.strip().partition("=")
+        tool_arguments(tool, "NAS", "AAPL")
+        weights[tool] = float(weight or 1)
+    return weights
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """Nearest-rank percentile of sorted samples"""
+    if not samples:
+        return 0.0
+    index = min(len(samples) - 1, max(0, round(q / 100 * len(samples) + 0.5) - 1))
+    return samples[index]
+
+
+class LoadGenerator:
+    """N concurrent MCP client sessions calling a weighted mix of tools"""
+
+    def __init__(self, clients: int, duration: float, mix: dict[str, float], symbols: list[str], seed: int = 0):
+        self.clients = clients
+        self.duration = duration
+        self.mix = mix
+        self.symbols = [symbol.split(":", 1) for symbol in symbols]
+        self.seed = seed
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: Counter = Counter()
+
+    async def _client(self, index: int, deadline: float):
+        rng = random.Random(self.seed + index)
+        tools, weights = list(self.mix), list(self.mix.values())
+        async with create_connected_server_and_client_session(server.mcp) as session:
+            while time.monotonic() < deadline:
+                tool = rng.choices(tools, weights)[0]
+                excd, symb = rng.choice(self.symbols)
+                started = time.perf_counter()
+                try:
+                    result = await session.call_tool(tool, tool_arguments(tool, excd, symb))
+                    failed = result.isError
+                except Exception:
+                    failed = True
+                self.latencies[tool].append(time.perf_counter() - started)
+                if failed:
+                    self.errors[tool] += 1
+
+    async def run(self) -> float:
+        """
+        Returns:
+            float: Elapsed seconds
+        """
+        started = time.monotonic()
+        deadline = started + self.duration
+        await asyncio.gather(*(self._client(index, deadline) for index in range(self.clients)))
+        return time.monotonic() - started
+
+    def report(self, elapsed: float, upstream: dict) -> dict:
+        def summary(samples: list[float], errors: int) -> dict:
+            samples = sorted(samples)
+            return {
+                "calls": len(samples),
+                "errors": errors,
+                "error_rate": errors / len(samples) if samples else 0.0,
+                "throughput": len(samples) / elapsed,
+                **{f"p{q}_ms": percentile(samples, q) * 1000 for q in PERCENTILES},
+                "max_ms": samples[-1] * 1000 if samples else 0.0,
+            }
+
+        every = [latency for samples in self.latencies.values() for latency in samples]
+        return {
+            "clients": self.clients,
+            "elapsed": elapsed,
+            "total": summary(every, sum(self.errors.values())),
+            "tools": {tool: summary(samples, self.errors[tool]) for tool, samples in self.latencies.items()},
+            "upstream": upstream,
+            "cache": server.response_cache.stats(),
+            "negative_cache": server.negative_cache.stats(),
+            "rate_limits": server.rate_limiter.stats(),
+        }
+
+
+def print_report(report: dict):
+    total = report["total"]
+    print(f"\n{report['clients']} clients, {report['elapsed']:.1f}s: {total['calls']} calls, "
+          f"{total['throughput']:.1f} calls/s, {total['error_rate']:.1%} errors, "
+          f"{report['upstream']['total']} upstream requests", file=sys.stderr)
+    print(f"{'tool':32s} {'calls':>7s} {'calls/s':>8s} {'err%':>6s} {'p50':>9s} {'p95':>9s} {'p99':>9s} {'max':>9s}",
+          file=sys.stderr)
+    for tool, row in [*report["tools"].items(), ("(all)", total)]:
+        print(f"{tool:32s} {row['calls']:7d} {row['throughput']:8.1f} {row['error_rate'] * 100:6.1f} "
+              f"{row['p50_ms']:8.1f}m {row['p95_ms']:8.1f}m {row['p99_ms']:8.1f}m {row['max_ms']:8.1f}m", file=sys.stderr)
+
+
+async def run_load(args) -> dict:
+    fake = FakeKis(latency=args.latency, jitter=args.jitter, rate_limit=args.upstream_rate_limit, seed=args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        # 부하 테스트가 token.json을 덮어쓰지 않도록 임시 파일 사용
+        server.TOKEN_FILE = Path(tmp) / "token.json"
+        get_pool().mount(fake.transport())
+        server.response_cache.enabled = not args.no_cache
+        server.negative_cache.enabled = not args.no_cache
+        generator = LoadGenerator(
+            args.clients, args.duration, parse_mix(args.mix), args.symbols.split(","), seed=args.seed,
+        )
+        async with server.lifespan(server.mcp):
+            elapsed = await generator.run()
+        return generator.report(elapsed, fake.stats())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent MCP client load generator (against FakeKis)")
+    parser.add_argument("-c", "--clients", type=int, default=DEFAULT_CLIENTS, help="동시 MCP 클라이언트 수")
+    parser.add_argument("-d", "--duration", type=float, default=DEFAULT_DURATION, help="실행 시간(초)")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="도구별 호출 비중 (tool=weight,...)")
+    parser.add_argument("--symbols", default=DEFAULT_SYMBOLS, help="호출에 사용할 종목 (EXCD:SYMB,...)")
+    parser.add_argument("--latency", type=float, default=0.05, help="KIS 응답 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.02, help="추가 무작위 지연의 최대값(초)")
+    parser.add_argument("--upstream-rate-limit", type=int, default=20, help="KIS 측 초당 허용 요청 수 (0: 제한 없음)")
+    parser.add_argument("--no-cache", action="store_true", help="응답 캐시를 끄고 모든 호출을 KIS로 전달")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="결과를 저장할 JSON 파일")
+    args = parser.parse_args()
+
+    report = asyncio.run(run_load(args))
+    print_report(report)
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
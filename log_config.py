@@ -0,0 +1,100 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+from datetime import datetime
+from typing import Optional
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+DEFAULT_LEVEL = "INFO"
+# 요청마다 DEBUG 로그를 남기는 라이브러리는 기본적으로 WARNING 이상만 출력
+DEFAULT_LOGGER_LEVELS = {"httpx": "WARNING", "httpcore": "WARNING", "hpack": "WARNING"}
+# LogRecord에 extra로 전달되면 JSON 로그에 포함하는 필드
+STRUCTURED_FIELDS = ("tool", "tr_id", "api_url", "latency_ms", "msg_cd", "attempt")
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line with the structured fields passed as extra"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for field in STRUCTURED_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def parse_levels(spec: str) -> dict[str, str]:
+    """
+    Args:
+        spec: "logger=LEVEL,..." (e.g. "httpx=INFO,mcp=WARNING")
+
+    Returns:
+        dict[str, str]: Logger name -> level name
+    """
+    levels = {}
+    for item in spec.split(","):
+        if "=" in item:
+            name, level = item.split("=", 1)
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def configure_logging():
+    """
+    Route every log record through a queue drained by a background thread
+
+    이벤트 루프에서는 레코드를 큐에 넣기만 하고, stderr/파일 출력은 QueueListener 스레드에서 수행합니다.
+    stdout은 MCP stdio 전송에 사용되므로 콘솔 출력은 stderr로 보냅니다.
+
+    Environment:
+        KIS_LOG_LEVEL: 기본 로그 레벨 (default: INFO)
+        KIS_LOG_LEVELS: 로거별 레벨 재정의 (예: "httpx=INFO,mcp=WARNING", default: httpx/httpcore WARNING)
+        KIS_LOG_FORMAT: text 또는 json (JSON lines) (default: text)
+        KIS_LOG_FILE: 지정하면 stderr 대신 이 파일에 기록
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    if os.environ.get("KIS_LOG_FORMAT", "text").lower() == "json":
+        formatter: logging.Formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(TEXT_FORMAT)
+    path = os.environ.get("KIS_LOG_FILE")
+    output = logging.FileHandler(path, encoding="utf-8") if path else logging.StreamHandler(sys.stderr)
+    output.setFormatter(formatter)
+
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(records))
+    root.setLevel(os.environ.get("KIS_LOG_LEVEL", DEFAULT_LEVEL).upper())
+    for name, level in {**DEFAULT_LOGGER_LEVELS, **parse_levels(os.environ.get("KIS_LOG_LEVELS", ""))}.items():
+        logging.getLogger(name).setLevel(level)
+
+    _listener = logging.handlers.QueueListener(records, output, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+
+
+def stop_logging():
+    """Flush queued records and stop the background thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,275 @@
+import asyncio
+import logging
+import os
+from bisect import bisect_left
+from collections import Counter
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Optional
+
+logger = logging.getLogger("mcp-server")
+
+# 지연 시간 히스토그램 버킷 상한 (초)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# KIS 요청 1건의 구간: 요청 제한 대기, 토큰 조회, 네트워크 왕복, 응답 디코딩/검사
+PHASES = ("queue", "token", "network", "parse")
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram (Prometheus style)"""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막 칸은 +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile (0 < q < 1)"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "avg": round(self.sum / self.count, 6) if self.count else 0.0,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+
+class ToolMetrics:
+    __slots__ = ("calls", "errors", "latency")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.latency = Histogram()
+
+
+class EndpointMetrics:
+    __slots__ = ("requests", "errors", "bytes", "phases")
+
+    def __init__(self):
+        self.requests = 0
+        self.errors: Counter = Counter()  # msg_cd (또는 오류 종류) -> 건수
+        self.bytes = 0
+        self.phases = {phase: Histogram() for phase in PHASES}
+
+
+class MetricsRegistry:
+    """
+    Per-tool and per-tr_id counters and latency histograms
+
+    도구별 호출 수/오류 수/지연 시간과 tr_id별 KIS 요청 수, msg_cd별 오류 수, 구간별 지연 시간
+    (queue/token/network/parse), 수신 bytes를 기록합니다.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._tools: dict[str, ToolMetrics] = {}
+        self._endpoints: dict[str, EndpointMetrics] = {}
+
+    @classmethod
+    def from_env(cls) -> "MetricsRegistry":
+        """
+        Environment:
+            KIS_METRICS: "false"이면 지표 수집 비활성화 (default: true)
+        """
+        return cls(enabled=os.environ.get("KIS_METRICS", "true").lower() not in ("0", "false", "no", "off"))
+
+    def record_tool(self, tool: str, seconds: float, error: bool = False):
+        if not self.enabled:
+            return
+        metrics = self._tools.get(tool)
+        if metrics is None:
+            metrics = self._tools[tool] = ToolMetrics()
+        metrics.calls += 1
+        metrics.errors += error
+        metrics.latency.observe(seconds)
+
+    def record_request(self, tr_id: str, phases: dict[str, float], nbytes: int = 0, error: str = ""):
+        """
+        Args:
+            tr_id: Transaction ID of the request
+            phases: Seconds spent per phase (keys of PHASES)
+            nbytes: Size of the response body
+            error: msg_cd (or error kind) if the attempt failed
+        """
+        if not self.enabled:
+            return
+        metrics = self._endpoints.get(tr_id)
+        if metrics is None:
+            metrics = self._endpoints[tr_id] = EndpointMetrics()
+        metrics.requests += 1
+        metrics.bytes += nbytes
+        if error:
+            metrics.errors[error] += 1
+        for phase, seconds in phases.items():
+            metrics.phases[phase].observe(seconds)
+
+    def snapshot(self, cache: Optional[dict] = None) -> dict:
+        """
+        Args:
+            cache: ResponseCache.stats(), merged in as per-tr_id hit ratios
+        """
+        by_tr_id = (cache or {}).get("by_tr_id", {})
+        endpoints = {}
+        for tr_id, metrics in self._endpoints.items():
+            hits, misses = by_tr_id.get(tr_id, {}).get("hits", 0), by_tr_id.get(tr_id, {}).get("misses", 0)
+            endpoints[tr_id] = {
+                "requests": metrics.requests,
+                "errors": dict(metrics.errors),
+                "bytes": metrics.bytes,
+                "cache_hit_ratio": hits / (hits + misses) if hits + misses else None,
+                "phases": {phase: histogram.snapshot() for phase, histogram in metrics.phases.items()},
+            }
+        return {
+            "enabled": self.enabled,
+            "tools": {
+                tool: {"calls": metrics.calls, "errors": metrics.errors, "latency": metrics.latency.snapshot()}
+                for tool, metrics in self._tools.items()
+            },
+            "endpoints": endpoints,
+            "cache": {key: value for key, value in (cache or {}).items() if key != "by_tr_id"},
+        }
+
+    def prometheus(self, cache: Optional[dict] = None) -> str:
+        """
+        Render the registry in the Prometheus text exposition format
+
+        Args:
+            cache: ResponseCache.stats(), exported as per-tr_id hit/miss counters
+        """
+        lines = []
+
+        def header(name: str, kind: str, help_text: str):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        def histogram(name: str, labels: str, value: Histogram):
+            cumulative = 0
+            for bound, count in zip(value.buckets, value.counts):
+                cumulative += count
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {value.count}')
+            lines.append(f"{name}_sum{{{labels}}} {value.sum}")
+            lines.append(f"{name}_count{{{labels}}} {value.count}")
+
+        header("kis_tool_calls_total", "counter", "MCP tool calls")
+        for tool, metrics in self._tools.items():
+            lines.append(f'kis_tool_calls_total{{tool="{tool}"}} {metrics.calls}')
+        header("kis_tool_errors_total", "counter", "MCP tool calls that raised an error")
+        for tool, metrics in self._tools.items():
+            lines.append(f'kis_tool_errors_total{{tool="{tool}"}} {metrics.errors}')
+        header("kis_tool_latency_seconds", "histogram", "MCP tool call latency")
+        for tool, metrics in self._tools.items():
+            histogram("kis_tool_latency_seconds", f'tool="{tool}"', metrics.latency)
+
+        header("kis_requests_total", "counter", "KIS API requests sent (including retries)")
+        for tr_id, metrics in self._endpoints.items():
+            lines.append(f'kis_requests_total{{tr_id="{tr_id}"}} {metrics.requests}')
+        header("kis_request_errors_total", "counter", "Failed KIS API requests by msg_cd")
+        for tr_id, metrics in self._endpoints.items():
+            for error, count in metrics.errors.items():
+                lines.append(f'kis_request_errors_total{{tr_id="{tr_id}",msg_cd="{error}"}} {count}')
+        header("kis_response_bytes_total", "counter", "Bytes received from KIS")
+        for tr_id, metrics in self._endpoints.items():
+            lines.append(f'kis_response_bytes_total{{tr_id="{tr_id}"}} {metrics.bytes}')
+        header("kis_request_phase_seconds", "histogram", "Time per KIS request phase (queue, token, network, parse)")
+        for tr_id, metrics in self._endpoints.items():
+            for phase, value in metrics.phases.items():
+                histogram("kis_request_phase_seconds", f'tr_id="{tr_id}",phase="{phase}"', value)
+
+        by_tr_id = (cache or {}).get("by_tr_id", {})
+        header("kis_cache_lookups_total", "counter", "Response cache lookups by result")
+        for tr_id, counts in by_tr_id.items():
+            lines.append(f'kis_cache_lookups_total{{tr_id="{tr_id}",result="hit"}} {counts["hits"]}')
+            lines.append(f'kis_cache_lookups_total{{tr_id="{tr_id}",result="miss"}} {counts["misses"]}')
+        return "\n".join(lines) + "\n"
+
+
+class PrometheusExporter:
+    """
+    Minimal HTTP endpoint serving /metrics for stdio deployments
+
+    stdio 전송에는 HTTP 서버가 없으므로 KIS_METRICS_PORT가 설정된 경우 별도 포트에서 지표를 제공합니다.
+    """
+
+    def __init__(self, render: Callable[[], str], port: int = 0, host: str = "127.0.0.1"):
+        """
+        Args:
+            render: Function returning the exposition text
+            port: TCP port to listen on (0: disabled)
+            host: Interface to bind
+        """
+        self.render = render
+        self.port = port
+        self.host = host
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._users = 0
+
+    @classmethod
+    def from_env(cls, render: Callable[[], str]) -> "PrometheusExporter":
+        """
+        Environment:
+            KIS_METRICS_PORT: Prometheus 지표를 제공할 포트 (default: 0, 비활성화)
+            KIS_METRICS_HOST: 바인딩할 주소 (default: 127.0.0.1)
+        """
+        return cls(
+            render,
+            port=int(os.environ.get("KIS_METRICS_PORT", 0)),
+            host=os.environ.get("KIS_METRICS_HOST", "127.0.0.1"),
+        )
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request_line = await reader.readline()
+            while (await reader.readline()).strip():
+                pass
+            path = request_line.split()[1].decode() if len(request_line.split()) > 1 else "/"
+            if path.split("?")[0] == "/metrics":
+                status, body = "200 OK", self.render().encode()
+            else:
+                status, body = "404 Not Found", b"not found\n"
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body
+            )
+            await writer.drain()
+        finally:
+            writer.close()
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator["PrometheusExporter"]:
+        """Listen while at least one server lifespan is active"""
+        if not self.port:
+            yield self
+            return
+        self._users += 1
+        try:
+            if self._server is None:
+                self._server = await asyncio.start_server(self._handle, self.host, self.port)
+                logger.info(f"Serving Prometheus metrics on http://{self.host}:{self.port}/metrics")
+            yield self
+        finally:
+            self._users -= 1
+            if self._users == 0 and self._server is not None:
+                self._server.close()
+                await self._server.wait_closed()
+                self._server = None
@@ -0,0 +1,211 @@
+import math
+import os
+import time
+from array import array
+from typing import Optional
+
+from realtime import QUOTE_TR_ID
+
+# 종목별로 보관하는 최대 호가 단계 수
+LEVELS = 10
+# 이 시간(초) 동안 호가 갱신이 없으면 REST 스냅샷으로 대체
+DEFAULT_MAX_AGE = 10.0
+
+REALTIME_MSG = "실시간 호가 데이터에서 조회되었습니다"
+
+# OrderBook.summary()가 반환하는 필드
+SUMMARY_FIELDS = ("bid", "ask", "bid_qty", "ask_qty", "spread", "mid", "spread_bps", "imbalance", "depth")
+
+
+def _number(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _volume(value) -> int:
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return 0
+
+
+class OrderBook:
+    """
+    Order book of one symbol held in fixed-size level arrays
+
+    호가 가격은 array('d'), 잔량은 array('q')에 단계별로 저장하며, 갱신 시 새 객체를 만들지 않고
+    해당 단계 값만 덮어씁니다.
+    """
+
+    __slots__ = (
+        "bid_px", "ask_px", "bid_qty", "ask_qty", "bid_diff", "ask_diff",
+        "depth", "zdiv", "bvol", "avol", "bdvl", "advl", "xymd", "xhms", "updated_at", "updates",
+    )
+
+    def __init__(self, levels: int = LEVELS):
+        self.bid_px = array("d", [math.nan]) * levels
+        self.ask_px = array("d", [math.nan]) * levels
+        self.bid_qty = array("q", [0]) * levels
+        self.ask_qty = array("q", [0]) * levels
+        self.bid_diff = array("q", [0]) * levels
+        self.ask_diff = array("q", [0]) * levels
+        self.depth = 0
+        self.zdiv = 4
+        self.bvol = self.avol = self.bdvl = self.advl = 0
+        self.xymd = self.xhms = ""
+        self.updated_at = 0.0
+        self.updates = 0
+
+    def apply(self, record: dict):
+        """
+        Overwrite the levels present in a realtime or REST record
+
+        Args:
+            record: Fields such as pbid1, pask1, vbid1, vask1, dbid1, dask1 ... and bvol, avol
+        """
+        depth = 0
+        for level in range(len(self.bid_px)):
+            n = level + 1
+            bid = record.get(f"pbid{n}")
+            if bid is None:
+                break
+            self.bid_px[level] = _number(bid)
+            self.ask_px[level] = _number(record.get(f"pask{n}"))
+            self.bid_qty[level] = _volume(record.get(f"vbid{n}"))
+            self.ask_qty[level] = _volume(record.get(f"vask{n}"))
+            self.bid_diff[level] = _volume(record.get(f"dbid{n}"))
+            self.ask_diff[level] = _volume(record.get(f"dask{n}"))
+            depth = n
+        self.depth = depth
+        if record.get("zdiv", "").isdigit():
+            self.zdiv = int(record["zdiv"])
+        self.bvol = _volume(record.get("bvol"))
+        self.avol = _volume(record.get("avol"))
+        self.bdvl = _volume(record.get("bdvl"))
+        self.advl = _volume(record.get("advl"))
+        self.xymd = record.get("xymd", record.get("dymd", ""))
+        self.xhms = record.get("xhms", record.get("dhms", ""))
+        self.updated_at = time.monotonic()
+        self.updates += 1
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.updated_at
+
+    def spread(self) -> float:
+        # 호가 단위 이하의 부동소수점 오차 제거
+        return round(self.ask_px[0] - self.bid_px[0], self.zdiv) if self.depth else math.nan
+
+    def mid(self) -> float:
+        return (self.ask_px[0] + self.bid_px[0]) / 2 if self.depth else math.nan
+
+    def imbalance(self, levels: int = 0) -> float:
+        """
+        (bid volume - ask volume) / (bid volume + ask volume) over the top levels
+
+        Args:
+            levels: Number of levels to include (0: every populated level)
+        """
+        n = min(levels or self.depth, self.depth)
+        bid = sum(self.bid_qty[:n])
+        ask = sum(self.ask_qty[:n])
+        return (bid - ask) / (bid + ask) if bid + ask else math.nan
+
+    def summary(self) -> dict:
+        spread, mid = self.spread(), self.mid()
+        values = {
+            "bid": self.bid_px[0] if self.depth else math.nan,
+            "ask": self.ask_px[0] if self.depth else math.nan,
+            "bid_qty": self.bid_qty[0] if self.depth else 0,
+            "ask_qty": self.ask_qty[0] if self.depth else 0,
+            "spread": spread,
+            "mid": mid,
+            "spread_bps": spread / mid * 10000 if mid else math.nan,
+            "imbalance": self.imbalance(),
+            "depth": self.depth,
+        }
+        # JSON에는 NaN이 없으므로 null로 변환
+        return {key: None if isinstance(value, float) and math.isnan(value) else value for key, value in values.items()}
+
+    def to_response(self, rsym: str) -> dict:
+        """
+        Format the book like the inquire-asking-price response (output1, output2)
+        """
+        price = f"{{:.{self.zdiv}f}}".format
+        output2 = {}
+        for level in range(self.depth):
+            n = level + 1
+            output2[f"pbid{n}"] = price(self.bid_px[level])
+            output2[f"pask{n}"] = price(self.ask_px[level])
+            output2[f"vbid{n}"] = str(self.bid_qty[level])
+            output2[f"vask{n}"] = str(self.ask_qty[level])
+            output2[f"dbid{n}"] = str(self.bid_diff[level])
+            output2[f"dask{n}"] = str(self.ask_diff[level])
+        return {
+            "rt_cd": "0",
+            "msg_cd": "",
+            "msg1": REALTIME_MSG,
+            "output1": {
+                "rsym": rsym,
+                "zdiv": str(self.zdiv),
+                "dymd": self.xymd,
+                "dhms": self.xhms,
+                "bvol": str(self.bvol),
+                "avol": str(self.avol),
+                "bdvl": str(self.bdvl),
+                "advl": str(self.advl),
+            },
+            "output2": output2,
+        }
+
+
+class OrderBookEngine:
+    """Order books of subscribed symbols, fed by the realtime asking-price stream"""
+
+    def __init__(self, max_age: float = DEFAULT_MAX_AGE):
+        self.max_age = max_age
+        self._books: dict[str, OrderBook] = {}
+
+    @classmethod
+    def from_env(cls) -> "OrderBookEngine":
+        """
+        Environment:
+            KIS_ORDERBOOK_MAX_AGE: 호가 갱신이 없을 때 메모리 호가를 사용하는 최대 시간(초) (default: 10)
+        """
+        return cls(max_age=float(os.environ.get("KIS_ORDERBOOK_MAX_AGE", DEFAULT_MAX_AGE)))
+
+    def on_record(self, tr_id: str, record: dict):
+        """Realtime listener: apply an HDFSASP0 record to its book"""
+        if tr_id != QUOTE_TR_ID:
+            return
+        book = self._books.get(record["rsym"])
+        if book is None:
+            book = self._books[record["rsym"]] = OrderBook()
+        book.apply(record)
+
+    def get(self, key: str) -> Optional[OrderBook]:
+        """
+        Args:
+            key: Realtime key (e.g. "DNASAAPL")
+
+        Returns:
+            Optional[OrderBook]: Book updated within max_age, or None
+        """
+        book = self._books.get(key)
+        if book is None or not book.depth or book.age > self.max_age:
+            return None
+        return book
+
+    def discard(self, key: str):
+        self._books.pop(key, None)
+
+    def stats(self) -> dict:
+        return {
+            "max_age": self.max_age,
+            "books": {
+                key: {"depth": book.depth, "age": round(book.age, 3), "updates": book.updates}
+                for key, book in self._books.items()
+            },
+        }
@@ -0,0 +1,196 @@
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Awaitable, Callable, NamedTuple, Optional
+
+# 응답 헤더 tr_cont: M/F 다음 데이터 있음, D/E 마지막 데이터
+MORE = ("M", "F")
+# 요청 헤더 tr_cont: 다음 페이지 조회 시 "N"
+NEXT_PAGE = "N"
+# 한 번의 도구 호출에서 가져올 수 있는 최대 페이지 수
+MAX_PAGES = 50
+
+# (params, tr_cont) -> (body, 응답 tr_cont)
+Fetch = Callable[[dict, str], Awaitable[tuple[dict, str]]]
+
+
+def _find(body: dict, field: str) -> Optional[str]:
+    """Look up a continuation key in the body, its single-record outputs, then the last row of list outputs"""
+    if field in body:
+        return body[field]
+    for value in body.values():
+        if isinstance(value, dict) and field in value:
+            return value[field]
+    for value in body.values():
+        if isinstance(value, list) and value and isinstance(value[-1], dict) and field in value[-1]:
+            return value[-1][field]
+    return None
+
+
+def _rows(body: dict) -> list:
+    """Largest list-valued output of a response (the rows of the page)"""
+    lists = [value for value in body.values() if isinstance(value, list)]
+    return max(lists, key=len) if lists else []
+
+
+class PageScheme:
+    """
+    Continuation scheme of an endpoint
+
+    응답 헤더 tr_cont가 M/F이면 다음 페이지가 있으며, 응답에서 찾은 연속조회키를
+    다음 요청 파라미터에 넣고 tr_cont="N" 헤더로 요청합니다.
+    """
+
+    def __init__(self, keys: dict[str, str], args: dict[str, str]):
+        """
+        Args:
+            keys: Request parameter -> response field holding its next value
+                  (e.g. {"CTX_AREA_NK50": "ctx_area_nk50"})
+            args: Request parameter -> tool argument name, used to report where to resume
+        """
+        self.keys = keys
+        self.args = args
+
+    def next_params(self, params: dict, body: dict, tr_cont: str) -> Optional[dict]:
+        """
+        Args:
+            params: Parameters of the page just fetched
+            body: Response body of that page
+            tr_cont: tr_cont response header of that page
+
+        Returns:
+            Optional[dict]: Parameters of the next page, or None if this was the last page
+                (also when the response has no new continuation key, so the same page is not refetched)
+        """
+        if tr_cont not in MORE:
+            return None
+        next_params = dict(params)
+        for param, field in self.keys.items():
+            value = _find(body, field)
+            if value:
+                next_params[param] = value
+        if next_params == params:
+            return None
+        return next_params
+
+
+class MinuteBarScheme(PageScheme):
+    """
+    해외주식분봉조회 continuation
+
+    다음 조회 시 NEXT="1", PINC="1"로 설정하고, KEYB에는 이전 결과의 가장 오래된 분봉 시각에서
+    NMIN분을 뺀 시각(YYYYMMDDHHMMSS)을 넣습니다.
+    """
+
+    def __init__(self):
+        super().__init__(keys={}, args={"NEXT": "next", "PINC": "pinc", "KEYB": "keyb"})
+
+    @staticmethod
+    def next_keyb(rows: list[dict], nmin: str) -> Optional[str]:
+        """
+        Args:
+            rows: output2 rows of a page
+            nmin: Minute interval of the request
+
+        Returns:
+            Optional[str]: KEYB for the page preceding these rows
+        """
+        stamps = [row.get("xymd", "") + row.get("xhms", "") for row in rows]
+        stamps = [stamp for stamp in stamps if len(stamp) == 14 and stamp.isdigit()]
+        if not stamps:
+            return None
+        oldest = datetime.strptime(min(stamps), "%Y%m%d%H%M%S")
+        return (oldest - timedelta(minutes=int(nmin or 1))).strftime("%Y%m%d%H%M%S")
+
+    def next_params(self, params: dict, body: dict, tr_cont: str) -> Optional[dict]:
+        rows = body.get("output2") or []
+        output1 = body.get("output1") if isinstance(body.get("output1"), dict) else {}
+        more = tr_cont in MORE or output1.get("more") == "1" or len(rows) >= int(params.get("NREC") or 120)
+        keyb = self.next_keyb(rows, params.get("NMIN", "1")) if more else None
+        if keyb is None or keyb == params.get("KEYB"):
+            return None
+        return {**params, "NEXT": "1", "PINC": "1", "KEYB": keyb}
+
+
+# 엔드포인트별 연속조회 방식
+KEYB_SCHEME = PageScheme(keys={"KEYB": "keyb"}, args={"KEYB": "keyb"})
+PERIOD_RIGHTS_SCHEME = PageScheme(
+    keys={"CTX_AREA_NK50": "ctx_area_nk50", "CTX_AREA_FK50": "ctx_area_fk50"},
+    args={"CTX_AREA_NK50": "NK50", "CTX_AREA_FK50": "FK50"},
+)
+NEWS_SCHEME = PageScheme(keys={"CTS": "cts"}, args={"CTS": "cts"})
+MINUTE_BAR_SCHEME = MinuteBarScheme()
+
+
+class Page(NamedTuple):
+    body: dict
+    next_params: Optional[dict]  # None if this is the last page
+
+
+async def iterate_pages(fetch: Fetch, scheme: PageScheme, params: dict, max_pages: int) -> AsyncIterator[Page]:
+    """
+    Stream pages of an endpoint following its continuation scheme
+
+    Args:
+        fetch: Coroutine function sending one page request
+        scheme: Continuation scheme of the endpoint
+        params: Parameters of the first page
+        max_pages: Maximum number of pages to fetch
+
+    Yields:
+        Page: Each page body with the parameters of the following page
+    """
+    tr_cont = ""
+    for _ in range(max(1, min(max_pages, MAX_PAGES))):
+        body, response_tr_cont = await fetch(params, tr_cont)
+        next_params = scheme.next_params(params, body, response_tr_cont)
+        yield Page(body, next_params)
+        if next_params is None:
+            return
+        params = next_params
+        tr_cont = NEXT_PAGE
+
+
+async def collect_pages(fetch: Fetch, scheme: PageScheme, params: dict, max_pages: int, max_rows: int = 0) -> dict:
+    """
+    Fetch pages server-side and merge them into one KIS-shaped response
+
+    리스트 형태의 출력(output2 등)은 페이지 순서대로 이어 붙이고, 단건 출력(output1 등)은 첫 페이지 값을
+    사용합니다. 더 가져올 데이터가 남아 있으면 이어서 조회할 도구 인자를 "continuation"에 담습니다.
+    (max_rows로 잘린 경우에도 continuation은 마지막으로 받은 페이지의 다음 페이지를 가리킵니다)
+
+    Args:
+        fetch: Coroutine function sending one page request
+        scheme: Continuation scheme of the endpoint
+        params: Parameters of the first page
+        max_pages: Maximum number of pages to fetch
+        max_rows: Stop once this many rows were collected (0: no limit)
+
+    Returns:
+        dict: Merged response
+    """
+    merged: dict = {}
+    next_params = None
+    pages = 0
+    async for page in iterate_pages(fetch, scheme, params, max_pages):
+        pages += 1
+        next_params = page.next_params
+        for key, value in page.body.items():
+            if isinstance(value, list):
+                # 캐시된 응답을 공유하므로 원본 리스트는 복사한 뒤 이어 붙임
+                if key in merged:
+                    merged[key].extend(value)
+                else:
+                    merged[key] = list(value)
+            elif key not in merged or key in ("rt_cd", "msg_cd", "msg1"):
+                merged[key] = value
+        if max_rows and len(_rows(merged)) >= max_rows:
+            break
+
+    if max_rows:
+        for key, value in merged.items():
+            if isinstance(value, list) and len(value) > max_rows:
+                merged[key] = value[:max_rows]
+
+    merged["pages"] = pages
+    if next_params is not None:
+        merged["continuation"] = {arg: next_params.get(param, "") for param, arg in scheme.args.items()}
+    return merged
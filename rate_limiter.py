@@ -0,0 +1,162 @@
+import asyncio
+import logging
+import os
+import time
+from typing import Optional
+
+logger = logging.getLogger("mcp-server")
+
+# KIS 초당 거래건수 제한: 실전 20건, 모의 2건
+# 어느 1초 구간에서도 burst + rate 가 제한을 넘지 않도록 기본값을 설정
+DEFAULT_LIMITS = {
+    "REAL": (18.0, 1),      # (초당 요청 수, burst)
+    "VIRTUAL": (1.5, 1),
+}
+
+# 이 시간(초) 이상 대기하면 로그를 남김
+SLOW_WAIT_WARNING = 1.0
+
+
+class TokenBucket:
+    """
+    FIFO token bucket
+
+    대기자는 asyncio.Lock 순서대로 처리되므로 먼저 들어온 요청이 먼저 나갑니다.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        self.waiting = 0
+        self.acquired = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> float:
+        """
+        Wait until a request may be sent
+
+        Returns:
+            float: Seconds spent waiting in the queue
+        """
+        started = time.monotonic()
+        self.waiting += 1
+        try:
+            async with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens < 1:
+                    await asyncio.sleep((1 - self._tokens) / self.rate)
+                    self._refill(time.monotonic())
+                self._tokens -= 1
+        finally:
+            self.waiting -= 1
+
+        waited = time.monotonic() - started
+        self.acquired += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        return waited
+
+    def stats(self) -> dict:
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "queue_depth": self.waiting,
+            "acquired": self.acquired,
+            "avg_wait": self.total_wait / self.acquired if self.acquired else 0.0,
+            "max_wait": self.max_wait,
+        }
+
+
+class RateLimiter:
+    """
+    Client-side scheduler keeping requests under the KIS per-second quota
+
+    모든 요청은 appkey 단위 버킷을 통과하며, tr_id별 제한이 설정된 경우
+    해당 tr_id 버킷도 함께 통과해야 합니다.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, tr_limits: Optional[dict[str, float]] = None):
+        """
+        Args:
+            rate: Requests per second allowed per appkey
+            burst: Requests that may be sent back to back
+            tr_limits: Optional extra per-second limits keyed by tr_id
+        """
+        self.rate = rate
+        self.burst = burst
+        self.tr_limits = tr_limits or {}
+        self._buckets: dict[tuple[str, str], TokenBucket] = {}
+
+    @classmethod
+    def from_env(cls, tr_limits: Optional[dict[str, float]] = None) -> "RateLimiter":
+        """
+        Build a limiter from environment variables
+
+        Args:
+            tr_limits: Default per-tr_id limits (endpoints.rate_limits())
+
+        Environment:
+            KIS_RATE_LIMIT: appkey당 초당 요청 수 (default: 실전 18, 모의 1.5)
+            KIS_RATE_BURST: 연속 허용 요청 수 (default: 1)
+            KIS_RATE_LIMIT_TR: tr_id별 추가 제한 (예: "HHDFS76950200=5,HHDFS76240000=10")
+        """
+        account_type = os.environ.get("KIS_ACCOUNT_TYPE", "REAL").upper()
+        rate, burst = DEFAULT_LIMITS.get(account_type, DEFAULT_LIMITS["REAL"])
+        tr_limits = dict(tr_limits or {})
+        for item in os.environ.get("KIS_RATE_LIMIT_TR", "").split(","):
+            if "=" in item:
+                tr_id, limit = item.split("=", 1)
+                tr_limits[tr_id.strip()] = float(limit)
+        return cls(
+            rate=float(os.environ.get("KIS_RATE_LIMIT", rate)),
+            burst=int(os.environ.get("KIS_RATE_BURST", burst)),
+            tr_limits=tr_limits,
+        )
+
+    def _bucket(self, appkey: str, tr_id: str = "") -> TokenBucket:
+        key = (appkey, tr_id)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if tr_id:
+                bucket = TokenBucket(self.tr_limits[tr_id], 1)
+            else:
+                bucket = TokenBucket(self.rate, self.burst)
+            self._buckets[key] = bucket
+        return bucket
+
+    async def acquire(self, appkey: str, tr_id: str = "") -> float:
+        """
+        Wait for a slot for the given appkey (and tr_id if it has its own limit)
+
+        Args:
+            appkey: KIS app key the request is sent with
+            tr_id: Transaction ID of the request
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        waited = 0.0
+        if tr_id in self.tr_limits:
+            waited += await self._bucket(appkey, tr_id).acquire()
+        waited += await self._bucket(appkey).acquire()
+        if waited >= SLOW_WAIT_WARNING:
+            logger.debug(f"Rate limiter delayed {tr_id} by {waited:.2f}s")
+        return waited
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: Queue depth and wait time per bucket (appkey는 앞 4자리만 표시)
+        """
+        return {
+            f"{appkey[:4]}***{'/' + tr_id if tr_id else ''}": bucket.stats()
+            for (appkey, tr_id), bucket in self._buckets.items()
+        }
@@ -0,0 +1,328 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+logger = logging.getLogger("mcp-server")
+
+TRADE_TR_ID = "HDFSCNT0"  # 해외주식 실시간지연체결가
+QUOTE_TR_ID = "HDFSASP0"  # 해외주식 실시간호가(미국)
+
+# 실시간 데이터 필드 순서 ('^'로 구분)
+FIELDS = {
+    TRADE_TR_ID: (
+        "rsym", "symb", "zdiv", "tymd", "xymd", "xhms", "kymd", "khms", "open", "high", "low", "last",
+        "sign", "diff", "rate", "pbid", "pask", "vbid", "vask", "evol", "tvol", "tamt", "bivl", "asvl",
+        "strn", "mtyp",
+    ),
+    # 호가는 단계별로 (매수호가, 매도호가, 매수잔량, 매도잔량, 매수잔량대비, 매도잔량대비) 반복
+    QUOTE_TR_ID: (
+        "rsym", "symb", "zdiv", "xymd", "xhms", "kymd", "khms", "bvol", "avol", "bdvl", "advl",
+        *(f"{name}{n}" for n in range(1, 11) for name in ("pbid", "pask", "vbid", "vask", "dbid", "dask")),
+    ),
+}
+
+# 한 세션에서 등록할 수 있는 최대 실시간 구독 수
+MAX_SUBSCRIPTIONS = 41
+# 재연결 대기 시간 (초)
+RECONNECT_DELAY = 1.0
+MAX_RECONNECT_DELAY = 30.0
+
+Subscription = tuple[str, str]  # (tr_id, tr_key)
+
+
+def tr_key(excd: str, symb: str) -> str:
+    """
+    Realtime key of an overseas symbol (e.g. "DNASAAPL")
+
+    Args:
+        excd: 거래소코드 (NAS, NYS, AMS, HKS ...)
+        symb: 종목코드
+    """
+    return f"D{excd}{symb}"
+
+
+def parse_frame(text: str) -> list[tuple[str, dict]]:
+    """
+    Parse a realtime data frame
+
+    형식: "암호화여부|tr_id|데이터건수|필드^필드^..." (여러 건이면 필드가 이어서 나열됨)
+
+    Args:
+        text: Raw frame text
+
+    Returns:
+        list[tuple[str, dict]]: (tr_id, record) per record, empty for encrypted or unknown frames
+    """
+    parts = text.split("|", 3)
+    if len(parts) != 4 or parts[0] != "0":
+        return []
+    _, tr_id, count, payload = parts
+    fields = FIELDS.get(tr_id)
+    if fields is None:
+        return []
+    values = payload.split("^")
+    if int(count or 1) == 1:
+        # 1건이면 제공되는 필드 수가 달라도 (예: 1호가만 제공) 있는 필드까지만 사용
+        return [(tr_id, dict(zip(fields, values)))]
+    records = []
+    for index in range(int(count)):
+        chunk = values[index * len(fields):(index + 1) * len(fields)]
+        if len(chunk) < len(fields):
+            break
+        records.append((tr_id, dict(zip(fields, chunk))))
+    return records
+
+
+class QuoteBoard:
+    """Latest realtime trade and quote per symbol"""
+
+    def __init__(self):
+        self._latest: dict[Subscription, tuple[float, dict]] = {}  # (tr_id, rsym) -> (received_at, record)
+        self.updates = 0
+
+    def update(self, tr_id: str, record: dict):
+        self._latest[(tr_id, record["rsym"])] = (time.monotonic(), record)
+        self.updates += 1
+
+    def get(self, tr_id: str, key: str) -> Optional[tuple[float, dict]]:
+        """
+        Returns:
+            Optional[tuple[float, dict]]: (age in seconds, record) of the latest update
+        """
+        entry = self._latest.get((tr_id, key))
+        if entry is None:
+            return None
+        received_at, record = entry
+        return time.monotonic() - received_at, record
+
+    def discard(self, tr_id: str, key: str):
+        self._latest.pop((tr_id, key), None)
+
+    def snapshot(self) -> dict:
+        return {
+            f"{tr_id}:{key}": {"age": round(time.monotonic() - received_at, 3), **record}
+            for (tr_id, key), (received_at, record) in self._latest.items()
+        }
+
+
+class RealtimeClient:
+    """
+    KIS WebSocket client maintaining realtime subscriptions
+
+    - 첫 구독 시 접속키(approval key)를 발급받아 연결하고, 끊기면 백오프 후 재연결하여 구독을 복원
+    - 수신한 체결/호가는 QuoteBoard에 종목별 최신값으로 보관
+    - PINGPONG 메시지는 그대로 돌려보내 연결을 유지
+    """
+
+    def __init__(self, url: str, approval: Callable[[], Awaitable[str]], custtype: str = "P"):
+        """
+        Args:
+            url: WebSocket URL (e.g. "ws://ops.koreainvestment.com:21000")
+            approval: Coroutine function issuing a WebSocket approval key
+            custtype: 고객타입 (P: 개인, B: 법인)
+        """
+        self.url = url
+        self._approval = approval
+        self.custtype = custtype
+        self.board = QuoteBoard()
+        self._subscriptions: set[Subscription] = set()
+        self._approval_key: Optional[str] = None
+        self._ws = None
+        self._task: Optional[asyncio.Task] = None
+        self._connected = asyncio.Event()
+        self._listeners: list[Callable[[str, dict], None]] = []
+        self._users = 0
+        self.reconnects = 0
+
+    @classmethod
+    def from_env(cls, approval: Callable[[], Awaitable[str]], default_url: str) -> "RealtimeClient":
+        """
+        Environment:
+            KIS_WS_URL: WebSocket URL 재정의 (default: default_url)
+            KIS_CUSTTYPE: 고객타입 (default: P)
+        """
+        return cls(
+            os.environ.get("KIS_WS_URL", default_url),
+            approval,
+            custtype=os.environ.get("KIS_CUSTTYPE", "P"),
+        )
+
+    @property
+    def connected(self) -> bool:
+        return self._connected.is_set()
+
+    def is_subscribed(self, tr_id: str, key: str) -> bool:
+        return (tr_id, key) in self._subscriptions
+
+    def is_live(self, tr_id: str, key: str) -> bool:
+        """True if key is subscribed and updates are currently being received"""
+        return self.connected and self.is_subscribed(tr_id, key)
+
+    def add_listener(self, listener: Callable[[str, dict], None]):
+        """
+        Args:
+            listener: Function called with (tr_id, record) for every parsed record
+        """
+        self._listeners.append(listener)
+
+    def latest(self, tr_id: str, key: str) -> Optional[dict]:
+        """
+        Latest record of a subscribed key while the connection is up
+
+        Returns:
+            Optional[dict]: Record, or None if it may be stale or was never received
+        """
+        if not self.is_live(tr_id, key):
+            return None
+        entry = self.board.get(tr_id, key)
+        return entry[1] if entry else None
+
+    async def subscribe(self, tr_id: str, key: str):
+        """
+        Register a realtime subscription, connecting on first use
+
+        Raises:
+            RuntimeError: If the websockets package is not installed
+            ValueError: If the subscription limit is reached
+        """
+        # websockets는 첫 구독 시 불러옴 (서버 시작 시간 단축, 선택 의존성: pip install -e ".[realtime]")
+        try:
+            import websockets
+        except ImportError:
+            raise RuntimeError("Realtime streaming requires the 'websockets' package (pip install -e \".[realtime]\")")
+        if (tr_id, key) in self._subscriptions:
+            return
+        if len(self._subscriptions) >= MAX_SUBSCRIPTIONS:
+            raise ValueError(f"Realtime subscriptions are limited to {MAX_SUBSCRIPTIONS} per session")
+        self._subscriptions.add((tr_id, key))
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        elif self.connected:
+            await self._send(tr_id, key, subscribe=True)
+
+    async def unsubscribe(self, tr_id: str, key: str):
+        if (tr_id, key) not in self._subscriptions:
+            return
+        self._subscriptions.discard((tr_id, key))
+        self.board.discard(tr_id, key)
+        if self.connected:
+            await self._send(tr_id, key, subscribe=False)
+
+    async def wait_connected(self, timeout: float) -> bool:
+        try:
+            await asyncio.wait_for(self._connected.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def _send(self, tr_id: str, key: str, subscribe: bool):
+        message = {
+            "header": {
+                "approval_key": self._approval_key,
+                "custtype": self.custtype,
+                "tr_type": "1" if subscribe else "2",
+                "content-type": "utf-8",
+            },
+            "body": {"input": {"tr_id": tr_id, "tr_key": key}},
+        }
+        await self._ws.send(json.dumps(message))
+
+    def _handle_control(self, text: str):
+        try:
+            message = json.loads(text)
+        except ValueError:
+            logger.warning(f"Unexpected realtime message: {text[:200]}")
+            return
+        header = message.get("header", {})
+        body = message.get("body", {})
+        if body.get("rt_cd") not in (None, "0"):
+            logger.warning(f"Realtime {header.get('tr_id')} {header.get('tr_key')} rejected: "
+                           f"[{body.get('msg_cd')}] {body.get('msg1')}")
+
+    async def _run(self):
+        import websockets  # subscribe()에서 설치 여부 확인
+
+        delay = RECONNECT_DELAY
+        while self._subscriptions:
+            try:
+                if self._approval_key is None:
+                    self._approval_key = await self._approval()
+                async with websockets.connect(self.url, ping_interval=None) as ws:
+                    self._ws = ws
+                    # 연결 표시 후 구독을 복원해야 그 사이에 추가된 구독이 누락되지 않음 (중복 등록은 무시됨)
+                    self._connected.set()
+                    for tr_id, key in sorted(self._subscriptions):
+                        await self._send(tr_id, key, subscribe=True)
+                    delay = RECONNECT_DELAY
+                    logger.info(f"Realtime connected to {self.url} ({len(self._subscriptions)} subscriptions)")
+                    async for text in ws:
+                        if isinstance(text, bytes):
+                            text = text.decode()
+                        if text[:1] in ("0", "1"):
+                            for tr_id, record in parse_frame(text):
+                                self.board.update(tr_id, record)
+                                for listener in self._listeners:
+                                    listener(tr_id, record)
+                        elif '"PINGPONG"' in text:
+                            await ws.send(text)
+                        else:
+                            self._handle_control(text)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Realtime connection lost: {e!r}, reconnecting in {delay:.0f}s")
+            finally:
+                self._connected.clear()
+                self._ws = None
+            if not self._subscriptions:
+                break
+            self.reconnects += 1
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MAX_RECONNECT_DELAY)
+
+    async def aclose(self):
+        self._subscriptions.clear()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator["RealtimeClient"]:
+        """Close the WebSocket connection when the last server lifespan ends"""
+        self._users += 1
+        try:
+            yield self
+        finally:
+            self._users -= 1
+            if self._users == 0:
+                await self.aclose()
+
+    def stats(self) -> dict:
+        return {
+            "url": self.url,
+            "connected": self.connected,
+            "subscriptions": [f"{tr_id}:{key}" for tr_id, key in sorted(self._subscriptions)],
+            "updates": self.board.updates,
+            "reconnects": self.reconnects,
+        }
+
+
+def price_output(record: dict) -> dict:
+    """
+    Map a realtime trade record onto the output of 해외주식 현재체결가
+
+    Args:
+        record: HDFSCNT0 record
+
+    Returns:
+        dict: Fields shared with the price API output
+    """
+    return {field: record[field] for field in ("rsym", "zdiv", "last", "sign", "diff", "rate", "tvol", "tamt")}
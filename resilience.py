@@ -0,0 +1,284 @@
+import logging
+import os
+import random
+import time
+from typing import Optional
+
+logger = logging.getLogger("mcp-server")
+
+
+class ErrorKind:
+    """Classification of KIS API failures"""
+
+    RATE_LIMITED = "rate_limited"          # 초당 거래건수 초과
+    TOKEN_EXPIRED = "token_expired"        # 접근토큰 만료/무효
+    SERVER_BUSY = "server_busy"            # 게이트웨이 장애, 5xx, 네트워크 오류
+    INVALID_PARAMETER = "invalid_parameter"  # 입력값 오류
+    API_ERROR = "api_error"                # 그 외 rt_cd != "0"
+
+    # 재시도하면 성공할 수 있는 오류
+    TRANSIENT = (RATE_LIMITED, TOKEN_EXPIRED, SERVER_BUSY)
+
+
+# KIS msg_cd 분류표
+RATE_LIMIT_CODES = {"EGW00201"}  # 초당 거래건수를 초과하였습니다
+TOKEN_EXPIRED_CODES = {
+    "EGW00121",  # 유효하지 않은 token 입니다
+    "EGW00122",  # token을 찾을 수 없습니다
+    "EGW00123",  # 기간이 만료된 token 입니다
+}
+SERVER_BUSY_CODES = {
+    "EGW00001",  # 일시적인 오류가 발생했습니다
+    "EGW00002",  # 서버 에러가 발생했습니다
+    "EGW00203",  # OPS라우팅 중 오류가 발생했습니다
+}
+INVALID_PARAMETER_PREFIXES = ("OPSQ",)  # OPSQ2001: 입력값 오류 등
+
+
+class KisApiError(Exception):
+    """Error returned by (or while calling) the KIS REST API"""
+
+    def __init__(
+        self,
+        message: str,
+        kind: str = ErrorKind.API_ERROR,
+        status_code: Optional[int] = None,
+        rt_cd: str = "",
+        msg_cd: str = "",
+        msg1: str = "",
+    ):
+        super().__init__(message)
+        self.kind = kind
+        self.status_code = status_code
+        self.rt_cd = rt_cd
+        self.msg_cd = msg_cd
+        self.msg1 = msg1
+
+    @property
+    def transient(self) -> bool:
+        return self.kind in ErrorKind.TRANSIENT
+
+
+class CircuitOpenError(KisApiError):
+    """Raised without calling KIS while an endpoint's circuit is open"""
+
+    def __init__(self, endpoint: str, retry_after: float):
+        super().__init__(
+            f"Circuit open for {endpoint}, KIS gateway unavailable (retry in {retry_after:.1f}s)",
+            kind=ErrorKind.SERVER_BUSY,
+        )
+        self.retry_after = retry_after
+
+
+def classify_msg_cd(msg_cd: str) -> str:
+    """
+    Map a KIS msg_cd to an ErrorKind
+
+    Args:
+        msg_cd: KIS message code (e.g. "EGW00201")
+
+    Returns:
+        str: ErrorKind value
+    """
+    if msg_cd in RATE_LIMIT_CODES:
+        return ErrorKind.RATE_LIMITED
+    if msg_cd in TOKEN_EXPIRED_CODES:
+        return ErrorKind.TOKEN_EXPIRED
+    if msg_cd in SERVER_BUSY_CODES:
+        return ErrorKind.SERVER_BUSY
+    if msg_cd.startswith(INVALID_PARAMETER_PREFIXES):
+        return ErrorKind.INVALID_PARAMETER
+    return ErrorKind.API_ERROR
+
+
+def classify_response(api_url: str, status_code: int, body: Optional[dict], text: str = "") -> Optional[KisApiError]:
+    """
+    Turn a KIS response into a KisApiError, or None if it succeeded
+
+    KIS는 오류를 HTTP 상태코드(주로 500)와 본문의 rt_cd/msg_cd 양쪽으로 알려주므로
+    둘 다 확인합니다.
+
+    Args:
+        api_url: API endpoint URL path
+        status_code: HTTP status code
+        body: Decoded JSON body, or None if it could not be decoded
+        text: Raw response text used in the error message
+
+    Returns:
+        Optional[KisApiError]: Error describing the failure
+    """
+    body = body if isinstance(body, dict) else {}
+    rt_cd = str(body.get("rt_cd", ""))
+    msg_cd = str(body.get("msg_cd", ""))
+    msg1 = str(body.get("msg1", "")).strip()
+
+    if status_code == 200 and rt_cd in ("0", ""):
+        return None
+
+    if msg_cd:
+        kind = classify_msg_cd(msg_cd)
+    elif status_code in (401, 403):
+        kind = ErrorKind.TOKEN_EXPIRED
+    elif status_code == 429:
+        kind = ErrorKind.RATE_LIMITED
+    elif status_code >= 500:
+        kind = ErrorKind.SERVER_BUSY
+    elif 400 <= status_code < 500:
+        kind = ErrorKind.INVALID_PARAMETER
+    else:
+        kind = ErrorKind.API_ERROR
+
+    detail = f"[{msg_cd}] {msg1}" if msg_cd else (text or f"HTTP {status_code}")
+    return KisApiError(
+        f"Failed to make API request to {api_url}: {detail}",
+        kind=kind,
+        status_code=status_code,
+        rt_cd=rt_cd,
+        msg_cd=msg_cd,
+        msg1=msg1,
+    )
+
+
+class RetryPolicy:
+    """Jittered exponential backoff for transient KIS errors"""
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.2, max_delay: float = 5.0):
+        """
+        Args:
+            max_attempts: Total attempts including the first request
+            base_delay: Backoff for the first retry (seconds)
+            max_delay: Upper bound for a single backoff (seconds)
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    @classmethod
+    def from_env(cls) -> "RetryPolicy":
+        """
+        Environment:
+            KIS_RETRY_ATTEMPTS: 최대 시도 횟수 (default: 3)
+            KIS_RETRY_BASE_DELAY: 첫 재시도 대기 시간(초) (default: 0.2)
+            KIS_RETRY_MAX_DELAY: 재시도 대기 시간 상한(초) (default: 5)
+        """
+        return cls(
+            max_attempts=int(os.environ.get("KIS_RETRY_ATTEMPTS", 3)),
+            base_delay=float(os.environ.get("KIS_RETRY_BASE_DELAY", 0.2)),
+            max_delay=float(os.environ.get("KIS_RETRY_MAX_DELAY", 5.0)),
+        )
+
+    def should_retry(self, error: KisApiError, attempt: int) -> bool:
+        """
+        Args:
+            error: Failure of the attempt
+            attempt: Zero-based index of the attempt that failed
+        """
+        if isinstance(error, CircuitOpenError):
+            return False
+        return error.transient and attempt + 1 < self.max_attempts
+
+    def delay(self, error: KisApiError, attempt: int) -> float:
+        """
+        Full-jitter backoff: uniform(0, min(max_delay, base_delay * 2^attempt))
+
+        토큰 만료는 재발급 후 바로 재시도하므로 대기하지 않습니다.
+        """
+        if error.kind == ErrorKind.TOKEN_EXPIRED:
+            return 0.0
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """
+    Per-endpoint circuit breaker
+
+    - closed: 정상 상태, 요청 허용
+    - open: 연속 실패가 임계값을 넘으면 reset_timeout 동안 요청을 즉시 실패 처리
+    - half-open: reset_timeout 이후 한 건만 시험 요청을 허용, 성공하면 closed로 복귀
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, endpoint: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.endpoint = endpoint
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._trial_started = 0.0
+
+    def before_request(self):
+        """
+        Raises:
+            CircuitOpenError: If the endpoint is failing fast
+        """
+        if self.state == self.CLOSED:
+            return
+        remaining = self.reset_timeout - (time.monotonic() - self._opened_at)
+        if self.state == self.OPEN and remaining <= 0:
+            self.state = self.HALF_OPEN
+            self._trial_in_flight = False
+        if self.state == self.HALF_OPEN:
+            # 시험 요청이 취소되어 결과가 기록되지 않은 경우를 대비해 timeout 이후 재허용
+            trial_expired = time.monotonic() - self._trial_started > self.reset_timeout
+            if not self._trial_in_flight or trial_expired:
+                self._trial_in_flight = True
+                self._trial_started = time.monotonic()
+                return
+        raise CircuitOpenError(self.endpoint, max(remaining, 0.0))
+
+    def record_success(self):
+        if self.state != self.CLOSED:
+            logger.info(f"Circuit closed for {self.endpoint}")
+        self.state = self.CLOSED
+        self.failures = 0
+        self._trial_in_flight = False
+
+    def record_failure(self, error: KisApiError):
+        # 게이트웨이 장애만 차단 대상으로 집계
+        if error.kind != ErrorKind.SERVER_BUSY:
+            if self.state == self.HALF_OPEN:
+                self.record_success()
+            return
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                logger.warning(f"Circuit opened for {self.endpoint} after {self.failures} failures")
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+
+class CircuitBreakerRegistry:
+    """Lazily created circuit breakers keyed by endpoint path"""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    @classmethod
+    def from_env(cls) -> "CircuitBreakerRegistry":
+        """
+        Environment:
+            KIS_CIRCUIT_FAILURES: 차단까지 허용할 연속 장애 횟수 (default: 5)
+            KIS_CIRCUIT_RESET: 차단 유지 시간(초) (default: 30)
+        """
+        return cls(
+            failure_threshold=int(os.environ.get("KIS_CIRCUIT_FAILURES", 5)),
+            reset_timeout=float(os.environ.get("KIS_CIRCUIT_RESET", 30.0)),
+        )
+
+    def get(self, endpoint: str) -> CircuitBreaker:
+        breaker = self._breakers.get(endpoint)
+        if breaker is None:
+            breaker = CircuitBreaker(endpoint, self.failure_threshold, self.reset_timeout)
+            self._breakers[endpoint] = breaker
+        return breaker
+
+    def states(self) -> dict:
+        return {endpoint: breaker.state for endpoint, breaker in self._breakers.items()}
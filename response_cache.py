@@ -0,0 +1,273 @@
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Union
+
+logger = logging.getLogger("mcp-server")
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class ResponseCache:
+    """
+    In-process TTL cache for KIS responses
+
+    - tr_id별 TTL 정책 (고정값 또는 파라미터에 따라 계산하는 함수)
+    - 저장된 응답 크기 합계가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 제거 (LRU)
+    - 캐시된 응답은 여러 호출자가 공유하므로 읽기 전용으로 취급해야 함
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttls: Optional[dict[str, Union[float, Callable[[dict], float]]]] = None,
+        enabled: bool = True,
+    ):
+        """
+        Args:
+            max_bytes: Budget for the summed size of stored responses
+            ttls: tr_id -> TTL in seconds or a function of the request parameters (missing: not cached)
+            enabled: False to bypass the cache
+        """
+        self.max_bytes = max_bytes
+        self.ttls = dict(ttls or {})
+        self.enabled = enabled
+        self._entries: OrderedDict[Hashable, tuple[float, int, Any]] = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._per_tr: dict[str, list[int]] = {}  # tr_id -> [hits, misses]
+
+    @classmethod
+    def from_env(cls, ttls: Optional[dict[str, Union[float, Callable[[dict], float]]]] = None) -> "ResponseCache":
+        """
+        Build a cache from environment variables
+
+        Args:
+            ttls: Default tr_id -> TTL policy (endpoints.cache_ttls())
+
+        Environment:
+            KIS_CACHE: "false"이면 캐시 비활성화 (default: true)
+            KIS_CACHE_MAX_BYTES: 캐시 최대 크기(bytes) (default: 64MB)
+            KIS_CACHE_TTL: tr_id별 TTL 재정의 (예: "HHDFS00000300=1,CTPF1702R=3600", 0이면 캐시 안 함)
+        """
+        ttls = dict(ttls or {})
+        for item in os.environ.get("KIS_CACHE_TTL", "").split(","):
+            if "=" in item:
+                tr_id, ttl = item.split("=", 1)
+                ttls[tr_id.strip()] = float(ttl)
+        return cls(
+            max_bytes=int(os.environ.get("KIS_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)),
+            ttls=ttls,
+            enabled=os.environ.get("KIS_CACHE", "true").lower() not in ("0", "false", "no", "off"),
+        )
+
+    def ttl_for(self, tr_id: str, params: dict) -> float:
+        """
+        Returns:
+            float: Seconds a response for this request may be served from cache (0: not cached)
+        """
+        policy = self.ttls.get(tr_id, 0)
+        return policy(params) if callable(policy) else policy
+
+    def _count(self, tr_id: str, hit: bool):
+        counters = self._per_tr.setdefault(tr_id, [0, 0])
+        if hit:
+            self.hits += 1
+            counters[0] += 1
+        else:
+            self.misses += 1
+            counters[1] += 1
+
+    def get(self, key: Hashable, tr_id: str) -> Optional[Any]:
+        """
+        Args:
+            key: Request identity
+            tr_id: Transaction ID, used for per-tr_id counters
+
+        Returns:
+            Optional[Any]: Cached response, or None on miss
+        """
+        if not self.enabled or tr_id not in self.ttls:
+            return None
+        entry = self._entries.get(key)
+        if entry is None:
+            self._count(tr_id, hit=False)
+            return None
+        expires_at, nbytes, value = entry
+        if time.monotonic() >= expires_at:
+            self._remove(key)
+            self._count(tr_id, hit=False)
+            return None
+        self._entries.move_to_end(key)
+        self._count(tr_id, hit=True)
+        return value
+
+    def put(self, key: Hashable, tr_id: str, params: dict, value: Any, nbytes: int):
+        """
+        Store a response if its tr_id has a TTL and it fits in the budget
+
+        Args:
+            key: Request identity
+            tr_id: Transaction ID selecting the TTL policy
+            params: Request parameters passed to parameter-dependent policies
+            value: Decoded response
+            nbytes: Size of the raw response body, counted against max_bytes
+        """
+        if not self.enabled:
+            return
+        ttl = self.ttl_for(tr_id, params)
+        if ttl <= 0 or nbytes > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (time.monotonic() + ttl, nbytes, value)
+        self.bytes += nbytes
+        while self.bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: Hashable):
+        _, nbytes, _ = self._entries.pop(key)
+        self.bytes -= nbytes
+
+    def clear(self):
+        self._entries.clear()
+        self.bytes = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "by_tr_id": {
+                tr_id: {"hits": hits, "misses": misses}
+                for tr_id, (hits, misses) in self._per_tr.items()
+            },
+        }
+
+
+DEFAULT_NEGATIVE_TTL = 30.0
+DEFAULT_NEGATIVE_MAX_ENTRIES = 4096
+
+
+def is_empty(body: dict) -> bool:
+    """
+    Whether a successful KIS response carries no data
+
+    잘못된 종목/거래소 조합은 rt_cd "0"과 함께 빈 목록 또는 값이 모두 공백인 output으로 응답합니다.
+    목록 출력(output2 등)이 있으면 목록이 모두 비었는지, 없으면 단일 출력의 값이 모두 공백인지 확인합니다.
+
+    Args:
+        body: Decoded response body
+
+    Returns:
+        bool: True if every list output is empty, or there is no list output and every field is blank
+    """
+    outputs = [value for key, value in body.items() if key.startswith(("output", "outblock"))]
+    if not outputs:
+        return False
+    lists = [value for value in outputs if isinstance(value, list)]
+    if lists:
+        return not any(lists)
+    return all(
+        all(field in ("", None) for field in value.values()) if isinstance(value, dict) else value in ("", None)
+        for value in outputs
+    )
+
+
+class NegativeCache:
+    """
+    Short-lived cache of "no data" responses and rejected requests
+
+    - 같은 엔드포인트/파라미터로 빈 응답 또는 재시도해도 바뀌지 않는 오류(입력값 오류 등)를 받았다면
+      ttl 동안 KIS에 다시 요청하지 않고 같은 결과(KIS 메시지 포함)를 반환
+    - ResponseCache와 달리 tr_id별 TTL 정책 없이 모든 엔드포인트에 같은 TTL을 적용하며 항목 수로 크기를 제한 (LRU)
+    """
+
+    def __init__(self, ttl: float = DEFAULT_NEGATIVE_TTL, max_entries: int = DEFAULT_NEGATIVE_MAX_ENTRIES,
+                 enabled: bool = True):
+        """
+        Args:
+            ttl: Seconds an outcome is reused (0: disabled)
+            max_entries: Maximum number of stored outcomes
+            enabled: False to bypass the cache
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.enabled = enabled and ttl > 0
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.stored: dict[str, int] = {"empty": 0, "error": 0}
+
+    @classmethod
+    def from_env(cls) -> "NegativeCache":
+        """
+        Environment:
+            KIS_CACHE: "false"이면 비활성화 (default: true)
+            KIS_NEGATIVE_CACHE_TTL: 빈 응답/입력값 오류를 재사용할 시간(초), 0이면 비활성화 (default: 30)
+            KIS_NEGATIVE_CACHE_ENTRIES: 최대 항목 수 (default: 4096)
+        """
+        return cls(
+            ttl=float(os.environ.get("KIS_NEGATIVE_CACHE_TTL", DEFAULT_NEGATIVE_TTL)),
+            max_entries=int(os.environ.get("KIS_NEGATIVE_CACHE_ENTRIES", DEFAULT_NEGATIVE_MAX_ENTRIES)),
+            enabled=os.environ.get("KIS_CACHE", "true").lower() not in ("0", "false", "no", "off"),
+        )
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Args:
+            key: Request identity
+
+        Returns:
+            Optional[Any]: Stored empty response or exception, None on miss
+        """
+        if not self.enabled:
+            return None
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, outcome = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return outcome
+
+    def put(self, key: Hashable, outcome: Any):
+        """
+        Store an empty response or a non-transient exception
+
+        Args:
+            key: Request identity
+            outcome: Empty response, or the exception to raise again on hit
+        """
+        if not self.enabled:
+            return
+        self._entries.pop(key, None)
+        self._entries[key] = (time.monotonic() + self.ttl, outcome)
+        self.stored["error" if isinstance(outcome, BaseException) else "empty"] += 1
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "ttl": self.ttl,
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "stored": dict(self.stored),
+        }
@@ -1,8 +1,12 @@
+import asyncio
+import copy
 import json
 import logging
 import os
 import sys
-from typing import Optional
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, NamedTuple, Optional, Sequence
 
 from dotenv import load_dotenv
 from pathlib import Path
@@ -10,21 +14,55 @@ from datetime import datetime, timedelta
 
 import httpx
 from mcp.server.fastmcp.server import FastMCP
+from mcp.types import EmbeddedResource, ImageContent, TextContent, Tool
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+
+from backfill import MAX_BACKFILL_PAGES, Backfill, backfill_many
+from bar_store import BarStore
+import codec
+from columnar import columnar_response
+from endpoints import ENDPOINTS, Endpoint, cache_ttls, output_fields, rate_limits as endpoint_rate_limits
+from fields import FieldCatalogue, project
+from http_pool import get_pool
+from log_config import configure_logging
+from metrics import MetricsRegistry, PrometheusExporter
+from pagination import Fetch, collect_pages
+from orderbook import SUMMARY_FIELDS as ORDERBOOK_SUMMARY_FIELDS, OrderBook, OrderBookEngine
+from rate_limiter import RateLimiter
+from realtime import QUOTE_TR_ID, TRADE_TR_ID, RealtimeClient, price_output, tr_key
+from response_cache import NegativeCache, ResponseCache, is_empty
+from resilience import (
+    CircuitBreakerRegistry,
+    ErrorKind,
+    KisApiError,
+    RetryPolicy,
+    classify_response,
+)
+from singleflight import SingleFlight
+from token_manager import TokenManager
+from tool_cache import ToolMetadataCache, fingerprint
+from tracing import tracer_from_env
 
 from annotations import (
     period_rights_annotations,
     price_annotations,
+    realtime_subscribe_annotations,
+    realtime_unsubscribe_annotations,
     brknews_title_annotations,
     inquire_ccnl_annotations,
     price_detail_annotations,
+    batch_price_annotations,
     news_title_annotations,
     inquire_time_itemchartprice_annotations,
+    backfill_time_itemchartprice_annotations,
     inquire_time_indexchartprice_annotations,
     inquire_search_annotations,
     search_info_annotations,
     dailyprice_annotations,
     industry_theme_annotations,
     inquire_asking_price_annotations,
+    orderbook_summary_annotations,
     quot_inquire_ccnl_annotations,
     inquire_daily_chartprice_annotations,
     industry_price_annotations,
@@ -40,29 +78,97 @@ from annotations import (
     market_cap_annotations
 )
 
-# 로깅 설정: 반드시 stderr로 출력
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stderr)
-    ]
-)
+# Load environment variables from .env file
+load_dotenv()
+
+# 로깅 설정: 반드시 stderr로 출력, 출력은 백그라운드 스레드에서 수행 (KIS_LOG_LEVEL 등)
+configure_logging()
 
 logger = logging.getLogger("mcp-server")
 
-# Create MCP instance
-mcp = FastMCP("KIS MCP Server", dependencies=["httpx", "xmltodict"])
 
-# Load environment variables from .env file
-load_dotenv()
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Open the shared HTTP pool and token renewal on startup, close them on shutdown"""
+    async with get_pool().session(), token_manager.session(), realtime_client.session(), metrics_exporter.session():
+        yield
+
+
+class KisFastMCP(FastMCP):
+    """FastMCP that encodes tool results with the codec layer and builds tool metadata on first use"""
+
+    def __init__(self, *args, tool_cache: Optional[ToolMetadataCache] = None, **kwargs):
+        # 등록 순서대로 보관한 도구 정의 (이름 -> (함수, add_tool 인자))
+        self._tool_specs: dict[str, tuple[Callable, dict]] = {}
+        self._listed_tools: Optional[list[Tool]] = None
+        self.tool_cache = tool_cache or ToolMetadataCache(None)
+        super().__init__(*args, **kwargs)
+
+    def add_tool(self, fn: Callable, name: Optional[str] = None, **kwargs):
+        # Tool.from_function은 도구마다 pydantic 모델과 JSON schema를 만들어 import가 느려지므로 처음 필요할 때 생성
+        self._tool_specs[name or fn.__name__] = (fn, kwargs)
+        self._listed_tools = None
+
+    def _build_tool(self, name: str):
+        if name in self._tool_specs and self._tool_manager.get_tool(name) is None:
+            fn, kwargs = self._tool_specs[name]
+            super().add_tool(fn, name=name, **kwargs)
+
+    async def list_tools(self) -> list[Tool]:
+        if self._listed_tools is None:
+            key = fingerprint(self._tool_specs)
+            tools = self.tool_cache.load(key)
+            if tools is None:
+                for name in self._tool_specs:
+                    self._build_tool(name)
+                order = {name: index for index, name in enumerate(self._tool_specs)}
+                tools = sorted(await super().list_tools(), key=lambda tool: order.get(tool.name, len(order)))
+                self.tool_cache.save(key, tools)
+            self._listed_tools = tools
+        return self._listed_tools
+
+    async def call_tool(self, name: str, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
+        started = time.perf_counter()
+        failed = True
+        with tracer.span("tool", tool=name):
+            try:
+                self._build_tool(name)
+                # 기본 구현은 결과 dict를 들여쓰기된 JSON으로 다시 인코딩하므로 직접 변환
+                result = await self._tool_manager.call_tool(name, arguments, context=self.get_context())
+                called = time.perf_counter()
+                text = result if isinstance(result, str) else codec.dumps(result)
+                tracer.record("serialize", called, time.perf_counter(), bytes=len(text))
+                failed = False
+            finally:
+                elapsed = time.perf_counter() - started
+                metrics.record_tool(name, elapsed, error=failed)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        f"Tool {name} {'failed' if failed else 'completed'} in {elapsed * 1000:.1f}ms",
+                        extra={"tool": name, "latency_ms": round(elapsed * 1000, 3)},
+                    )
+        return [TextContent(type="text", text=text)]
+
+
+# Create MCP instance
+mcp = KisFastMCP(
+    "KIS MCP Server",
+    dependencies=["httpx", "xmltodict"],
+    lifespan=lifespan,
+    tool_cache=ToolMetadataCache.from_env(Path(__file__).resolve().parent / "tool_cache.json"),
+)
 
 # Global strings for API endpoints and paths
-DOMAIN = "https://openapi.koreainvestment.com:9443"
-VIRTUAL_DOMAIN = "https://openapivts.koreainvestment.com:29443"  # 모의투자
+# KIS_DOMAIN, KIS_VIRTUAL_DOMAIN으로 재정의 가능 (예: 로컬 fake_kis.py 서버)
+DOMAIN = os.environ.get("KIS_DOMAIN", "https://openapi.koreainvestment.com:9443")
+VIRTUAL_DOMAIN = os.environ.get("KIS_VIRTUAL_DOMAIN", "https://openapivts.koreainvestment.com:29443")  # 모의투자
+
+WS_URL = "ws://ops.koreainvestment.com:21000"  # 실시간 시세
+VIRTUAL_WS_URL = "ws://ops.koreainvestment.com:31000"  # 모의투자 실시간 시세
 
 # API paths
 TOKEN_PATH = "/oauth2/tokenP"  # 토큰발급
+APPROVAL_PATH = "/oauth2/Approval"  # 실시간 접속키 발급
 HASHKEY_PATH = "/uapi/hashkey"  # 해시키발급
 
 # Headers and other constants
@@ -183,6 +289,9 @@ class TrIdManager:
 # Token storage
 TOKEN_FILE = Path(__file__).resolve().parent / "token.json"
 
+# Historical bar storage (None if KIS_BAR_STORE=off)
+bar_store = BarStore.from_env(Path(__file__).resolve().parent / "bars.sqlite3")
+
 def load_token():
     """Load token from file if it exists and is not expired"""
     if TOKEN_FILE.exists():
@@ -207,17 +316,15 @@ def save_token(token: str, expires_at: datetime):
     except Exception as e:
         print(f"Error saving token: {e}", file=sys.stderr)
 
-async def get_access_token(client: httpx.AsyncClient) -> str:
+async def issue_access_token() -> tuple[str, datetime]:
     """
-    Get access token with file-based caching
-    Returns cached token if valid, otherwise requests new token
+    Request a new access token from KIS
+
+    Returns:
+        tuple[str, datetime]: (token, expires_at)
     """
-    token, expires_at = load_token()
-    if token and expires_at and datetime.now() < expires_at:
-        return token
-    
-    token_response = await client.post(
-        f"{DOMAIN}{TOKEN_PATH}",
+    token_response = await get_pool().get_client(DOMAIN).post(
+        TOKEN_PATH,
         headers={"content-type": CONTENT_TYPE},
         json={
             "grant_type": "client_credentials",
@@ -233,9 +340,61 @@ async def get_access_token(client: httpx.AsyncClient) -> str:
     token = token_data["access_token"]
     
     expires_at = datetime.now() + timedelta(hours=23)
-    save_token(token, expires_at)
+    return token, expires_at
+
+token_manager = TokenManager.from_env(issue_access_token, load_token, save_token)
+
+async def issue_approval_key() -> str:
+    """
+    Request a WebSocket approval key from KIS
     
-    return token
+    Returns:
+        str: approval_key for realtime subscriptions
+    """
+    response = await get_pool().get_client(DOMAIN).post(
+        APPROVAL_PATH,
+        headers={"content-type": CONTENT_TYPE},
+        json={
+            "grant_type": "client_credentials",
+            "appkey": os.environ["KIS_APP_KEY"],
+            "secretkey": os.environ["KIS_APP_SECRET"]
+        }
+    )
+    
+    if response.status_code != 200:
+        raise Exception(f"Failed to get approval key: {response.text}")
+    
+    return response.json()["approval_key"]
+
+realtime_client = RealtimeClient.from_env(
+    issue_approval_key,
+    WS_URL if os.environ.get("KIS_ACCOUNT_TYPE", "REAL").upper() == "REAL" else VIRTUAL_WS_URL,
+)
+order_books = OrderBookEngine.from_env()
+realtime_client.add_listener(order_books.on_record)
+
+async def get_access_token() -> str:
+    """
+    Get access token from the in-memory token manager
+    Falls back to token.json on first use, otherwise requests new token
+    """
+    return await token_manager.get_token()
+
+rate_limiter = RateLimiter.from_env(endpoint_rate_limits())
+retry_policy = RetryPolicy.from_env()
+circuit_breakers = CircuitBreakerRegistry.from_env()
+inflight_requests = SingleFlight()
+response_cache = ResponseCache.from_env(cache_ttls())
+negative_cache = NegativeCache.from_env()
+field_catalogue = FieldCatalogue(output_fields())
+metrics = MetricsRegistry.from_env()
+tracer = tracer_from_env()
+metrics_exporter = PrometheusExporter.from_env(lambda: metrics.prometheus(response_cache.stats()))
+# 실시간 구독 후 연결을 기다리는 최대 시간 (초)
+REALTIME_CONNECT_TIMEOUT = 5.0
+REALTIME_MSG = "실시간 체결 데이터에서 조회되었습니다"
+# 일괄 조회 도구에서 동시에 진행할 최대 요청 수
+BATCH_CONCURRENCY = int(os.environ.get("KIS_BATCH_CONCURRENCY", 10))
 
 async def make_api_request(
     api_url: str,
@@ -246,6 +405,9 @@ async def make_api_request(
     """
     Helper function to make API requests with common HTTP client pattern.
     
+    Concurrent calls with the same domain, api_url, tr_id and params share a
+    single upstream request; the returned dict is shared and must not be mutated.
+    
     Args:
         api_url (str): API endpoint URL path
         tr_id (str): Transaction ID for the request
@@ -256,34 +418,298 @@ async def make_api_request(
         dict: JSON response from the API
         
     Raises:
-        Exception: If the API request fails or returns non-200 status code
+        KisApiError: If the API request fails, returns non-200 status code or rt_cd != "0"
+            (transient errors are retried with backoff first)
+        CircuitOpenError: If the endpoint is failing fast after repeated gateway errors
     """
-    async with httpx.AsyncClient() as client:
-        token = await get_access_token(client)
+    response = await request_api(api_url, tr_id, params, operation)
+    return response.body
+
+async def request_endpoint(
+    endpoint: Endpoint,
+    params: dict,
+    max_pages: int = 1,
+    max_rows: int = 0
+) -> dict:
+    """
+    Fetch one page, or up to max_pages pages if the endpoint supports continuation
+    
+    Args:
+        endpoint (Endpoint): Registered endpoint (endpoints.ENDPOINTS)
+        params (dict): Parameters of the first page (Endpoint.build)
+        max_pages (int): Maximum number of pages to fetch (default: 1)
+        max_rows (int): Stop once this many rows were collected (default: 0, no limit)
         
-        response = await client.get(
-            f"{TrIdManager.get_domain(operation)}{api_url}",
-            headers={
-                "content-type": CONTENT_TYPE,
-                "authorization": f"{AUTH_TYPE} {token}",
-                "appkey": os.environ["KIS_APP_KEY"],
-                "appsecret": os.environ["KIS_APP_SECRET"],
-                "tr_id": tr_id,
-            },
-            params=params,
-        )
+    Returns:
+        dict: JSON response, list outputs concatenated across pages
+    """
+    if endpoint.scheme is None or (max_pages <= 1 and not max_rows):
+        return await make_api_request(endpoint.path, endpoint.tr_id, params, endpoint.operation)
+    
+    fetch = page_fetcher(endpoint.path, endpoint.tr_id, endpoint.operation)
+    return await collect_pages(fetch, endpoint.scheme, params, max_pages, max_rows)
+
+def page_fetcher(api_url: str, tr_id: str, operation: str = "buy") -> Fetch:
+    """
+    Build a page fetch function for continuation-based APIs
+    
+    Args:
+        api_url (str): API endpoint URL path
+        tr_id (str): Transaction ID for the request
+        operation (str): Operation type for domain selection (default: "buy")
+        
+    Returns:
+        Fetch: Coroutine function (params, tr_cont) -> (body, response tr_cont)
+    """
+    async def fetch(page_params: dict, tr_cont: str) -> tuple[dict, str]:
+        response = await request_api(api_url, tr_id, page_params, operation, tr_cont=tr_cont)
+        return response.body, response.tr_cont
+    
+    return fetch
+
+def shape_response(
+    endpoint: Endpoint,
+    response: dict,
+    fields: Optional[list[str]] = None,
+    columnar: bool = False
+) -> dict:
+    """
+    Project a response onto the requested output fields and optionally convert it to columns
+    
+    Args:
+        endpoint (Endpoint): Endpoint that produced the response
+        response (dict): KIS response
+        fields (Optional[list[str]]): Output fields to keep, None or empty for all
+            (checked with field_catalogue.validate before the request)
+        columnar (bool): Convert output2 to typed columns (endpoint.columnar schema)
         
-        if response.status_code != 200:
-            raise Exception(f"Failed to make API request to {api_url}: {response.text}")
+    Returns:
+        dict: Shaped response
+    """
+    if fields:
+        response = project(response, fields)
+    return columnar_response(response, endpoint.columnar) if columnar else response
+
+async def call_endpoint(
+    endpoint: Endpoint,
+    params: dict,
+    fields: Optional[list[str]] = None,
+    max_pages: int = 1,
+    max_rows: int = 0,
+    columnar: bool = False
+) -> dict:
+    """
+    Request an endpoint and shape the response (the common body of quotation tools)
+    
+    Args:
+        endpoint (Endpoint): Registered endpoint (endpoints.ENDPOINTS)
+        params (dict): Request parameters (Endpoint.build)
+        fields (Optional[list[str]]): Output fields to keep, None or empty for all
+        max_pages (int): Maximum number of pages to fetch (default: 1)
+        max_rows (int): Stop once this many rows were collected (default: 0, no limit)
+        columnar (bool): Convert output2 to typed columns
         
-        return response.json()
+    Returns:
+        dict: Shaped response
+    """
+    response = await request_endpoint(endpoint, params, max_pages, max_rows)
+    return shape_response(endpoint, response, fields, columnar)
+
+def parse_symbols(symbols: list[str]) -> list[tuple[str, str]]:
+    """
+    Parse "EXCD:SYMB" entries (e.g. "NAS:AAPL")
+    
+    Args:
+        symbols (list[str]): Symbols prefixed with their exchange code
+        
+    Returns:
+        list[tuple[str, str]]: (excd, symb) pairs, duplicates removed in order
+    """
+    pairs = []
+    for symbol in symbols:
+        excd, sep, symb = symbol.strip().partition(":")
+        if not sep or not excd or not symb:
+            raise ValueError(f"symbols must be 'EXCD:SYMB' (e.g. 'NAS:AAPL'), got '{symbol}'")
+        pair = (excd.strip().upper(), symb.strip().upper())
+        if pair not in pairs:
+            pairs.append(pair)
+    return pairs
+
+class ApiResponse(NamedTuple):
+    """Decoded KIS response"""
+    body: dict  # JSON body
+    nbytes: int  # Size of the raw body in bytes
+    tr_cont: str  # tr_cont response header (M/F: more pages, D/E: last page)
+
+async def request_api(
+    api_url: str,
+    tr_id: str,
+    params: dict,
+    operation: str = "buy",
+    tr_cont: str = ""
+) -> ApiResponse:
+    """
+    Serve a request from the response cache or a coalesced upstream call
+    
+    빈 응답과 재시도해도 바뀌지 않는 오류(입력값 오류 등)는 negative_cache에 짧게 보관하여
+    같은 요청이 반복되면 KIS를 호출하지 않고 같은 결과를 반환합니다.
+    
+    Args:
+        api_url (str): API endpoint URL path
+        tr_id (str): Transaction ID for the request
+        params (dict): Request parameters
+        operation (str): Operation type for domain selection (default: "buy")
+        tr_cont (str): tr_cont request header ("N" for a continuation page)
+        
+    Returns:
+        ApiResponse: Decoded response, shared between callers
+        
+    Raises:
+        KisApiError: If KIS rejected this request (also when served from negative_cache)
+    """
+    domain = TrIdManager.get_domain(operation)
+    key = (domain, api_url, tr_id, tr_cont, tuple(sorted(params.items())))
+    with tracer.span("kis.request", tr_id=tr_id, api_url=api_url, tr_cont=tr_cont) as span:
+        # negative_cache를 먼저 확인하여 여기서 응답한 요청이 response_cache 미스로 집계되지 않도록 함
+        cached = negative_cache.get(key)
+        if cached is not None:
+            span.set_attribute("cache", "negative")
+            if isinstance(cached, KisApiError):
+                # 저장된 예외를 여러 호출자가 동시에 raise하지 않도록 복사
+                raise copy.copy(cached)
+        else:
+            cached = response_cache.get(key, tr_id)
+            span.set_attribute("cache", "miss" if cached is None else "hit")
+        if cached is not None:
+            span.set_attribute("response_bytes", cached.nbytes)
+            return cached
+        
+        async def fetch() -> ApiResponse:
+            try:
+                response = await send_api_request(domain, api_url, tr_id, params, tr_cont)
+            except KisApiError as e:
+                if not e.transient:
+                    negative_cache.put(key, e)
+                raise
+            field_catalogue.record(tr_id, response.body)
+            response_cache.put(key, tr_id, params, response, response.nbytes)
+            if is_empty(response.body):
+                negative_cache.put(key, response)
+            return response
+        
+        response = await inflight_requests.do(key, fetch)
+        span.set_attribute("response_bytes", response.nbytes)
+        return response
+
+async def send_api_request(
+    domain: str,
+    api_url: str,
+    tr_id: str,
+    params: dict,
+    tr_cont: str = ""
+) -> ApiResponse:
+    """
+    Send one logical request to KIS, retrying transient failures
+    
+    Args:
+        domain (str): Base URL to send the request to
+        api_url (str): API endpoint URL path
+        tr_id (str): Transaction ID for the request
+        params (dict): Request parameters
+        tr_cont (str): tr_cont request header ("N" for a continuation page)
+        
+    Returns:
+        ApiResponse: Decoded response body, its raw size and tr_cont header
+    """
+    breaker = circuit_breakers.get(api_url)
+    
+    for attempt in range(retry_policy.max_attempts):
+        breaker.before_request()
+        started = time.perf_counter()
+        token = await get_access_token()
+        token_done = time.perf_counter()
+        queued = await rate_limiter.acquire(os.environ["KIS_APP_KEY"], tr_id)
+        sent = time.perf_counter()
+        
+        try:
+            response = await get_pool().get_client(domain).get(
+                api_url,
+                headers=api_headers(token, tr_id, tr_cont),
+                params=params,
+            )
+        except httpx.TransportError as e:
+            error = KisApiError(
+                f"Failed to make API request to {api_url}: {e!r}", kind=ErrorKind.SERVER_BUSY
+            )
+            phases = {"token": token_done - started, "queue": queued, "network": time.perf_counter() - sent}
+            metrics.record_request(tr_id, phases, error="transport")
+            tracer.record_phases(started, phases, attempt=attempt, error="transport")
+        else:
+            received = time.perf_counter()
+            try:
+                body = codec.loads_response(response.content)
+            except ValueError:
+                body = None
+            error = classify_response(api_url, response.status_code, body, response.text)
+            phases = {
+                "token": token_done - started, "queue": queued, "network": received - sent,
+                "parse": time.perf_counter() - received,
+            }
+            failure = (error.msg_cd or error.kind) if error else ""
+            metrics.record_request(tr_id, phases, len(response.content), error=failure)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"{tr_id} {api_url} -> {response.status_code} {failure or 'ok'} in {phases['network'] * 1000:.1f}ms",
+                    extra={"tr_id": tr_id, "api_url": api_url, "latency_ms": round(phases["network"] * 1000, 3),
+                           "msg_cd": failure, "attempt": attempt},
+                )
+            tracer.record_phases(
+                started, phases, attempt=attempt, status=response.status_code, bytes=len(response.content), error=failure
+            )
+            if error is None:
+                breaker.record_success()
+                return ApiResponse(body, len(response.content), response.headers.get("tr_cont", ""))
+        
+        breaker.record_failure(error)
+        if not retry_policy.should_retry(error, attempt):
+            raise error
+        
+        if error.kind == ErrorKind.TOKEN_EXPIRED:
+            token_manager.invalidate(token)
+        delay = retry_policy.delay(error, attempt)
+        logger.warning(
+            f"Retrying {tr_id} in {delay:.2f}s after {error.kind}: {error}",
+            extra={"tr_id": tr_id, "api_url": api_url, "msg_cd": error.msg_cd or error.kind, "attempt": attempt},
+        )
+        await asyncio.sleep(delay)
+
+def api_headers(token: str, tr_id: str, tr_cont: str = "") -> dict:
+    """
+    Build the request headers of a KIS quotation API call
+    
+    Args:
+        token (str): Access token
+        tr_id (str): Transaction ID for the request
+        tr_cont (str): tr_cont request header ("N" for a continuation page)
+        
+    Returns:
+        dict: HTTP headers
+    """
+    return {
+        "content-type": CONTENT_TYPE,
+        "authorization": f"{AUTH_TYPE} {token}",
+        "appkey": os.environ["KIS_APP_KEY"],
+        "appsecret": os.environ["KIS_APP_SECRET"],
+        "tr_id": tr_id,
+        "tr_cont": tr_cont,
+    }
 
 async def get_hashkey(client: httpx.AsyncClient, token: str, body: dict) -> str:
     """
     Get hash key for order request
     
     Args:
-        client: httpx client
+        client: httpx client bound to TrIdManager.get_domain('buy')
         token: Access token
         body: Request body
         
@@ -291,7 +717,7 @@ async def get_hashkey(client: httpx.AsyncClient, token: str, body: dict) -> str:
         str: Hash key
     """
     response = await client.post(
-        f"{TrIdManager.get_domain('buy')}{HASHKEY_PATH}",
+        HASHKEY_PATH,
         headers={
             "content-type": CONTENT_TYPE,
             "authorization": f"{AUTH_TYPE} {token}",
@@ -307,6 +733,71 @@ async def get_hashkey(client: httpx.AsyncClient, token: str, body: dict) -> str:
     return response.json()["HASH"]
 
 
+@mcp.resource(
+    "kis://rate-limits",
+    name="rate-limits",
+    description="클라이언트 측 요청 제한 상태 (대기열 길이, 대기 시간)",
+    mime_type="application/json"
+)
+def rate_limits() -> str:
+    """Current queue depth and wait time per rate-limit bucket"""
+    return json.dumps(rate_limiter.stats())
+
+
+@mcp.resource(
+    "kis://cache",
+    name="cache",
+    description="응답 캐시 상태 (항목 수, 사용량, 적중률, 빈 응답/오류 캐시)",
+    mime_type="application/json"
+)
+def cache_stats() -> str:
+    """Response cache size and hit/miss counters"""
+    return json.dumps({**response_cache.stats(), "negative": negative_cache.stats()})
+
+
+@mcp.resource(
+    "kis://realtime",
+    name="realtime",
+    description="실시간 시세 연결 상태와 종목별 최신 체결/호가",
+    mime_type="application/json"
+)
+def realtime_board() -> str:
+    """Realtime connection state and latest record per subscription"""
+    return json.dumps({
+        **realtime_client.stats(),
+        "board": realtime_client.board.snapshot(),
+        "order_books": order_books.stats(),
+    }, ensure_ascii=False)
+
+
+@mcp.resource(
+    "kis://fields",
+    name="fields",
+    description="tr_id별 출력 필드 목록 (fields 인자에 사용할 수 있는 필드)",
+    mime_type="application/json"
+)
+def field_list() -> str:
+    """Declared output fields for each tr_id, plus any undocumented ones seen in responses"""
+    return json.dumps(field_catalogue.snapshot())
+
+
+@mcp.resource(
+    "kis://metrics",
+    name="metrics",
+    description="도구별/tr_id별 호출 수, 오류, 구간별 지연 시간, 캐시 적중률, 수신 bytes",
+    mime_type="application/json"
+)
+def metrics_snapshot() -> str:
+    """Per-tool and per-tr_id metrics"""
+    return json.dumps(metrics.snapshot(response_cache.stats()))
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def prometheus_metrics(request: Request) -> PlainTextResponse:
+    """Prometheus text endpoint (SSE / streamable HTTP transports)"""
+    return PlainTextResponse(metrics.prometheus(response_cache.stats()), media_type="text/plain; version=0.0.4")
+
+
 @mcp.tool(
     name="period_rights",
     description="시세분석 > 해외주식 기간별권리조회",
@@ -321,6 +812,9 @@ async def period_rights(
     prdt_type_cd: str = "",  # 상품유형코드
     NK50: str = "",  # 연속조회키50
     FK50: str = "",  # 연속조회검색조건키50
+    max_pages: int = 1,  # 최대 조회 페이지 수
+    max_rows: int = 0,  # 최대 조회 건수
+    fields: Optional[list[str]] = None,  # 반환할 필드 목록
 ):
     """
     해외주식 기간별권리조회 API입니다.
@@ -337,39 +831,20 @@ async def period_rights(
         prdt_type_cd (str): 상품유형코드
         NK50 (str): 연속조회키50
         FK50 (str): 연속조회검색조건키50
+        max_pages (int): 연속조회로 가져올 최대 페이지 수 (default: 1, 최대 50)
+        max_rows (int): 이 건수 이상 모이면 조회 중단 (default: 0, 제한 없음)
+        fields (list[str]): 반환할 출력 필드 목록 (ex. ["bass_dt", "pdno", "cash_alct_rt"], 생략 시 전체 필드, kis://fields 리소스 참고)
 
     Returns:
         pd.DataFrame: 해외주식 기간별권리조회 데이터
     """
-    # 필수 파라미터 검증
-    if rght_type_cd == "":
-        raise ValueError(
-            "rght_type_cd is required (e.g. '%%:전체, 01:유상, 02:무상, 03:배당, 11:합병,14:액면분할, 15:액면병합, 17:감자, 54:WR청구,61:원리금상환, 71:WR소멸, 74:배당옵션, 75:특별배당, 76:ISINCODE변경, 77:실권주청약')")
-
-    if inqr_dvsn_cd == "":
-        raise ValueError("inqr_dvsn_cd is required (e.g. '02:현지기준일, 03:청약시작일, 04:청약종료일')")
-
-    if inqr_strt_dt == "":
-        raise ValueError("inqr_strt_dt is required (e.g. '20250101')")
-
-    if inqr_end_dt == "":
-        raise ValueError("inqr_end_dt is required (e.g. '20250131')")
-
-    tr_id = "CTRGT011R"  # 해외주식 기간별권리조회
-    api_url = "/uapi/overseas-price/v1/quotations/period-rights"
-
-    params = {
-        "RGHT_TYPE_CD": rght_type_cd,  # 권리유형코드
-        "INQR_DVSN_CD": inqr_dvsn_cd,  # 조회구분코드
-        "INQR_STRT_DT": inqr_strt_dt,  # 조회시작일자
-        "INQR_END_DT": inqr_end_dt,  # 조회종료일자
-        "PDNO": pdno,  # 상품번호
-        "PRDT_TYPE_CD": prdt_type_cd,  # 상품유형코드
-        "CTX_AREA_NK50": NK50,  # 연속조회키50
-        "CTX_AREA_FK50": FK50  # 연속조회검색조건키50
-    }
-
-    return await make_api_request(api_url, tr_id, params)
+    endpoint = ENDPOINTS["period_rights"]
+    params = endpoint.build(
+        rght_type_cd=rght_type_cd, inqr_dvsn_cd=inqr_dvsn_cd, inqr_strt_dt=inqr_strt_dt, inqr_end_dt=inqr_end_dt,
+        pdno=pdno, prdt_type_cd=prdt_type_cd, NK50=NK50, FK50=FK50,
+    )
+    field_catalogue.validate(endpoint.tr_id, fields)
+    return await call_endpoint(endpoint, params, fields, max_pages, max_rows)
 
 @mcp.tool(
     name="price",
@@ -380,6 +855,7 @@ async def price(
     auth: str,  # 사용자권한정보
     excd: str,  # 거래소코드
     symb: str,  # 종목코드
+    fields: Optional[list[str]] = None,  # 반환할 필드 목록
 ):
     """
     [해외주식] 기본시세
@@ -390,29 +866,77 @@ async def price(
         auth (str): 사용자권한정보
         excd (str): 거래소코드 (예: "NAS")
         symb (str): 종목코드 (예: "AAPL")
+        fields (list[str]): 반환할 출력 필드 목록 (ex. ["last", "rate"], 생략 시 전체 필드, kis://fields 리소스 참고)
 
     Returns:
         Optional[pd.DataFrame]: 해외주식 현재체결가 데이터
     """
-    # 필수 파라미터 검증
-    if not excd:
-        logger.error("excd is required. (e.g. 'NAS')")
-        raise ValueError("excd is required. (e.g. 'NAS')")
+    endpoint = ENDPOINTS["price"]
+    params = endpoint.build(auth=auth, excd=excd, symb=symb)
+    field_catalogue.validate(endpoint.tr_id, fields)
 
-    if not symb:
-        logger.error("symb is required. (e.g. 'AAPL')")
-        raise ValueError("symb is required. (e.g. 'AAPL')")
+    # 실시간 체결을 구독 중인 종목은 최신 체결 데이터로 응답
+    tick = realtime_client.latest(TRADE_TR_ID, tr_key(params["EXCD"], params["SYMB"]))
+    if tick is not None:
+        response = {"rt_cd": "0", "msg_cd": "", "msg1": REALTIME_MSG, "output": price_output(tick)}
+        return shape_response(endpoint, response, fields)
+    return await call_endpoint(endpoint, params, fields)
 
-    tr_id = "HHDFS00000300"
-    api_url = "/uapi/overseas-price/v1/quotations/price"
 
-    params = {
-        "AUTH": auth,
-        "EXCD": excd,
-        "SYMB": symb,
-    }
+@mcp.tool(
+    name="realtime-subscribe",
+    description="실시간시세 > 해외주식 실시간 체결/호가 구독",
+    annotations=realtime_subscribe_annotations
+)
+async def realtime_subscribe(
+    symbols: list[str],  # 종목 목록 (거래소코드:종목코드)
+    quotes: bool = False,  # 호가 구독 여부
+):
+    """
+    해외주식 실시간지연체결가(HDFSCNT0)를 WebSocket으로 구독합니다.
+    구독 중인 종목은 price 도구가 KIS에 요청하지 않고 최신 체결 데이터로 응답합니다.
+
+    Args:
+        symbols (list[str]): [필수] 종목 목록, "거래소코드:종목코드" 형식 (ex. ["NAS:AAPL", "NYS:KO"])
+        quotes (bool): True이면 실시간호가(HDFSASP0, 미국)도 함께 구독
+
+    Returns:
+        dict: 실시간 연결 상태와 구독 목록
+    """
+    if not symbols:
+        raise ValueError("symbols is required (e.g. ['NAS:AAPL', 'NAS:TSLA'])")
+
+    for excd, symb in parse_symbols(symbols):
+        await realtime_client.subscribe(TRADE_TR_ID, tr_key(excd, symb))
+        if quotes:
+            await realtime_client.subscribe(QUOTE_TR_ID, tr_key(excd, symb))
 
-    return await make_api_request(api_url, tr_id, params)
+    await realtime_client.wait_connected(REALTIME_CONNECT_TIMEOUT)
+    return realtime_client.stats()
+
+
+@mcp.tool(
+    name="realtime-unsubscribe",
+    description="실시간시세 > 해외주식 실시간 체결/호가 구독 해제",
+    annotations=realtime_unsubscribe_annotations
+)
+async def realtime_unsubscribe(
+    symbols: list[str],  # 종목 목록 (거래소코드:종목코드)
+):
+    """
+    해외주식 실시간 체결/호가 구독을 해제합니다.
+
+    Args:
+        symbols (list[str]): [필수] 종목 목록, "거래소코드:종목코드" 형식 (ex. ["NAS:AAPL"])
+
+    Returns:
+        dict: 실시간 연결 상태와 구독 목록
+    """
+    for excd, symb in parse_symbols(symbols):
+        await realtime_client.unsubscribe(TRADE_TR_ID, tr_key(excd, symb))
+        await realtime_client.unsubscribe(QUOTE_TR_ID, tr_key(excd, symb))
+        order_books.discard(tr_key(excd, symb))
+    return realtime_client.stats()
 
 
 @mcp.tool(
@@ -429,7 +953,8 @@ async def brknews_title(
     fid_input_date_1: str = "",  # 입력날짜1
     fid_input_hour_1: str = "",  # 입력시각1
     fid_rank_sort_cls_code: str = "",  # 순위정렬구분코드
-    fid_input_srno: str = ""  # 입력일련번호
+    fid_input_srno: str = "",  # 입력일련번호
+    fields: Optional[list[str]] = None,  # 반환할 필드 목록
 ):
     """
     해외속보(제목) API입니다.
@@ -447,32 +972,20 @@ async def brknews_title(
         fid_input_hour_1 (str): 입력시각1
         fid_rank_sort_cls_code (str): 순위정렬구분코드
         fid_input_srno (str): 입력일련번호
+        fields (list[str]): 반환할 출력 필드 목록 (ex. ["data_dt", "data_tm", "hts_pbnt_titl_cntt"], 생략 시 전체 필드, kis://fields 리소스 참고)
 
     Returns:
         pd.DataFrame: 해외속보(제목) 데이터
     """
-    if fid_news_ofer_entp_code == "":
-        raise ValueError("fid_news_ofer_entp_code is required (e.g. '0')")
-
-    if fid_cond_scr_div_code == "":
-        raise ValueError("fid_cond_scr_div_code is required (e.g. '11801')")
-
-    tr_id = "FHKST01011801"
-    api_url = "/uapi/overseas-price/v1/quotations/brknews-title"
-
-    params = {
-        "FID_NEWS_OFER_ENTP_CODE": fid_news_ofer_entp_code,
-        "FID_COND_SCR_DIV_CODE": fid_cond_scr_div_code,
-        "FID_COND_MRKT_CLS_CODE": fid_cond_mrkt_cls_code,
-        "FID_INPUT_ISCD": fid_input_iscd,
-        "FID_TITL_CNTT": fid_titl_cntt,
-        "FID_INPUT_DATE_1": fid_input_date_1,
-        "FID_INPUT_HOUR_1": fid_input_hour_1,
-        "FID_RANK_SORT_CLS_CODE": fid_rank_sort_cls_code,
-        "FID_INPUT_SRNO": fid_input_srno
-    }
-
-    return await make_api_request(api_url, tr_id, params)
+    endpoint = ENDPOINTS["brknews-title"]
+    params = endpoint.build(
+        fid_news_ofer_entp_code=fid_news_ofer_entp_code, fid_cond_scr_div_code=fid_cond_scr_div_code,
+        fid_cond_mrkt_cls_code=fid_cond_mrkt_cls_code, fid_input_iscd=fid_input_iscd, fid_titl_cntt=fid_titl_cntt,
+        fid_input_date_1=fid_input_date_1, fid_input_hour_1=fid_input_hour_1,
+        fid_rank_sort_cls_code=fid_rank_sort_cls_code, fid_input_srno=fid_input_srno,
+    )
+    field_catalogue.validate(endpoint.tr_id, fields)
+    return await call_endpoint(endpoint, params, fields)
 
 
 @mcp.tool(
@@ -486,6 +999,9 @@ async def inquire_ccnl(
     symb: str,         # [필수] 종목코드 (ex. 해외종목코드)
     auth: str = "",    # 사용자권한정보
     keyb: str = "",    # NEXT KEY BUFF
+    max_pages: int = 1,  # 최대 조회 페이지 수
+    max_rows: int = 0,  # 최대 조회 건수
+    fields: Optional[list[str]] = None,  # 반환할 필드 목록
 ):
     """
     해외주식 체결추이 API입니다.
@@ -496,31 +1012,17 @@ async def inquire_ccnl(
         symb (str): [필수] 종목코드 (ex. 해외종목코드)
         auth (str): 사용자권한정보
         keyb (str): NEXT KEY BUFF
+        max_pages (int): 연속조회로 가져올 최대 페이지 수 (default: 1, 최대 50)
+        max_rows (int): 이 건수 이상 모이면 조회 중단 (default: 0, 제한 없음)
+        fields (list[str]): 반환할 출력 필드 목록 (ex. ["khms", "last", "evol"], 생략 시 전체 필드, kis://fields 리소스 참고)
 
     Returns:
         pd.DataFrame: 해외주식 체결추이 데이터
     """
-    if excd == "":
-        raise ValueError("excd is required (e.g. 'NAS')")
-
-    if tday == "":
-        raise ValueError("tday is required (e.g. '0' or '1')")
-
-    if symb == "":
-        raise ValueError("symb is required (e.g. 'TSLA')")
-
-    tr_id = "HHDFS76200300"
-    api_url = "/uapi/overseas-price/v1/quotations/inquire-ccnl"
-
-    params = {
-        "EXCD": excd,
-        "TDAY": tday,
-        "SYMB": symb,
-        "AUTH": auth,
-        "KEYB": keyb
-    }
-
-    return await make_api_request(api_url, tr_id, params)
+    endpoint = ENDPOINTS["inquire-ccnl"]
+    params = endpoint.build(excd=excd, tday=tday, symb=symb, auth=auth, keyb=keyb)
+    field_catalogue.validate(endpoint.tr_id, fields)
+    return await call_endpoint(endpoint, params, fields, max_pages, max_rows)
 
 
 @mcp.tool(
@@ -532,6 +1034,7 @@ async def price_detail(
     auth: str,  # 사용자권한정보
     excd: str,  # 거래소명
     symb: str,  # 종목코드
+    fields: Optional[list[str]] = None,  # 반환할 필드 목록
 ):
     """
     [해외주식] 기본시세
@@ -542,28 +1045,72 @@ async def price_detail(
         auth (str): 사용자권한정보
         excd (str): 거래소명 (예: HKS, NYS, NAS, AMS, TSE, SHS, SZS, SHI, SZI, HSX, HNX, BAY, BAQ, BAA)
         symb (str): 종목코드
+        fields (list[str]): 반환할 출력 필드 목록 (ex. ["last", "perx", "h52p"], 생략 시 전체 필드, kis://fields 리소스 참고)
 
     Returns:
         Optional[pd.DataFrame]: 해외주식 현재가상세 데이터
     """
-    # [필수 파라미터 검증]
-    if not excd:
-        logger.error("excd is required. (e.g. 'NAS')")
-        raise ValueError("excd is required. (e.g. 'NAS')")
-    if not symb:
-        logger.error("symb is required. (e.g. 'TSLA')")
-        raise ValueError("symb is required. (e.g. 'TSLA')")
-
-    tr_id = "HHDFS76200200"
-    api_url = "/uapi/overseas-price/v1/quotations/price-detail"
-
-    params = {
-        "AUTH": auth,
-        "EXCD": excd,
-        "SYMB": symb,
-    }
+    endpoint = ENDPOINTS["price-detail"]
+    params = endpoint.build(auth=auth, excd=excd, symb=symb)
+    field_catalogue.validate(endpoint.tr_id, fields)
+    return await call_endpoint(endpoint, params, fields)
 
-    return await make_api_request(api_url, tr_id, params)
+
+@mcp.tool(
+    name="batch-price",
+    description="기본시세 > 해외주식 현재체결가 일괄조회",
+    annotations=batch_price_annotations
+)
+async def batch_price(
+    symbols: list[str],  # 종목 목록 (거래소코드:종목코드)
+    detail: bool = False,  # 현재가상세 조회 여부
+    auth: str = "",  # 사용자권한정보
+    fields: Optional[list[str]] = None,  # 반환할 필드 목록
+):
+    """
+    여러 종목의 현재체결가(또는 현재가상세)를 동시에 조회하여 하나의 목록으로 반환합니다.
+    동시 요청 수는 KIS_BATCH_CONCURRENCY로 제한되며, 초당 요청 수는 rate limiter가 제한합니다.
+
+    Args:
+        symbols (list[str]): [필수] 종목 목록, "거래소코드:종목코드" 형식 (ex. ["NAS:AAPL", "NYS:KO"])
+        detail (bool): True이면 현재가상세(price-detail), False이면 현재체결가(price) 조회
+        auth (str): 사용자권한정보
+        fields (list[str]): 반환할 출력 필드 목록 (ex. ["last", "rate"], 생략 시 전체 필드, kis://fields 리소스 참고)
+
+    Returns:
+        dict: 종목별 시세 (output: excd, symb와 시세 필드) 및 실패한 종목 (errors: excd, symb, error)
+    """
+    if not symbols:
+        raise ValueError("symbols is required (e.g. ['NAS:AAPL', 'NAS:TSLA'])")
+
+    pairs = parse_symbols(symbols)
+    quote = price_detail if detail else price
+    field_catalogue.validate(ENDPOINTS["price-detail" if detail else "price"].tr_id, fields)
+    semaphore = asyncio.Semaphore(max(1, BATCH_CONCURRENCY))
+
+    async def fetch(excd: str, symb: str) -> dict:
+        async with semaphore:
+            return await quote(auth, excd, symb, fields=fields)
+
+    results = await asyncio.gather(*(fetch(excd, symb) for excd, symb in pairs), return_exceptions=True)
+
+    output = []
+    errors = []
+    for (excd, symb), result in zip(pairs, results):
+        if isinstance(result, BaseException):
+            if not isinstance(result, Exception):
+                raise result
+            errors.append({"excd": excd, "symb": symb, "error": str(result)})
+        else:
+            # 캐시된 응답을 공유하므로 복사하여 종목 정보를 추가
+            output.append({"excd": excd, "symb": symb, **(result.get("output") or {})})
+
+    return {
+        "rt_cd": "0",
+        "msg1": f"{len(output)}/{len(pairs)}개 종목 조회 완료",
+        "output": output,
+        "errors": errors,
+    }
 
 
 @mcp.tool(
@@ -580,6 +1127,9 @@ async def news_title(
     data_dt: str = "",  # [필수] 조회일자
     data_tm: str = "",  # [필수] 조회시간
     cts: str = "",  # [필수] 다음키
+    max_pages: int = 1,  # 최대 조회 페이지 수
+    max_rows: int = 0,  # 최대 조회 건수
+    fields: Optional[list[str]] = None,  # 반환할 필드 목록
 ):
     """
     해외뉴스종합(제목) API입니다.
@@ -594,25 +1144,20 @@ async def news_title(
         data_dt (str): [필수] 조회일자
         data_tm (str): [필수] 조회시간
         cts (str): [필수] 다음키
+        max_pages (int): 연속조회로 가져올 최대 페이지 수 (default: 1, 최대 50)
+        max_rows (int): 이 건수 이상 모이면 조회 중단 (default: 0, 제한 없음)
+        fields (list[str]): 반환할 출력 필드 목록 (ex. ["data_dt", "symb", "title"], 생략 시 전체 필드, kis://fields 리소스 참고)
 
     Returns:
         pd.DataFrame: 해외뉴스종합(제목) 데이터
     """
-    tr_id = "HHPSTH60100C1"  # 해외뉴스종합(제목)
-    api_url = "/uapi/overseas-price/v1/quotations/news-title"
-
-    params = {
-        "INFO_GB": info_gb,  # 뉴스구분
-        "CLASS_CD": class_cd,  # 중분류
-        "NATION_CD": nation_cd,  # 국가코드
-        "EXCHANGE_CD": exchange_cd,  # 거래소코드
-        "SYMB": symb,  # 종목코드
-        "DATA_DT": data_dt,  # 조회일자
-        "DATA_TM": data_tm,  # 조회시간
-        "CTS": cts  # 다음키
-    }
-
-    return await make_api_request(api_url, tr_id, params)
+    endpoint = ENDPOINTS["news-title"]
+    params = endpoint.build(
+        info_gb=info_gb, class_cd=class_cd, nation_cd=nation_cd, exchange_cd=exchange_cd, symb=symb, data_dt=data_dt,
+        data_tm=data_tm, cts=cts,
+    )
+    field_catalogue.validate(endpoint.tr_id, fields)
+    return await call_endpoint(endpoint, params, fields, max_pages, max_rows)
 
 
 @mcp.tool(
@@ -630,6 +1175,10 @@ async def inquire_time_itemchartprice(
     nrec: str,  # 요청갯수
     fill: str,  # 미체결채움구분
     keyb: str,  # NEXT KEY BUFF
+    max_pages: int = 1,  # 최대 조회 페이지 수
+    max_rows: int = 0,  # 최대 조회 건수
+    columnar: bool = False,  # 컬럼 형식 응답 여부
+    fields: Optional[list[str]] = None,  # 반환할 필드 목록
 ):
     """
     [해외주식] 기본시세
@@ -646,43 +1195,103 @@ async def inquire_time_itemchartprice(
         nrec (str): 레코드요청갯수 (최대 120)
         fill (str): "" 공백으로 입력
         keyb (str): 처음 조회 시, "" 공백 입력 다음 조회 시, 이전 조회 결과의 마지막 분봉 데이터를 이용하여, 1분 전 혹은 n분 전의 시간을 입력  (형식: YYYYMMDDHHMMSS, ex. 20241014140100)
+        max_pages (int): 연속조회로 가져올 최대 페이지 수 (default: 1, 최대 50)
+        max_rows (int): 이 건수 이상 모이면 조회 중단 (default: 0, 제한 없음)
+        columnar (bool): True이면 output2를 숫자형 컬럼 배열로 변환하여 반환
+        fields (list[str]): 반환할 출력 필드 목록 (ex. ["xymd", "xhms", "last", "evol"], 생략 시 전체 필드, kis://fields 리소스 참고)
 
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: 해외주식분봉조회 데이터
     """
-    # [필수 파라미터 검증]
-    if not excd:
-        logger.error("excd is required. (e.g. 'NAS')")
-        raise ValueError("excd is required. (e.g. 'NAS')")
-    if not symb:
-        logger.error("symb is required. (e.g. 'TSLA')")
-        raise ValueError("symb is required. (e.g. 'TSLA')")
+    endpoint = ENDPOINTS["inquire-time-itemchartprice"]
+    params = endpoint.build(
+        auth=auth, excd=excd, symb=symb, nmin=nmin, pinc=pinc, next=next, nrec=nrec, fill=fill, keyb=keyb,
+    )
+    field_catalogue.validate(endpoint.tr_id, fields)
+    return await call_endpoint(endpoint, params, fields, max_pages, max_rows, columnar)
+
+
+@mcp.tool(
+    name="backfill-time-itemchartprice",
+    description="기본시세 > 해외주식분봉 과거구간 일괄조회",
+    annotations=backfill_time_itemchartprice_annotations
+)
+async def backfill_time_itemchartprice(
+    symbols: list[str],  # 종목 목록 (거래소코드:종목코드)
+    start: str,  # 조회시작시각
+    nmin: str = "1",  # 분간격
+    store: bool = False,  # 로컬 저장소 저장 여부
+    include_rows: bool = True,  # 분봉 데이터 반환 여부
+    max_pages: int = MAX_BACKFILL_PAGES,  # 종목당 최대 조회 페이지 수
+    auth: str = "",  # 사용자권한정보
+    fields: Optional[list[str]] = None,  # 반환할 필드 목록
+):
+    """
+    해외주식분봉조회를 연속조회하여 여러 종목의 과거 분봉을 start 시각까지 채웁니다.
+    KEYB는 이전 결과의 가장 오래된 분봉 시각에서 nmin분을 뺀 값으로 자동 계산하며,
+    종목별 요청은 동시에 진행되고 초당 요청 수는 rate limiter가 제한합니다.
+
+    Args:
+        symbols (list[str]): [필수] 종목 목록, "거래소코드:종목코드" 형식 (ex. ["NAS:AAPL", "NYS:KO"])
+        start (str): [필수] 조회시작시각, 거래소 현지 시각 (YYYYMMDD, YYYYMMDDHHMM 또는 YYYYMMDDHHMMSS)
+        nmin (str): 분단위 (1: 1분봉, 2: 2분봉, ...)
+        store (bool): True이면 확정된 분봉을 로컬 저장소(bars.sqlite3)에 저장
+        include_rows (bool): False이면 분봉 데이터 없이 종목별 건수만 반환
+        max_pages (int): 종목당 최대 조회 페이지 수 (1페이지 최대 120건)
+        auth (str): "" 공백으로 입력
+        fields (list[str]): 반환할 출력 필드 목록 (ex. ["xymd", "xhms", "last", "evol"], 생략 시 전체 필드, kis://fields 리소스 참고)
+
+    Returns:
+        dict: 종목별 분봉 데이터 (output: excd, symb, count, pages, complete, oldest, newest, stored, error, output2)
+    """
+    if not symbols:
+        raise ValueError("symbols is required (e.g. ['NAS:AAPL', 'NAS:TSLA'])")
+    if not (start.isdigit() and len(start) in (8, 12, 14)):
+        raise ValueError("start is required (e.g. '20250101', '202501010930')")
     if not nmin:
-        logger.error("nmin is required. (e.g. '5')")
-        raise ValueError("nmin is required. (e.g. '5')")
-    if not pinc:
-        logger.error("pinc is required. (e.g. '1')")
-        raise ValueError("pinc is required. (e.g. '1')")
-    if not nrec or int(nrec) > 120:
-        logger.error("nrec is required. (e.g. '120', 최대120개)")
-        raise ValueError("nrec is required. (e.g. '120', 최대120개)")
-
-    tr_id = "HHDFS76950200"
-    api_url = "/uapi/overseas-price/v1/quotations/inquire-time-itemchartprice"
-
-    params = {
-        "AUTH": auth,
-        "EXCD": excd,
-        "SYMB": symb,
-        "NMIN": nmin,
-        "PINC": pinc,
-        "NEXT": next,
-        "NREC": nrec,
-        "FILL": fill,
-        "KEYB": keyb,
-    }
+        raise ValueError("nmin is required. (e.g. '1')")
+    if store and bar_store is None:
+        raise ValueError("store requires the bar store (KIS_BAR_STORE is off)")
+
+    endpoint = ENDPOINTS["inquire-time-itemchartprice"]
+    field_catalogue.validate(endpoint.tr_id, fields)
 
-    return await make_api_request(api_url, tr_id, params)
+    requests = [
+        endpoint.build(auth=auth, excd=excd, symb=symb, nmin=nmin, pinc="1", next="", nrec="120", fill="", keyb="")
+        for excd, symb in parse_symbols(symbols)
+    ]
+
+    stored: dict[tuple[str, str], int] = {}
+
+    async def save(result: Backfill):
+        if store and result.rows:
+            stored[(result.excd, result.symb)] = await bar_store.store_minute_bars(result.excd, result.symb, nmin, result.rows)
+
+    results = await backfill_many(page_fetcher(endpoint.path, endpoint.tr_id), requests, start.ljust(14, "0"), max_pages, on_done=save)
+
+    output = []
+    for result in results:
+        item = {
+            "excd": result.excd,
+            "symb": result.symb,
+            "count": len(result.rows),
+            "pages": result.pages,
+            "complete": result.complete,
+            "oldest": result.rows[-1]["xymd"] + result.rows[-1]["xhms"] if result.rows else "",
+            "newest": result.rows[0]["xymd"] + result.rows[0]["xhms"] if result.rows else "",
+            "stored": stored.get((result.excd, result.symb), 0),
+            "error": result.error,
+        }
+        if include_rows:
+            item["output2"] = shape_response(endpoint, {"output2": result.rows}, fields).get("output2", [])
+        output.append(item)
+
+    failed = sum(1 for result in results if result.error)
+    return {
+        "rt_cd": "0",
+        "msg1": f"{len(results) - failed}/{len(results)}개 종목 조회 완료",
+        "output": output,
+    }
 
 
 @mcp.tool(
@@ -695,6 +1304,7 @@ async def inquire_time_indexchartprice(
     fid_input_iscd: str,  # 입력 종목코드
     fid_hour_cls_code: str,  # 시간 구분 코드
     fid_pw_data_incu_yn: str,  # 과거 데이터 포함 여부
+    fields: Optional[list[str]] = None,  # 반환할 필드 목록
 ):
     """
     [해외주식] 기본시세
@@ -706,35 +1316,18 @@ async def inquire_time_indexchartprice(
         fid_input_iscd (str): 종목번호(ex. TSLA)
         fid_hour_cls_code (str): 0: 정규장, 1: 시간외
         fid_pw_data_incu_yn (str): Y/N
+        fields (list[str]): 반환할 출력 필드 목록 (ex. ["stck_cntg_hour", "optn_prpr"], 생략 시 전체 필드, kis://fields 리소스 참고)
 
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: 해외지수분봉조회 데이터
     """
-    # [필수 파라미터 검증]
-    if not fid_cond_mrkt_div_code:
-        logger.error("fid_cond_mrkt_div_code is required. (e.g. 'N')")
-        raise ValueError("fid_cond_mrkt_div_code is required. (e.g. 'N')")
-    if not fid_input_iscd:
-        logger.error("fid_input_iscd is required. (e.g. 'SPX')")
-        raise ValueError("fid_input_iscd is required. (e.g. 'SPX')")
-    if not fid_hour_cls_code:
-        logger.error("fid_hour_cls_code is required. (e.g. '0')")
-        raise ValueError("fid_hour_cls_code is required. (e.g. '0')")
-    if not fid_pw_data_incu_yn:
-        logger.error("fid_pw_data_incu_yn is required. (e.g. 'Y')")
-        raise ValueError("fid_pw_data_incu_yn is required. (e.g. 'Y')")
-
-    tr_id = "FHKST03030200"
-    api_url = "/uapi/overseas-price/v1/quotations/inquire-time-indexchartprice"
-
-    params = {
-        "FID_COND_MRKT_DIV_CODE": fid_cond_mrkt_div_code,
-        "FID_INPUT_ISCD": fid_input_iscd,
-        "FID_HOUR_CLS_CODE": fid_hour_cls_code,
-        "FID_PW_DATA_INCU_YN": fid_pw_data_incu_yn,
-    }
-
-    return await make_api_request(api_url, tr_id, params)
+    endpoint = ENDPOINTS["inquire-time-indexchartprice"]
+    params = endpoint.build(
+        fid_cond_mrkt_div_code=fid_cond_mrkt_div_code, fid_input_iscd=fid_input_iscd,
+        fid_hour_cls_code=fid_hour_cls_code, fid_pw_data_incu_yn=fid_pw_data_incu_yn,
+    )
+    field_catalogue.validate(endpoint.tr_id, fields)
+    return await call_endpoint(endpoint, params, fields)
 
 
 @mcp.tool(
@@ -770,6 +1363,9 @@ async def inquire_search(
     co_st_per: str,  # PER시작
     co_en_per: str,  # PER끝
     keyb: str,  # NEXT KEY BUFF
+    max_pages: int = 1,  # 최대 조회 페이지 수
+    max_rows: int = 0,  # 최대 조회 건수
+    fields: Optional[list[str]] = None,  # 반환할 필드 목록
 ):
     """
     [해외주식] 기본시세
@@ -804,49 +1400,25 @@ async def inquire_search(
         co_st_per (str):
         co_en_per (str):
         keyb (str): "" 공백 입력
+        max_pages (int): 연속조회로 가져올 최대 페이지 수 (default: 1, 최대 50)
+        max_rows (int): 이 건수 이상 모이면 조회 중단 (default: 0, 제한 없음)
+        fields (list[str]): 반환할 출력 필드 목록 (ex. ["symb", "last", "per"], 생략 시 전체 필드, kis://fields 리소스 참고)
 
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: 해외주식조건검색 데이터
     """
-    # [필수 파라미터 검증]
-    if not excd:
-        logger.error("excd is required. (e.g. 'NAS')")
-        raise ValueError("excd is required. (e.g. 'NAS')")
-
-    tr_id = "HHDFS76410000"
-    api_url = "/uapi/overseas-price/v1/quotations/inquire-search"
-
-    params = {
-        "AUTH": auth,
-        "EXCD": excd,
-        "CO_YN_PRICECUR": co_yn_pricecur,
-        "CO_ST_PRICECUR": co_st_pricecur,
-        "CO_EN_PRICECUR": co_en_pricecur,
-        "CO_YN_RATE": co_yn_rate,
-        "CO_ST_RATE": co_st_rate,
-        "CO_EN_RATE": co_en_rate,
-        "CO_YN_VALX": co_yn_valx,
-        "CO_ST_VALX": co_st_valx,
-        "CO_EN_VALX": co_en_valx,
-        "CO_YN_SHAR": co_yn_shar,
-        "CO_ST_SHAR": co_st_shar,
-        "CO_EN_SHAR": co_en_shar,
-        "CO_YN_VOLUME": co_yn_volume,
-        "CO_ST_VOLUME": co_st_volume,
-        "CO_EN_VOLUME": co_en_volume,
-        "CO_YN_AMT": co_yn_amt,
-        "CO_ST_AMT": co_st_amt,
-        "CO_EN_AMT": co_en_amt,
-        "CO_YN_EPS": co_yn_eps,
-        "CO_ST_EPS": co_st_eps,
-        "CO_EN_EPS": co_en_eps,
-        "CO_YN_PER": co_yn_per,
-        "CO_ST_PER": co_st_per,
-        "CO_EN_PER": co_en_per,
-        "KEYB": keyb,
-    }
-
-    return await make_api_request(api_url, tr_id, params)
+    endpoint = ENDPOINTS["inquire-search"]
+    params = endpoint.build(
+        auth=auth, excd=excd, co_yn_pricecur=co_yn_pricecur, co_st_pricecur=co_st_pricecur,
+        co_en_pricecur=co_en_pricecur, co_yn_rate=co_yn_rate, co_st_rate=co_st_rate, co_en_rate=co_en_rate,
+        co_yn_valx=co_yn_valx, co_st_valx=co_st_valx, co_en_valx=co_en_valx, co_yn_shar=co_yn_shar,
+        co_st_shar=co_st_shar, co_en_shar=co_en_shar, co_yn_volume=co_yn_volume, co_st_volume=co_st_volume,
+        co_en_volume=co_en_volume, co_yn_amt=co_yn_amt, co_st_amt=co_st_amt, co_en_amt=co_en_amt, co_yn_eps=co_yn_eps,
+        co_st_eps=co_st_eps, co_en_eps=co_en_eps, co_yn_per=co_yn_per, co_st_per=co_st_per, co_en_per=co_en_per,
+        keyb=keyb,
+    )
+    field_catalogue.validate(endpoint.tr_id, fields)
+    return await call_endpoint(endpoint, params, fields, max_pages, max_rows)
 
 
 @mcp.tool(
@@ -857,6 +1429,7 @@ async def inquire_search(
 async def search_info(
     prdt_type_cd: str,  # 상품유형코드
     pdno: str,  # 상품번호
+    fields: Optional[list[str]] = None,  # 반환할 필드 목록
 ):
     """
     [해외주식] 기본시세
@@ -866,27 +1439,15 @@ async def search_info(
     Args:
         prdt_type_cd (str): 512  미국 나스닥 / 513  미국 뉴욕 / 529  미국 아멕스  515  일본 501  홍콩 / 543  홍콩CNY / 558  홍콩USD 507  베트남 하노이 / 508  베트남 호치민 551  중국 상해A / 552  중국 심천A
         pdno (str): 예) AAPL (애플)
+        fields (list[str]): 반환할 출력 필드 목록 (ex. ["prdt_eng_name", "ovrs_excg_cd", "lstg_dt"], 생략 시 전체 필드, kis://fields 리소스 참고)
 
     Returns:
         Optional[pd.DataFrame]: 해외주식 상품기본정보 데이터
     """
-    # [필수 파라미터 검증]
-    if not prdt_type_cd:
-        logger.error("prdt_type_cd is required. (e.g. '512')")
-        raise ValueError("prdt_type_cd is required. (e.g. '512')")
-    if not pdno:
-        logger.error("pdno is required. (e.g. 'AAPL')")
-        raise ValueError("pdno is required. (e.g. 'AAPL')")
-
-    tr_id = "CTPF1702R"
-    api_url = "/uapi/overseas-price/v1/quotations/search-info"
-
-    params = {
-        "PRDT_TYPE_CD": prdt_type_cd,
-        "PDNO": pdno,
-    }
-
-    return await make_api_request(api_url, tr_id, params)
+    endpoint = ENDPOINTS["search-info"]
+    params = endpoint.build(prdt_type_cd=prdt_type_cd, pdno=pdno)
+    field_catalogue.validate(endpoint.tr_id, fields)
+    return await call_endpoint(endpoint, params, fields)
 
 
 ##############################################################################################
@@ -905,6 +1466,8 @@ async def dailyprice(
     gubn: str,  # 일/주/월구분
     bymd: str,  # 조회기준일자
     modp: str,  # 수정주가반영여부
+    columnar: bool = False,  # 컬럼 형식 응답 여부
+    fields: Optional[list[str]] = None,  # 반환할 필드 목록
 ):
     """
     [해외주식] 기본시세
@@ -918,37 +1481,21 @@ async def dailyprice(
         gubn (str): 일/주/월구분 (예: "0")
         bymd (str): 조회기준일자(YYYYMMDD) (예: "20230101")
         modp (str): 수정주가반영여부 (예: "0")
+        columnar (bool): True이면 output2를 숫자형 컬럼 배열로 변환하여 반환
+        fields (list[str]): 반환할 출력 필드 목록 (ex. ["xymd", "clos", "tvol"], 생략 시 전체 필드, kis://fields 리소스 참고)
 
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: 해외주식 기간별시세 데이터
     """
-    # 필수 파라미터 검증
-    if not excd:
-        logger.error("excd is required. (e.g. 'NAS')")
-        raise ValueError("excd is required. (e.g. 'NAS')")
-    if not symb:
-        logger.error("symb is required. (e.g. 'TSLA')")
-        raise ValueError("symb is required. (e.g. 'TSLA')")
-    if not gubn:
-        logger.error("gubn is required. (e.g. '0')")
-        raise ValueError("gubn is required. (e.g. '0')")
-    if not modp:
-        logger.error("modp is required. (e.g. '0')")
-        raise ValueError("modp is required. (e.g. '0')")
-
-    tr_id = "HHDFS76240000"  # 실전/모의투자 공통 TR ID
-    api_url = "/uapi/overseas-price/v1/quotations/dailyprice"
-
-    params = {
-        "AUTH": auth,
-        "EXCD": excd,
-        "SYMB": symb,
-        "GUBN": gubn,
-        "BYMD": bymd,
-        "MODP": modp,
-    }
+    endpoint = ENDPOINTS["dailyprice"]
+    params = endpoint.build(auth=auth, excd=excd, symb=symb, gubn=gubn, bymd=bymd, modp=modp)
+    field_catalogue.validate(endpoint.tr_id, fields)
 
-    return await make_api_request(api_url, tr_id, params)
+    if bar_store is None:
+        return await call_endpoint(endpoint, params, fields, columnar=columnar)
+    # 확정된 일봉은 로컬 저장소에서 응답
+    response = await bar_store.dailyprice(params, lambda p: request_endpoint(endpoint, p))
+    return shape_response(endpoint, response, fields, columnar)
 
 
 ##############################################################################################
@@ -965,6 +1512,9 @@ async def industry_theme(
     vol_rang: str,  # [필수] 거래량조건 (ex. 0:전체, 1:1백주이상, 2:1천주이상, 3:1만주이상, 4:10만주이상, 5:100만주이상, 6:1000만주이상)
     auth: str = "",  # 사용자권한정보
     keyb: str = "",  # NEXT KEY BUFF
+    max_pages: int = 1,  # 최대 조회 페이지 수
+    max_rows: int = 0,  # 최대 조회 건수
+    fields: Optional[list[str]] = None,  # 반환할 필드 목록
 ):
     """
     해외주식 업종별시세 API입니다.
@@ -975,31 +1525,17 @@ async def industry_theme(
         vol_rang (str): [필수] 거래량조건 (ex. 0:전체, 1:1백주이상, 2:1천주이상, 3:1만주이상, 4:10만주이상, 5:100만주이상, 6:1000만주이상)
         auth (str): 사용자권한정보
         keyb (str): NEXT KEY BUFF
+        max_pages (int): 연속조회로 가져올 최대 페이지 수 (default: 1, 최대 50)
+        max_rows (int): 이 건수 이상 모이면 조회 중단 (default: 0, 제한 없음)
+        fields (list[str]): 반환할 출력 필드 목록 (ex. ["symb", "last", "rate"], 생략 시 전체 필드, kis://fields 리소스 참고)
 
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: (output1 데이터, output2 데이터)
     """
-    if excd == "":
-        raise ValueError("excd is required (e.g. 'NAS')")
-
-    if icod == "":
-        raise ValueError("icod is required")
-
-    if vol_rang == "":
-        raise ValueError("vol_rang is required (e.g. '0')")
-
-    tr_id = "HHDFS76370000"
-    api_url = "/uapi/overseas-price/v1/quotations/industry-theme"
-
-    params = {
-        "EXCD": excd,
-        "ICOD": icod,
-        "VOL_RANG": vol_rang,
-        "AUTH": auth,
-        "KEYB": keyb
-    }
-
-    return await make_api_request(api_url, tr_id, params)
+    endpoint = ENDPOINTS["industry-theme"]
+    params = endpoint.build(excd=excd, icod=icod, vol_rang=vol_rang, auth=auth, keyb=keyb)
+    field_catalogue.validate(endpoint.tr_id, fields)
+    return await call_endpoint(endpoint, params, fields, max_pages, max_rows)
 
 
 ##############################################################################################
@@ -1014,6 +1550,7 @@ async def inquire_asking_price(
     auth: str,  # 사용자권한정보
     excd: str,  # 거래소코드
     symb: str,  # 종목코드
+    fields: Optional[list[str]] = None,  # 반환할 필드 목록
 ):
     """
     [해외주식] 기본시세
@@ -1024,29 +1561,83 @@ async def inquire_asking_price(
         auth (str): 사용자권한정보
         excd (str): 거래소코드 (예: NYS, NAS, AMS, 등)
         symb (str): 종목코드 (예: TSLA)
+        fields (list[str]): 반환할 출력 필드 목록 (ex. ["pbid1", "pask1", "vbid1", "vask1"], 생략 시 전체 필드, kis://fields 리소스 참고)
 
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]: 해외주식 현재가 1호가 데이터
     """
 
-    # [필수 파라미터 검증]
-    if not excd:
-        logger.error("excd is required. (e.g. 'NAS')")
-        raise ValueError("excd is required. (e.g. 'NAS')")
-    if not symb:
-        logger.error("symb is required. (e.g. 'TSLA')")
-        raise ValueError("symb is required. (e.g. 'TSLA')")
+    endpoint = ENDPOINTS["inquire-asking-price"]
+    params = endpoint.build(auth=auth, excd=excd, symb=symb)
+    field_catalogue.validate(endpoint.tr_id, fields)
 
-    tr_id = "HHDFS76200100"
-    api_url = "/uapi/overseas-price/v1/quotations/inquire-asking-price"
+    # 실시간 호가를 구독 중이고 최근에 갱신된 종목은 메모리 호가로 응답
+    key = tr_key(params["EXCD"], params["SYMB"])
+    book = order_books.get(key) if realtime_client.is_live(QUOTE_TR_ID, key) else None
+    if book is not None:
+        return shape_response(endpoint, book.to_response(key), fields)
+    return await call_endpoint(endpoint, params, fields)
 
-    params = {
-        "AUTH": auth,
-        "EXCD": excd,
-        "SYMB": symb,
-    }
 
-    return await make_api_request(api_url, tr_id, params)
+@mcp.tool(
+    name="orderbook-summary",
+    description="기본시세 > 해외주식 호가 스프레드/잔량 불균형 요약",
+    annotations=orderbook_summary_annotations
+)
+async def orderbook_summary(
+    symbols: list[str],  # 종목 목록 (거래소코드:종목코드)
+    auth: str = "",  # 사용자권한정보
+    fields: Optional[list[str]] = None,  # 반환할 필드 목록
+):
+    """
+    여러 종목의 최우선 호가, 스프레드, 중간가, 잔량 불균형을 계산합니다.
+    실시간 호가를 구독 중인 종목은 메모리 호가를, 그 외 종목은 현재가 호가 API 스냅샷을 사용합니다.
+
+    Args:
+        symbols (list[str]): [필수] 종목 목록, "거래소코드:종목코드" 형식 (ex. ["NAS:AAPL", "NYS:KO"])
+        auth (str): 사용자권한정보
+        fields (list[str]): 반환할 필드 목록 (ex. ["spread", "imbalance"], 생략 시 전체 필드)
+
+    Returns:
+        dict: 종목별 요약 (output: excd, symb, source, bid, ask, bid_qty, ask_qty, spread, mid, spread_bps, imbalance, depth)
+    """
+    if not symbols:
+        raise ValueError("symbols is required (e.g. ['NAS:AAPL', 'NAS:TSLA'])")
+    unknown = [field for field in fields or [] if field not in ORDERBOOK_SUMMARY_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields {unknown} (available: {', '.join(ORDERBOOK_SUMMARY_FIELDS)})")
+
+    async def summarize(excd: str, symb: str) -> dict:
+        key = tr_key(excd, symb)
+        book = order_books.get(key) if realtime_client.is_live(QUOTE_TR_ID, key) else None
+        source = "realtime"
+        if book is None:
+            snapshot = await inquire_asking_price(auth, excd, symb)
+            book = OrderBook()
+            book.apply({**(snapshot.get("output1") or {}), **(snapshot.get("output2") or {})})
+            source = "rest"
+        return {"excd": excd, "symb": symb, "source": source, **book.summary()}
+
+    pairs = parse_symbols(symbols)
+    results = await asyncio.gather(*(summarize(excd, symb) for excd, symb in pairs), return_exceptions=True)
+
+    output = []
+    errors = []
+    for (excd, symb), result in zip(pairs, results):
+        if isinstance(result, BaseException):
+            if not isinstance(result, Exception):
+                raise result
+            errors.append({"excd": excd, "symb": symb, "error": str(result)})
+        else:
+            output.append(result)
+
+    response = {
+        "rt_cd": "0",
+        "msg1": f"{len(output)}/{len(pairs)}개 종목 조회 완료",
+        "output": output,
+        "errors": errors,
+    }
+    return project(response, ["excd", "symb", *fields]) if fields else response
 
 
 ##############################################################################################
@@ -1063,6 +1654,9 @@ async def quot_inquire_ccnl(
     symb: str,  # [필수] 종목코드 (ex. 해외종목코드)
     auth: str = "",  # 사용자권한정보
     keyb: str = "",  # NEXT KEY BUFF
+    max_pages: int = 1,  # 최대 조회 페이지 수
+    max_rows: int = 0,  # 최대 조회 건수
+    fields: Optional[list[str]] = None,  # 반환할 필드 목록
 ):
     """
     해외주식 체결추이 API입니다.
@@ -1073,32 +1667,18 @@ async def quot_inquire_ccnl(
         symb (str): [필수] 종목코드 (ex. 해외종목코드)
         auth (str): 사용자권한정보
         keyb (str): NEXT KEY BUFF
+        max_pages (int): 연속조회로 가져올 최대 페이지 수 (default: 1, 최대 50)
+        max_rows (int): 이 건수 이상 모이면 조회 중단 (default: 0, 제한 없음)
+        fields (list[str]): 반환할 출력 필드 목록 (ex. ["khms", "last", "evol"], 생략 시 전체 필드, kis://fields 리소스 참고)
 
     Returns:
         pd.DataFrame: 해외주식 체결추이 데이터
     """
 
-    if excd == "":
-        raise ValueError("excd is required (e.g. 'NAS')")
-
-    if tday == "":
-        raise ValueError("tday is required (e.g. '0' or '1')")
-
-    if symb == "":
-        raise ValueError("symb is required (e.g. 'TSLA')")
-
-    tr_id = "HHDFS76200300"
-    api_url = "/uapi/overseas-price/v1/quotations/inquire-ccnl"
-
-    params = {
-        "EXCD": excd,
-        "TDAY": tday,
-        "SYMB": symb,
-        "AUTH": auth,
-        "KEYB": keyb
-    }
-
-    return await make_api_request(api_url, tr_id, params)
+    endpoint = ENDPOINTS["quot-inquire-ccnl"]
+    params = endpoint.build(excd=excd, tday=tday, symb=symb, auth=auth, keyb=keyb)
+    field_catalogue.validate(endpoint.tr_id, fields)
+    return await call_endpoint(endpoint, params, fields, max_pages, max_rows)
 
 ##############################################################################################
 # [해외주식] 기본시세 > 해외주식 종목_지수_환율기간별시세(일_주_월_년)[v1_해외주식-012]
@@ -1114,6 +1694,8 @@ async def inquire_daily_chartprice(
     fid_input_date_1: str,  # FID 입력 날짜1
     fid_input_date_2: str,  # FID 입력 날짜2
     fid_period_div_code: str,  # FID 기간 분류 코드
+    columnar: bool = False,  # 컬럼 형식 응답 여부
+    fields: Optional[list[str]] = None,  # 반환할 필드 목록
 ):
     """
     [해외주식] 기본시세
@@ -1126,39 +1708,24 @@ async def inquire_daily_chartprice(
         fid_input_date_1 (str): 시작일자(YYYYMMDD)
         fid_input_date_2 (str): 종료일자(YYYYMMDD)
         fid_period_div_code (str): D:일, W:주, M:월, Y:년
+        columnar (bool): True이면 output2를 숫자형 컬럼 배열로 변환하여 반환
+        fields (list[str]): 반환할 출력 필드 목록 (ex. ["stck_bsop_date", "ovrs_nmix_prpr"], 생략 시 전체 필드, kis://fields 리소스 참고)
 
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: 해외주식 종목_지수_환율기간별시세(일_주_월_년) 데이터
     """
-    # [필수 파라미터 검증]
-    if not fid_cond_mrkt_div_code:
-        logger.error("fid_cond_mrkt_div_code is required. (e.g. 'N')")
-        raise ValueError("fid_cond_mrkt_div_code is required. (e.g. 'N')")
-    if not fid_input_iscd:
-        logger.error("fid_input_iscd is required. (e.g. '.DJI')")
-        raise ValueError("fid_input_iscd is required. (e.g. '.DJI')")
-    if not fid_input_date_1:
-        logger.error("fid_input_date_1 is required. (e.g. '20220401')")
-        raise ValueError("fid_input_date_1 is required. (e.g. '20220401')")
-    if not fid_input_date_2:
-        logger.error("fid_input_date_2 is required. (e.g. '20220613')")
-        raise ValueError("fid_input_date_2 is required. (e.g. '20220613')")
-    if not fid_period_div_code:
-        logger.error("fid_period_div_code is required. (e.g. 'D')")
-        raise ValueError("fid_period_div_code is required. (e.g. 'D')")
-
-    tr_id = "FHKST03030100"  # 실전투자용 TR ID
-    api_url = "/uapi/overseas-price/v1/quotations/inquire-daily-chartprice"
-
-    params = {
-        "FID_COND_MRKT_DIV_CODE": fid_cond_mrkt_div_code,
-        "FID_INPUT_ISCD": fid_input_iscd,
-        "FID_INPUT_DATE_1": fid_input_date_1,
-        "FID_INPUT_DATE_2": fid_input_date_2,
-        "FID_PERIOD_DIV_CODE": fid_period_div_code,
-    }
+    endpoint = ENDPOINTS["inquire-daily-chartprice"]
+    params = endpoint.build(
+        fid_cond_mrkt_div_code=fid_cond_mrkt_div_code, fid_input_iscd=fid_input_iscd, fid_input_date_1=fid_input_date_1,
+        fid_input_date_2=fid_input_date_2, fid_period_div_code=fid_period_div_code,
+    )
+    field_catalogue.validate(endpoint.tr_id, fields)
 
-    return await make_api_request(api_url, tr_id, params)
+    if bar_store is None:
+        return await call_endpoint(endpoint, params, fields, columnar=columnar)
+    # 확정된 일봉은 로컬 저장소에서 응답하고 빠진 구간만 요청
+    response = await bar_store.daily_chartprice(params, lambda p: request_endpoint(endpoint, p))
+    return shape_response(endpoint, response, fields, columnar)
 
 
 ##############################################################################################
@@ -1172,6 +1739,7 @@ async def inquire_daily_chartprice(
 async def industry_price(
     excd: str,  # [필수] 거래소명
     auth: str = "",  # 사용자권한정보
+    fields: Optional[list[str]] = None,  # 반환할 필드 목록
 ):
     """
     해외주식 업종별코드조회 API입니다.
@@ -1179,23 +1747,16 @@ async def industry_price(
     Args:
         excd (str): [필수] 거래소명 (ex. NYS:뉴욕, NAS:나스닥, AMS:아멕스, HKS:홍콩, SHS:상해, SZS:심천, HSX:호치민, HNX:하노이, TSE:도쿄)
         auth (str): 사용자권한정보
+        fields (list[str]): 반환할 출력 필드 목록 (ex. ["icod", "name"], 생략 시 전체 필드, kis://fields 리소스 참고)
 
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: (output1, output2) 데이터
     """
 
-    if excd == "":
-        raise ValueError("excd is required (e.g. 'NYS', 'NAS', 'AMS', 'HKS', 'SHS', 'SZS', 'HSX', 'HNX', 'TSE')")
-
-    tr_id = "HHDFS76370100"
-    api_url = "/uapi/overseas-price/v1/quotations/industry-price"
-
-    params = {
-        "EXCD": excd,
-        "AUTH": auth
-    }
-
-    return await make_api_request(api_url, tr_id, params)
+    endpoint = ENDPOINTS["industry-price"]
+    params = endpoint.build(excd=excd, auth=auth)
+    field_catalogue.validate(endpoint.tr_id, fields)
+    return await call_endpoint(endpoint, params, fields)
 
 
 ##############################################################################################
@@ -1212,6 +1773,10 @@ async def volume_surge(
     vol_rang: str,  # [필수] 거래량조건 (ex. 0:전체, 1:1백주이상, 2:1천주이상, 3:1만주이상, 4:10만주이상, 5:100만주이상, 6:1000만주이상)
     keyb: str = "",  # NEXT KEY BUFF
     auth: str = "",  # 사용자권한정보
+    max_pages: int = 1,  # 최대 조회 페이지 수
+    max_rows: int = 0,  # 최대 조회 건수
+    columnar: bool = False,  # 컬럼 형식 응답 여부
+    fields: Optional[list[str]] = None,  # 반환할 필드 목록
 ):
     """
     [해외주식] 시세분석 > 해외주식 거래량급증[해외주식-039]
@@ -1223,32 +1788,19 @@ async def volume_surge(
         vol_rang (str): [필수] 거래량조건 (ex. 0:전체, 1:1백주이상, 2:1천주이상, 3:1만주이상, 4:10만주이상, 5:100만주이상, 6:1000만주이상)
         keyb (str): NEXT KEY BUFF
         auth (str): 사용자권한정보
+        max_pages (int): 연속조회로 가져올 최대 페이지 수 (default: 1, 최대 50)
+        max_rows (int): 이 건수 이상 모이면 조회 중단 (default: 0, 제한 없음)
+        columnar (bool): True이면 output2를 숫자형 컬럼 배열로 변환하여 반환
+        fields (list[str]): 반환할 출력 필드 목록 (ex. ["symb", "n_tvol", "n_rate"], 생략 시 전체 필드, kis://fields 리소스 참고)
 
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: (output1 데이터, output2 데이터)
     """
 
-    if excd == "":
-        raise ValueError("excd is required (e.g. 'NYS')")
-
-    if mixn == "":
-        raise ValueError("mixn is required (e.g. '0')")
-
-    if vol_rang == "":
-        raise ValueError("vol_rang is required (e.g. '0')")
-
-    tr_id = "HHDFS76270000"  # 해외주식 거래량급증
-    api_url = "/uapi/overseas-stock/v1/ranking/volume-surge"
-
-    params = {
-        "EXCD": excd,  # 거래소명
-        "MIXN": mixn,  # N분전코드값
-        "VOL_RANG": vol_rang,  # 거래량조건
-        "KEYB": keyb,  # NEXT KEY BUFF
-        "AUTH": auth  # 사용자권한정보
-    }
-
-    return await make_api_request(api_url, tr_id, params)
+    endpoint = ENDPOINTS["volume-surge"]
+    params = endpoint.build(excd=excd, mixn=mixn, vol_rang=vol_rang, keyb=keyb, auth=auth)
+    field_catalogue.validate(endpoint.tr_id, fields)
+    return await call_endpoint(endpoint, params, fields, max_pages, max_rows, columnar)
 
 
 ##############################################################################################
@@ -1265,6 +1817,10 @@ async def volume_power(
     vol_rang: str,  # [필수] 거래량조건 (ex. 0:전체, 1:1백주이상, 2:1천주이상, 3:1만주이상, 4:10만주이상, 5:100만주이상, 6:1000만주이상)
     auth: str = "",  # 사용자권한정보
     keyb: str = "",  # NEXT KEY BUFF
+    max_pages: int = 1,  # 최대 조회 페이지 수
+    max_rows: int = 0,  # 최대 조회 건수
+    columnar: bool = False,  # 컬럼 형식 응답 여부
+    fields: Optional[list[str]] = None,  # 반환할 필드 목록
 ):
     """
     [해외주식] 시세분석 > 해외주식 매수체결강도상위[해외주식-040]
@@ -1277,31 +1833,19 @@ async def volume_power(
         vol_rang (str): [필수] 거래량조건 (ex. 0:전체, 1:1백주이상, 2:1천주이상, 3:1만주이상, 4:10만주이상, 5:100만주이상, 6:1000만주이상)
         auth (str): 사용자권한정보
         keyb (str): NEXT KEY BUFF
+        max_pages (int): 연속조회로 가져올 최대 페이지 수 (default: 1, 최대 50)
+        max_rows (int): 이 건수 이상 모이면 조회 중단 (default: 0, 제한 없음)
+        columnar (bool): True이면 output2를 숫자형 컬럼 배열로 변환하여 반환
+        fields (list[str]): 반환할 출력 필드 목록 (ex. ["symb", "tpow", "powx"], 생략 시 전체 필드, kis://fields 리소스 참고)
 
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: (output1 데이터, output2 데이터)
     """
 
-    if excd == "":
-        raise ValueError("excd is required (e.g. 'HKS')")
-
-    if nday == "":
-        raise ValueError("nday is required (e.g. '0')")
-
-    if vol_rang == "":
-        raise ValueError("vol_rang is required (e.g. '0')")
-    tr_id = "HHDFS76280000"
-    api_url = "/uapi/overseas-stock/v1/ranking/volume-power"
-
-    params = {
-        "EXCD": excd,
-        "NDAY": nday,
-        "VOL_RANG": vol_rang,
-        "AUTH": auth,
-        "KEYB": keyb
-    }
-
-    return await make_api_request(api_url, tr_id, params)
+    endpoint = ENDPOINTS["volume-power"]
+    params = endpoint.build(excd=excd, nday=nday, vol_rang=vol_rang, auth=auth, keyb=keyb)
+    field_catalogue.validate(endpoint.tr_id, fields)
+    return await call_endpoint(endpoint, params, fields, max_pages, max_rows, columnar)
 
 
 ##############################################################################################
@@ -1319,6 +1863,10 @@ async def updown_rate(
     vol_rang: str,  # [필수] 거래량조건
     auth: str = "",  # 사용자권한정보
     keyb: str = "",  # NEXT KEY BUFF
+    max_pages: int = 1,  # 최대 조회 페이지 수
+    max_rows: int = 0,  # 최대 조회 건수
+    columnar: bool = False,  # 컬럼 형식 응답 여부
+    fields: Optional[list[str]] = None,  # 반환할 필드 목록
 ):
     """
     해외주식 상승률/하락률 순위를 조회합니다.
@@ -1330,39 +1878,19 @@ async def updown_rate(
         vol_rang (str): [필수] 거래량조건 (ex. 0:전체, 1:1백주이상, 2:1천주이상, 3:1만주이상, 4:10만주이상, 5:100만주이상, 6:1000만주이상)
         auth (str): 사용자권한정보
         keyb (str): NEXT KEY BUFF
+        max_pages (int): 연속조회로 가져올 최대 페이지 수 (default: 1, 최대 50)
+        max_rows (int): 이 건수 이상 모이면 조회 중단 (default: 0, 제한 없음)
+        columnar (bool): True이면 output2를 숫자형 컬럼 배열로 변환하여 반환
+        fields (list[str]): 반환할 출력 필드 목록 (ex. ["symb", "last", "n_rate"], 생략 시 전체 필드, kis://fields 리소스 참고)
 
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: 상승률/하락률 순위 데이터
     """
 
-    # 필수 파라미터 검증
-    if excd == "":
-        raise ValueError(
-            "excd is required (e.g. 'NYS:뉴욕, NAS:나스닥, AMS:아멕스, HKS:홍콩, SHS:상해, SZS:심천, HSX:호치민, HNX:하노이, TSE:도쿄')")
-
-    if nday == "":
-        raise ValueError("nday is required (e.g. '0:당일, 1:2일, 2:3일, 3:5일, 4:10일, 5:20일전, 6:30일, 7:60일, 8:120일, 9:1년')")
-
-    if gubn == "":
-        raise ValueError("gubn is required (e.g. '0:하락률, 1:상승률')")
-
-    if vol_rang == "":
-        raise ValueError(
-            "vol_rang is required (e.g. '0:전체, 1:1백주이상, 2:1천주이상, 3:1만주이상, 4:10만주이상, 5:100만주이상, 6:1000만주이상')")
-
-    tr_id = "HHDFS76290000"
-    api_url = "/uapi/overseas-stock/v1/ranking/updown-rate"
-
-    params = {
-        "EXCD": excd,
-        "NDAY": nday,
-        "GUBN": gubn,
-        "VOL_RANG": vol_rang,
-        "AUTH": auth,
-        "KEYB": keyb
-    }
-
-    return await make_api_request(api_url, tr_id, params)
+    endpoint = ENDPOINTS["updown-rate"]
+    params = endpoint.build(excd=excd, nday=nday, gubn=gubn, vol_rang=vol_rang, auth=auth, keyb=keyb)
+    field_catalogue.validate(endpoint.tr_id, fields)
+    return await call_endpoint(endpoint, params, fields, max_pages, max_rows, columnar)
 
 
 ##############################################################################################
@@ -1381,6 +1909,10 @@ async def trade_vol(
     auth: str = "",  # 사용자권한정보
     prc1: str = "",  # 가격 필터 시작
     prc2: str = "",  # 가격 필터 종료
+    max_pages: int = 1,  # 최대 조회 페이지 수
+    max_rows: int = 0,  # 최대 조회 건수
+    columnar: bool = False,  # 컬럼 형식 응답 여부
+    fields: Optional[list[str]] = None,  # 반환할 필드 목록
 ):
     """
     [해외주식] 시세분석 > 해외주식 거래량순위[해외주식-043]
@@ -1394,38 +1926,19 @@ async def trade_vol(
         auth (str): 사용자권한정보 (ex. "")
         prc1 (str): 가격 필터 시작 (ex. "")
         prc2 (str): 가격 필터 종료 (ex. "")
+        max_pages (int): 연속조회로 가져올 최대 페이지 수 (default: 1, 최대 50)
+        max_rows (int): 이 건수 이상 모이면 조회 중단 (default: 0, 제한 없음)
+        columnar (bool): True이면 output2를 숫자형 컬럼 배열로 변환하여 반환
+        fields (list[str]): 반환할 출력 필드 목록 (ex. ["symb", "tvol", "a_tvol"], 생략 시 전체 필드, kis://fields 리소스 참고)
 
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: 해외주식 거래량순위 데이터 (output1, output2)
     """
 
-    # 필수 파라미터 검증
-    if excd == "":
-        raise ValueError(
-            "excd is required (e.g. 'NYS:뉴욕, NAS:나스닥, AMS:아멕스, HKS:홍콩, SHS:상해, SZS:심천, HSX:호치민, HNX:하노이, TSE:도쿄')")
-
-    if nday == "":
-        raise ValueError(
-            "nday is required (e.g. '0:당일, 1:2일전, 2:3일전, 3:5일전, 4:10일전, 5:20일전, 6:30일전, 7:60일전, 8:120일전, 9:1년전')")
-
-    if vol_rang == "":
-        raise ValueError(
-            "vol_rang is required (e.g. '0:전체, 1:1백주이상, 2:1천주이상, 3:1만주이상, 4:10만주이상, 5:100만주이상, 6:1000만주이상')")
-
-    tr_id = "HHDFS76310010"  # 해외주식 거래량순위
-    api_url = "/uapi/overseas-stock/v1/ranking/trade-vol"
-
-    params = {
-        "EXCD": excd,
-        "NDAY": nday,
-        "VOL_RANG": vol_rang,
-        "KEYB": keyb,
-        "AUTH": auth,
-        "PRC1": prc1,
-        "PRC2": prc2
-    }
-
-    return await make_api_request(api_url, tr_id, params)
+    endpoint = ENDPOINTS["trade-vol"]
+    params = endpoint.build(excd=excd, nday=nday, vol_rang=vol_rang, keyb=keyb, auth=auth, prc1=prc1, prc2=prc2)
+    field_catalogue.validate(endpoint.tr_id, fields)
+    return await call_endpoint(endpoint, params, fields, max_pages, max_rows, columnar)
 
 
 ##############################################################################################
@@ -1442,6 +1955,10 @@ async def trade_turnover(
     vol_rang: str,  # 거래량조건
     keyb: str = "",  # NEXT KEY BUFF
     auth: str = "",  # 사용자권한정보
+    max_pages: int = 1,  # 최대 조회 페이지 수
+    max_rows: int = 0,  # 최대 조회 건수
+    columnar: bool = False,  # 컬럼 형식 응답 여부
+    fields: Optional[list[str]] = None,  # 반환할 필드 목록
 ):
     """
     [해외주식] 시세분석 > 해외주식 거래회전율순위[해외주식-046]
@@ -1453,36 +1970,19 @@ async def trade_turnover(
         vol_rang (str): [필수] 거래량조건 (ex. 0:전체, 1:1백주이상, 2:1천주이상, 3:1만주이상, 4:10만주이상, 5:100만주이상, 6:1000만주이상)
         keyb (str): NEXT KEY BUFF
         auth (str): 사용자권한정보
+        max_pages (int): 연속조회로 가져올 최대 페이지 수 (default: 1, 최대 50)
+        max_rows (int): 이 건수 이상 모이면 조회 중단 (default: 0, 제한 없음)
+        columnar (bool): True이면 output2를 숫자형 컬럼 배열로 변환하여 반환
+        fields (list[str]): 반환할 출력 필드 목록 (ex. ["symb", "tover"], 생략 시 전체 필드, kis://fields 리소스 참고)
 
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: (output1, output2) 해외주식 거래회전율순위 데이터
     """
 
-    # 필수 파라미터 검증
-    if excd == "":
-        raise ValueError(
-            "excd is required (e.g. 'NYS:뉴욕, NAS:나스닥, AMS:아멕스, HKS:홍콩, SHS:상해, SZS:심천, HSX:호치민, HNX:하노이, TSE:도쿄')")
-
-    if nday == "":
-        raise ValueError(
-            "nday is required (e.g. '0:당일, 1:2일전, 2:3일전, 3:5일전, 4:10일전, 5:20일전, 6:30일전, 7:60일전, 8:120일전, 9:1년전')")
-
-    if vol_rang == "":
-        raise ValueError(
-            "vol_rang is required (e.g. '0:전체, 1:1백주이상, 2:1천주이상, 3:1만주이상, 4:10만주이상, 5:100만주이상, 6:1000만주이상')")
-
-    tr_id = "HHDFS76340000"  # 해외주식 거래회전율순위
-    api_url = "/uapi/overseas-stock/v1/ranking/trade-turnover"
-
-    params = {
-        "EXCD": excd,  # 거래소명
-        "NDAY": nday,  # N분전코드보값
-        "VOL_RANG": vol_rang,  # 거래량조건
-        "KEYB": keyb,  # NEXT KEY BUFF
-        "AUTH": auth  # 사용자권한정보
-    }
-
-    return await make_api_request(api_url, tr_id, params)
+    endpoint = ENDPOINTS["trade-turnover"]
+    params = endpoint.build(excd=excd, nday=nday, vol_rang=vol_rang, keyb=keyb, auth=auth)
+    field_catalogue.validate(endpoint.tr_id, fields)
+    return await call_endpoint(endpoint, params, fields, max_pages, max_rows, columnar)
 
 
 ##############################################################################################
@@ -1501,6 +2001,10 @@ async def trade_pbmn(
     keyb: str = "",  # NEXT KEY BUFF
     prc1: str = "",  # 현재가 필터범위 시작
     prc2: str = "",  # 현재가 필터범위 끝
+    max_pages: int = 1,  # 최대 조회 페이지 수
+    max_rows: int = 0,  # 최대 조회 건수
+    columnar: bool = False,  # 컬럼 형식 응답 여부
+    fields: Optional[list[str]] = None,  # 반환할 필드 목록
 ):
     """
     해외주식 거래대금순위 API를 호출하여 DataFrame으로 반환합니다.
@@ -1513,36 +2017,19 @@ async def trade_pbmn(
         keyb (str): NEXT KEY BUFF
         prc1 (str): 현재가 필터범위 시작
         prc2 (str): 현재가 필터범위 끝
+        max_pages (int): 연속조회로 가져올 최대 페이지 수 (default: 1, 최대 50)
+        max_rows (int): 이 건수 이상 모이면 조회 중단 (default: 0, 제한 없음)
+        columnar (bool): True이면 output2를 숫자형 컬럼 배열로 변환하여 반환
+        fields (list[str]): 반환할 출력 필드 목록 (ex. ["symb", "tamt", "a_tamt"], 생략 시 전체 필드, kis://fields 리소스 참고)
 
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: 거래대금순위 데이터 (output1, output2)
     """
 
-    if excd == "":
-        raise ValueError(
-            "excd is required (e.g. 'NYS:뉴욕, NAS:나스닥, AMS:아멕스, HKS:홍콩, SHS:상해, SZS:심천, HSX:호치민, HNX:하노이, TSE:도쿄')")
-
-    if nday == "":
-        raise ValueError("nday is required (e.g. '0:당일, 1:2일, 2:3일, 3:5일, 4:10일, 5:20일전, 6:30일, 7:60일, 8:120일, 9:1년')")
-
-    if vol_rang == "":
-        raise ValueError(
-            "vol_rang is required (e.g. '0:전체, 1:1백주이상, 2:1천주이상, 3:1만주이상, 4:10만주이상, 5:100만주이상, 6:1000만주이상')")
-
-    tr_id = "HHDFS76320010"  # 해외주식 거래대금순위
-    api_url = "/uapi/overseas-stock/v1/ranking/trade-pbmn"
-
-    params = {
-        "EXCD": excd,  # 거래소명
-        "NDAY": nday,  # N일자값
-        "VOL_RANG": vol_rang,  # 거래량조건
-        "AUTH": auth,  # 사용자권한정보
-        "KEYB": keyb,  # NEXT KEY BUFF
-        "PRC1": prc1,  # 현재가 필터범위 시작
-        "PRC2": prc2,  # 현재가 필터범위 끝
-    }
-
-    return await make_api_request(api_url, tr_id, params)
+    endpoint = ENDPOINTS["trade-pbmn"]
+    params = endpoint.build(excd=excd, nday=nday, vol_rang=vol_rang, auth=auth, keyb=keyb, prc1=prc1, prc2=prc2)
+    field_catalogue.validate(endpoint.tr_id, fields)
+    return await call_endpoint(endpoint, params, fields, max_pages, max_rows, columnar)
 
 
 ##############################################################################################
@@ -1559,6 +2046,10 @@ async def trade_growth(
     vol_rang: str,  # [필수] 거래량조건 (ex. 0:전체, 1:1백주이상, 2:1천주이상, 3:1만주이상, 4:10만주이상, 5:100만주이상, 6:1000만주이상)
     auth: str = "",  # 사용자권한정보
     keyb: str = "",  # NEXT KEY BUFF
+    max_pages: int = 1,  # 최대 조회 페이지 수
+    max_rows: int = 0,  # 최대 조회 건수
+    columnar: bool = False,  # 컬럼 형식 응답 여부
+    fields: Optional[list[str]] = None,  # 반환할 필드 목록
 ):
     """
     [해외주식] 기본시세 > 해외주식 거래증가율순위[해외주식-045]
@@ -1570,32 +2061,19 @@ async def trade_growth(
         vol_rang (str): [필수] 거래량조건 (ex. 0:전체, 1:1백주이상, 2:1천주이상, 3:1만주이상, 4:10만주이상, 5:100만주이상, 6:1000만주이상)
         auth (str): 사용자권한정보
         keyb (str): NEXT KEY BUFF
+        max_pages (int): 연속조회로 가져올 최대 페이지 수 (default: 1, 최대 50)
+        max_rows (int): 이 건수 이상 모이면 조회 중단 (default: 0, 제한 없음)
+        columnar (bool): True이면 output2를 숫자형 컬럼 배열로 변환하여 반환
+        fields (list[str]): 반환할 출력 필드 목록 (ex. ["symb", "n_tvol", "n_rate"], 생략 시 전체 필드, kis://fields 리소스 참고)
 
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: (output1, output2) 데이터프레임 튜플
     """
 
-    if excd == "":
-        raise ValueError("excd is required (e.g. 'NYS')")
-
-    if nday == "":
-        raise ValueError("nday is required (e.g. '0')")
-
-    if vol_rang == "":
-        raise ValueError("vol_rang is required (e.g. '0')")
-
-    tr_id = "HHDFS76330000"  # 해외주식 거래증가율순위
-    api_url = "/uapi/overseas-stock/v1/ranking/trade-growth"
-
-    params = {
-        "EXCD": excd,
-        "NDAY": nday,
-        "VOL_RANG": vol_rang,
-        "AUTH": auth,
-        "KEYB": keyb
-    }
-
-    return await make_api_request(api_url, tr_id, params)
+    endpoint = ENDPOINTS["trade-growth"]
+    params = endpoint.build(excd=excd, nday=nday, vol_rang=vol_rang, auth=auth, keyb=keyb)
+    field_catalogue.validate(endpoint.tr_id, fields)
+    return await call_endpoint(endpoint, params, fields, max_pages, max_rows, columnar)
 
 
 ##############################################################################################
@@ -1613,6 +2091,10 @@ async def price_fluct(
     vol_rang: str,  # [필수] 거래량조건 (ex. 0:전체, 1:1백주이상, 2:1천주이상, 3:1만주이상, 4:10만주이상, 5:100만주이상, 6:1000만주이상)
     keyb: str = "",  # NEXT KEY BUFF
     auth: str = "",  # 사용자권한정보
+    max_pages: int = 1,  # 최대 조회 페이지 수
+    max_rows: int = 0,  # 최대 조회 건수
+    columnar: bool = False,  # 컬럼 형식 응답 여부
+    fields: Optional[list[str]] = None,  # 반환할 필드 목록
 ):
     """
     [해외주식] 시세분석 > 해외주식 가격급등락[해외주식-038]
@@ -1625,36 +2107,19 @@ async def price_fluct(
         vol_rang (str): [필수] 거래량조건 (ex. 0:전체, 1:1백주이상, 2:1천주이상, 3:1만주이상, 4:10만주이상, 5:100만주이상, 6:1000만주이상)
         keyb (str): NEXT KEY BUFF
         auth (str): 사용자권한정보
+        max_pages (int): 연속조회로 가져올 최대 페이지 수 (default: 1, 최대 50)
+        max_rows (int): 이 건수 이상 모이면 조회 중단 (default: 0, 제한 없음)
+        columnar (bool): True이면 output2를 숫자형 컬럼 배열로 변환하여 반환
+        fields (list[str]): 반환할 출력 필드 목록 (ex. ["symb", "last", "n_rate"], 생략 시 전체 필드, kis://fields 리소스 참고)
 
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: 해외주식 가격급등락 데이터 (output1, output2)
     """
 
-    if excd == "":
-        raise ValueError("excd is required (e.g. 'NAS')")
-
-    if gubn == "":
-        raise ValueError("gubn is required (e.g. '0' or '1')")
-
-    if mixn == "":
-        raise ValueError("mixn is required (e.g. '0')")
-
-    if vol_rang == "":
-        raise ValueError("vol_rang is required (e.g. '0')")
-
-    tr_id = "HHDFS76260000"  # 해외주식 가격급등락
-    api_url = "/uapi/overseas-stock/v1/ranking/price-fluct"
-
-    params = {
-        "EXCD": excd,
-        "GUBN": gubn,
-        "MIXN": mixn,
-        "VOL_RANG": vol_rang,
-        "KEYB": keyb,
-        "AUTH": auth
-    }
-
-    return await make_api_request(api_url, tr_id, params)
+    endpoint = ENDPOINTS["price-fluct"]
+    params = endpoint.build(excd=excd, gubn=gubn, mixn=mixn, vol_rang=vol_rang, keyb=keyb, auth=auth)
+    field_catalogue.validate(endpoint.tr_id, fields)
+    return await call_endpoint(endpoint, params, fields, max_pages, max_rows, columnar)
 
 
 ##############################################################################################
@@ -1673,6 +2138,10 @@ async def new_highlow(
     gubn2: str,  # [필수] 일시돌파/돌파 구분 (ex. 0:일시돌파0, 1:돌파유지1)
     keyb: str = "",  # NEXT KEY BUFF
     auth: str = "",  # 사용자권한정보
+    max_pages: int = 1,  # 최대 조회 페이지 수
+    max_rows: int = 0,  # 최대 조회 건수
+    columnar: bool = False,  # 컬럼 형식 응답 여부
+    fields: Optional[list[str]] = None,  # 반환할 필드 목록
 ):
     """
     [해외주식] 시세분석 > 해외주식 신고/신저가[해외주식-042]
@@ -1686,40 +2155,19 @@ async def new_highlow(
         gubn2 (str): [필수] 일시돌파/돌파 구분 (ex. 0:일시돌파0, 1:돌파유지1)
         keyb (str): NEXT KEY BUFF
         auth (str): 사용자권한정보
+        max_pages (int): 연속조회로 가져올 최대 페이지 수 (default: 1, 최대 50)
+        max_rows (int): 이 건수 이상 모이면 조회 중단 (default: 0, 제한 없음)
+        columnar (bool): True이면 output2를 숫자형 컬럼 배열로 변환하여 반환
+        fields (list[str]): 반환할 출력 필드 목록 (ex. ["symb", "last", "n_base"], 생략 시 전체 필드, kis://fields 리소스 참고)
 
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: (output1 데이터, output2 데이터)
     """
 
-    if excd == "":
-        raise ValueError("excd is required (e.g. 'NYS')")
-
-    if mixn == "":
-        raise ValueError("mixn is required (e.g. '0')")
-
-    if vol_rang == "":
-        raise ValueError("vol_rang is required (e.g. '0')")
-
-    if gubn == "":
-        raise ValueError("gubn is required (e.g. '1')")
-
-    if gubn2 == "":
-        raise ValueError("gubn2 is required (e.g. '1')")
-
-    tr_id = "HHDFS76300000"  # 해외주식 신고/신저가
-    api_url = "/uapi/overseas-stock/v1/ranking/new-highlow"
-
-    params = {
-        "EXCD": excd,
-        "MIXN": mixn,
-        "VOL_RANG": vol_rang,
-        "GUBN": gubn,
-        "GUBN2": gubn2,
-        "KEYB": keyb,
-        "AUTH": auth
-    }
-
-    return await make_api_request(api_url, tr_id, params)
+    endpoint = ENDPOINTS["new-highlow"]
+    params = endpoint.build(excd=excd, mixn=mixn, vol_rang=vol_rang, gubn=gubn, gubn2=gubn2, keyb=keyb, auth=auth)
+    field_catalogue.validate(endpoint.tr_id, fields)
+    return await call_endpoint(endpoint, params, fields, max_pages, max_rows, columnar)
 
 
 ##############################################################################################
@@ -1735,6 +2183,10 @@ async def market_cap(
     vol_rang: str,  # 거래량조건
     keyb: str = "",  # NEXT KEY BUFF
     auth: str = "",  # 사용자권한정보
+    max_pages: int = 1,  # 최대 조회 페이지 수
+    max_rows: int = 0,  # 최대 조회 건수
+    columnar: bool = False,  # 컬럼 형식 응답 여부
+    fields: Optional[list[str]] = None,  # 반환할 필드 목록
 ):
     """
     해외주식 시가총액순위 조회API를 호출하여 DataFrame으로 반환합니다.
@@ -1744,30 +2196,19 @@ async def market_cap(
         vol_rang (str): [필수] 거래량조건 (ex. 0:전체, 1:1백주이상, 2:1천주이상, 3:1만주이상, 4:10만주이상, 5:100만주이상, 6:1000만주이상)
         keyb (str): NEXT KEY BUFF (ex. "")
         auth (str): 사용자권한정보 (ex. "")
+        max_pages (int): 연속조회로 가져올 최대 페이지 수 (default: 1, 최대 50)
+        max_rows (int): 이 건수 이상 모이면 조회 중단 (default: 0, 제한 없음)
+        columnar (bool): True이면 output2를 숫자형 컬럼 배열로 변환하여 반환
+        fields (list[str]): 반환할 출력 필드 목록 (ex. ["symb", "tomv", "grav"], 생략 시 전체 필드, kis://fields 리소스 참고)
 
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: 시가총액순위 데이터 (output1, output2)
     """
 
-    if excd == "":
-        raise ValueError(
-            "excd is required (e.g. 'NYS:뉴욕, NAS:나스닥, AMS:아멕스, HKS:홍콩, SHS:상해, SZS:심천, HSX:호치민, HNX:하노이, TSE:도쿄')")
-
-    if vol_rang == "":
-        raise ValueError(
-            "vol_rang is required (e.g. '0:전체, 1:1백주이상, 2:1천주이상, 3:1만주이상, 4:10만주이상, 5:100만주이상, 6:1000만주이상')")
-
-    tr_id = "HHDFS76350100"  # 해외주식 시가총액순위
-    api_url = "/uapi/overseas-stock/v1/ranking/market-cap"
-
-    params = {
-        "EXCD": excd,  # 거래소명
-        "VOL_RANG": vol_rang,  # 거래량조건
-        "KEYB": keyb,  # NEXT KEY BUFF
-        "AUTH": auth,  # 사용자권한정보
-    }
-
-    return await make_api_request(api_url, tr_id, params)
+    endpoint = ENDPOINTS["market-cap"]
+    params = endpoint.build(excd=excd, vol_rang=vol_rang, keyb=keyb, auth=auth)
+    field_catalogue.validate(endpoint.tr_id, fields)
+    return await call_endpoint(endpoint, params, fields, max_pages, max_rows, columnar)
 
 
 
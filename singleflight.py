@@ -0,0 +1,50 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls sharing the same key into one execution
+
+    같은 키로 진행 중인 호출이 있으면 새로 실행하지 않고 그 결과를 함께 기다립니다.
+    결과 객체는 모든 호출자가 공유하므로 읽기 전용으로 취급해야 합니다.
+    """
+
+    def __init__(self):
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run fn once per key among concurrent callers
+
+        Args:
+            key: Identity of the call
+            fn: Coroutine function performing the call
+
+        Returns:
+            Any: Result of fn, shared by every caller that joined
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            self.executed += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t))
+        else:
+            self.coalesced += 1
+        # shield: 한 호출자가 취소되어도 다른 호출자가 기다리는 요청은 계속 진행
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task):
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            task.exception()  # 모든 호출자가 취소된 경우에도 예외 경고가 남지 않도록 회수
+
+    def stats(self) -> dict:
+        return {
+            "inflight": len(self._inflight),
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+        }
@@ -0,0 +1,177 @@
+import argparse
+import asyncio
+import io
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Optional
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+SERVER = Path(__file__).resolve().parent / "server.py"
+DEFAULT_RUNS = 5
+DEFAULT_TOP = 20
+
+# MCP 서버라면 피할 수 없는 import (FastMCP + stdio 전송), server.py 자체 비용과 구분하기 위해 따로 측정
+FRAMEWORK_IMPORT = "import mcp.server.fastmcp.server, mcp.server.stdio"
+
+# python -X importtime 출력 형식: "import time: self [us] | cumulative | imported package"
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def server_env(tool_cache: Path) -> dict[str, str]:
+    """Environment of a spawned server (dummy credentials, no bar store)"""
+    env = dict(os.environ)
+    env.setdefault("KIS_APP_KEY", "startup-appkey")
+    env.setdefault("KIS_APP_SECRET", "startup-appsecret")
+    env.setdefault("KIS_BAR_STORE", "off")
+    env["KIS_TOOL_CACHE"] = str(tool_cache)
+    return env
+
+
+def import_report(env: dict[str, str], code: str = "import server") -> dict:
+    """
+    Run import statements in a fresh interpreter with -X importtime
+
+    Returns:
+        dict: {"total_ms", "modules": [(name, self_ms, cumulative_ms)], "packages": {top-level package: self_ms}}
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=SERVER.parent, env=env, capture_output=True, text=True, check=True,
+    )
+    modules, packages = [], defaultdict(float)
+    total = 0.0
+    for line in completed.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, name = int(match[1]), int(match[2]), match[3], match[4]
+        modules.append((name, self_us / 1000, cumulative_us / 1000))
+        packages[name.split(".")[0]] += self_us / 1000
+        if len(indent) == 1:  # 최상위 import
+            total += cumulative_us / 1000
+    return {
+        "total_ms": total,
+        "modules": sorted(modules, key=lambda module: module[1], reverse=True),
+        "packages": dict(sorted(packages.items(), key=lambda item: item[1], reverse=True)),
+    }
+
+
+async def cold_start(env: dict[str, str], server: Path = SERVER) -> dict[str, float]:
+    """
+    Spawn the server over stdio like an MCP client and time the handshake
+
+    Returns:
+        dict[str, float]: Milliseconds from spawn to the initialize and first tools/list responses
+    """
+    params = StdioServerParameters(command=sys.executable, args=[str(server)], env=env, cwd=str(server.parent))
+    started = time.perf_counter()
+    async with stdio_client(params) as (read, write), ClientSession(read, write) as session:
+        await session.initialize()
+        initialized = time.perf_counter()
+        tools = await session.list_tools()
+        listed = time.perf_counter()
+    return {
+        "initialize_ms": (initialized - started) * 1000,
+        "tools_list_ms": (listed - started) * 1000,
+        "list_only_ms": (listed - initialized) * 1000,
+        "tools": len(tools.tools),
+    }
+
+
+def median_run(runs: list[dict]) -> dict[str, float]:
+    return {key: statistics.median(run[key] for run in runs) for key in ("initialize_ms", "tools_list_ms", "list_only_ms")}
+
+
+async def cold_starts(env: dict[str, str], runs: int, tool_cache: Path, baseline: Optional[Path] = None) -> dict:
+    """
+    Returns:
+        dict: Timings of the first run (no tool metadata cache), medians of later runs (cache written by the
+            first) and, with a baseline checkout, medians of the baseline server interleaved with them
+    """
+    tool_cache.unlink(missing_ok=True)
+    first = await cold_start(env)
+    warm, base = [], []
+    for _ in range(runs):
+        # 시스템 부하 변화가 한쪽에만 반영되지 않도록 번갈아 측정
+        warm.append(await cold_start(env))
+        if baseline is not None:
+            base.append(await cold_start(env, baseline / SERVER.name))
+    return {
+        "first": first,
+        "cached": median_run(warm),
+        "baseline": median_run(base) if base else None,
+        "tools": first["tools"],
+    }
+
+
+def checkout(revision: str, directory: Path) -> Path:
+    """
+    Extract a git revision of this repository (e.g. the commit before a startup change) into directory
+
+    Returns:
+        Path: Directory containing the revision's server.py
+    """
+    archive = subprocess.run(
+        ["git", "archive", "--format=tar", revision], cwd=SERVER.parent, capture_output=True, check=True,
+    ).stdout
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(directory, filter="data")
+    return directory
+
+
+def print_report(imports: dict, framework: dict, starts: dict, top: int, baseline: Optional[str] = None):
+    print(f"import server: {imports['total_ms']:.1f}ms "
+          f"(FastMCP + stdio alone: {framework['total_ms']:.1f}ms, "
+          f"server.py and its modules: {imports['total_ms'] - framework['total_ms']:.1f}ms)", file=sys.stderr)
+    print(f"\n{'package':32s} {'self':>10s}", file=sys.stderr)
+    for package, self_ms in list(imports["packages"].items())[:top]:
+        print(f"{package:32s} {self_ms:8.1f}ms", file=sys.stderr)
+    print(f"\n{'module':48s} {'self':>10s} {'cumul':>10s}", file=sys.stderr)
+    for name, self_ms, cumulative_ms in imports["modules"][:top]:
+        print(f"{name:48s} {self_ms:8.1f}ms {cumulative_ms:8.1f}ms", file=sys.stderr)
+    print(f"\ncold start over stdio ({starts['tools']} tools, tools/list: spawn -> response, list: after initialize)",
+          file=sys.stderr)
+    rows = [("first run (no tool cache)", starts["first"]), ("cached (median)", starts["cached"])]
+    if starts["baseline"]:
+        rows.append((f"baseline {baseline} (median)", starts["baseline"]))
+    for label, row in rows:
+        print(f"  {label:28s} initialize {row['initialize_ms']:7.1f}ms  tools/list {row['tools_list_ms']:7.1f}ms  "
+              f"list {row['list_only_ms']:6.1f}ms", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time and cold-start report of the MCP server")
+    parser.add_argument("-n", "--top", type=int, default=DEFAULT_TOP, help="출력할 패키지/모듈 수")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="도구 메타데이터 캐시 사용 시 측정 횟수")
+    parser.add_argument("--baseline", help="함께 측정할 비교 대상 git revision (예: 변경 전 커밋)")
+    parser.add_argument("-o", "--output", help="결과를 저장할 JSON 파일")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # 측정이 실제 도구 메타데이터 캐시를 덮어쓰지 않도록 임시 파일 사용
+        tool_cache = Path(tmp) / "tool_cache.json"
+        env = server_env(tool_cache)
+        baseline = checkout(args.baseline, Path(tmp) / "baseline") if args.baseline else None
+        imports = import_report(env)
+        framework = import_report(env, FRAMEWORK_IMPORT)
+        starts = asyncio.run(cold_starts(env, args.runs, tool_cache, baseline))
+    print_report(imports, framework, starts, args.top, args.baseline)
+    if args.output:
+        Path(args.output).write_text(json.dumps(
+            {"imports": imports, "framework_imports": framework, "cold_start": starts}, indent=2,
+        ))
+
+
+if __name__ == "__main__":
+    main()
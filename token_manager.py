@@ -0,0 +1,156 @@
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+logger = logging.getLogger("mcp-server")
+
+# 만료 전 미리 갱신을 시작하는 여유 시간 (초)
+DEFAULT_REFRESH_MARGIN = 30 * 60
+# 갱신 실패 시 재시도 간격 (초) - KIS는 토큰 발급을 1분당 1회로 제한
+RENEWAL_RETRY_DELAY = 65
+
+
+class TokenManager:
+    """
+    In-memory access token holder
+
+    - 메모리에 토큰을 보관하여 요청마다 token.json을 읽지 않음
+    - 동시에 여러 요청이 만료된 토큰을 만나도 발급 요청은 한 번만 전송 (single-flight)
+    - 만료 전에 백그라운드에서 미리 갱신
+    - 파일 입출력은 asyncio.to_thread로 이벤트 루프 밖에서 수행
+    """
+
+    def __init__(
+        self,
+        issue: Callable[[], Awaitable[tuple[str, datetime]]],
+        load: Callable[[], tuple[Optional[str], Optional[datetime]]],
+        save: Callable[[str, datetime], None],
+        refresh_margin: float = DEFAULT_REFRESH_MARGIN,
+    ):
+        """
+        Args:
+            issue: Coroutine function requesting a new token from KIS, returns (token, expires_at)
+            load: Function reading a persisted token, returns (token, expires_at) or (None, None)
+            save: Function persisting (token, expires_at)
+            refresh_margin: Seconds before expiry at which the token is renewed in the background
+        """
+        self._issue = issue
+        self._load = load
+        self._save = save
+        self.refresh_margin = timedelta(seconds=refresh_margin)
+        self._token: Optional[str] = None
+        self._expires_at: Optional[datetime] = None
+        self._loaded = False
+        self._inflight: Optional[asyncio.Task] = None
+        self._renewal: Optional[asyncio.Task] = None
+        self._users = 0
+
+    @classmethod
+    def from_env(cls, issue, load, save) -> "TokenManager":
+        """
+        Build a manager using KIS_TOKEN_REFRESH_MARGIN (seconds, default: 1800)
+        """
+        return cls(
+            issue, load, save,
+            refresh_margin=float(os.environ.get("KIS_TOKEN_REFRESH_MARGIN", DEFAULT_REFRESH_MARGIN)),
+        )
+
+    @property
+    def expires_at(self) -> Optional[datetime]:
+        return self._expires_at
+
+    def _is_valid(self) -> bool:
+        return self._token is not None and self._expires_at is not None and datetime.now() < self._expires_at
+
+    async def get_token(self) -> str:
+        """
+        Return the cached token, loading or issuing it only when necessary
+
+        Returns:
+            str: Valid access token
+        """
+        if self._is_valid():
+            return self._token
+        return await self._refresh(force=False)
+
+    def invalidate(self, token: Optional[str] = None):
+        """
+        Drop the in-memory token so the next call issues a new one
+
+        Args:
+            token: Only invalidate if the current token is still this one
+                   (avoids discarding a token another caller just renewed)
+        """
+        if token is None or token == self._token:
+            self._token = None
+            self._expires_at = None
+            self._loaded = True  # 파일의 토큰도 동일하므로 다시 읽지 않음
+
+    async def _refresh(self, force: bool) -> str:
+        # 진행 중인 갱신이 있으면 그 결과를 함께 기다림
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.create_task(self._do_refresh(force))
+        # shield: 호출자 한 명이 취소되어도 공유 갱신 작업은 계속 진행
+        return await asyncio.shield(self._inflight)
+
+    async def _load_persisted(self) -> bool:
+        self._loaded = True
+        token, expires_at = await asyncio.to_thread(self._load)
+        if token and expires_at and datetime.now() < expires_at:
+            self._token, self._expires_at = token, expires_at
+            return True
+        return False
+
+    async def _do_refresh(self, force: bool) -> str:
+        if not force and not self._loaded and await self._load_persisted():
+            return self._token
+
+        if not force and self._is_valid():
+            return self._token
+
+        token, expires_at = await self._issue()
+        self._token, self._expires_at = token, expires_at
+        logger.info(f"Issued new access token (expires at {expires_at.isoformat()})")
+        await asyncio.to_thread(self._save, token, expires_at)
+        return token
+
+    async def _renew_loop(self):
+        while True:
+            try:
+                if not self._loaded:
+                    await self._load_persisted()
+                if self._expires_at is None:
+                    # 아직 토큰을 사용한 적이 없으면 첫 요청 시 발급
+                    await asyncio.sleep(RENEWAL_RETRY_DELAY)
+                    continue
+                delay = (self._expires_at - self.refresh_margin - datetime.now()).total_seconds()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                    continue
+                await self._refresh(force=True)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Background token renewal failed: {e}")
+                await asyncio.sleep(RENEWAL_RETRY_DELAY)
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator["TokenManager"]:
+        """Run the background renewal task while at least one server lifespan is active"""
+        self._users += 1
+        if self._renewal is None or self._renewal.done():
+            self._renewal = asyncio.create_task(self._renew_loop())
+        try:
+            yield self
+        finally:
+            self._users -= 1
+            if self._users == 0 and self._renewal is not None:
+                self._renewal.cancel()
+                try:
+                    await self._renewal
+                except asyncio.CancelledError:
+                    pass
+                self._renewal = None
@@ -0,0 +1,95 @@
+import hashlib
+import importlib.metadata
+import inspect
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Callable, Optional
+
+import pydantic
+from mcp.types import Tool
+
+import codec
+
+logger = logging.getLogger("mcp-server")
+
+ToolSpec = tuple[Callable, dict]  # (도구 함수, FastMCP.add_tool 인자)
+
+
+def fingerprint(specs: dict[str, ToolSpec]) -> str:
+    """
+    Hash of everything FastMCP derives tool metadata from
+
+    Args:
+        specs: Tool name -> (function, add_tool keyword arguments)
+
+    Returns:
+        str: Hex digest that changes when a signature, docstring, annotation or the mcp/pydantic version changes
+    """
+    digest = hashlib.sha256(f"mcp={importlib.metadata.version('mcp')};pydantic={pydantic.VERSION}".encode())
+    for name, (fn, kwargs) in specs.items():
+        digest.update(json.dumps(
+            [name, str(inspect.signature(fn)), fn.__doc__, kwargs], sort_keys=True, ensure_ascii=False, default=str,
+        ).encode())
+    return digest.hexdigest()
+
+
+class ToolMetadataCache:
+    """
+    tools/list results saved on disk, keyed by fingerprint()
+
+    MCP 클라이언트는 stdio 세션마다 서버 프로세스를 새로 띄우므로, 도구별 pydantic 모델과 JSON schema 생성 결과를
+    파일에 저장해 두고 다음 실행의 tools/list는 저장된 결과로 응답합니다.
+    """
+
+    def __init__(self, path: Optional[Path]):
+        """
+        Args:
+            path: JSON file to read and write (None: disabled)
+        """
+        self.path = Path(path) if path else None
+
+    @classmethod
+    def from_env(cls, default_path: Path) -> "ToolMetadataCache":
+        """
+        Environment:
+            KIS_TOOL_CACHE: 도구 메타데이터 캐시 파일 경로, "off"이면 비활성화 (default: default_path)
+        """
+        path = os.environ.get("KIS_TOOL_CACHE", str(default_path))
+        if path.lower() in ("off", "false", "0", ""):
+            return cls(None)
+        return cls(Path(path))
+
+    def load(self, key: str) -> Optional[list[Tool]]:
+        """
+        Returns:
+            Optional[list[Tool]]: Cached tools, None if missing, unreadable or built from other sources
+        """
+        if self.path is None:
+            return None
+        try:
+            cached = codec.loads(self.path.read_bytes())
+            if cached.get("fingerprint") != key:
+                return None
+            return [Tool.model_validate(tool) for tool in cached["tools"]]
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable tool metadata cache {self.path}: {e}")
+            return None
+
+    def save(self, key: str, tools: list[Tool]):
+        if self.path is None:
+            return
+        try:
+            # 동시에 시작한 다른 프로세스가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({
+                    "fingerprint": key,
+                    "tools": [tool.model_dump(mode="json", by_alias=True, exclude_none=True) for tool in tools],
+                }, f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write tool metadata cache {self.path}: {e}")
@@ -0,0 +1,184 @@
+import json
+import logging
+import os
+import secrets
+import sys
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Optional, TextIO
+
+logger = logging.getLogger("mcp-server")
+
+# perf_counter 값을 epoch 시각으로 바꾸기 위한 보정값
+_EPOCH_OFFSET = time.time() - time.perf_counter()
+
+
+class NoopSpan:
+    """Span that records nothing (default when tracing is off)"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "NoopSpan":
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+
+NOOP_SPAN = NoopSpan()
+
+
+class Tracer:
+    """No-op tracer; subclasses export spans"""
+
+    enabled = False
+
+    def span(self, name: str, **attributes) -> NoopSpan:
+        """
+        Open a span around a block, nested under the current span
+
+        Args:
+            name: Span name (e.g. "tool", "kis.request")
+            attributes: Span attributes (tr_id, api_url ...)
+        """
+        return NOOP_SPAN
+
+    def record(self, name: str, start: float, end: float, **attributes):
+        """
+        Record a finished child span of the current span from perf_counter timestamps
+
+        Args:
+            name: Span name
+            start: time.perf_counter() at the start
+            end: time.perf_counter() at the end
+            attributes: Span attributes
+        """
+
+    def record_phases(self, start: float, phases: dict[str, float], **attributes):
+        """
+        Record consecutive phases as child spans laid out from start
+
+        Args:
+            start: time.perf_counter() at the start of the first phase
+            phases: Phase name -> seconds, in order
+            attributes: Attributes set on every phase span
+        """
+        if not self.enabled:
+            return
+        for phase, seconds in phases.items():
+            self.record(phase, start, start + seconds, **attributes)
+            start += seconds
+
+
+_current: ContextVar[Optional["LocalSpan"]] = ContextVar("kis_span", default=None)
+
+
+class LocalSpan:
+    __slots__ = ("tracer", "name", "trace_id", "span_id", "parent_id", "start", "attributes", "_token")
+
+    def __init__(self, tracer: "LocalTracer", name: str, attributes: dict, parent: Optional["LocalSpan"]):
+        self.tracer = tracer
+        self.name = name
+        self.trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent.span_id if parent else None
+        self.attributes = attributes
+        self.start = 0.0
+        self._token = None
+
+    def __enter__(self) -> "LocalSpan":
+        self.start = time.perf_counter()
+        self._token = _current.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter()
+        _current.reset(self._token)
+        if exc is not None:
+            self.attributes["error"] = f"{exc_type.__name__}: {exc}"
+        self.tracer.export(self, self.start, end)
+        return False
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+
+class LocalTracer(Tracer):
+    """
+    Tracer writing finished spans as JSON lines (console: stderr, file: KIS_TRACE_FILE)
+
+    stdout은 MCP stdio 전송에 사용되므로 콘솔 출력은 stderr로 보냅니다.
+    """
+
+    enabled = True
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+        self._lock = threading.Lock()
+
+    def span(self, name: str, **attributes) -> LocalSpan:
+        return LocalSpan(self, name, attributes, _current.get())
+
+    def record(self, name: str, start: float, end: float, **attributes):
+        span = LocalSpan(self, name, attributes, _current.get())
+        self.export(span, start, end)
+
+    def export(self, span: LocalSpan, start: float, end: float):
+        line = json.dumps({
+            "trace_id": span.trace_id,
+            "span_id": span.span_id,
+            "parent_id": span.parent_id,
+            "name": span.name,
+            "start": round(_EPOCH_OFFSET + start, 6),
+            "duration_ms": round((end - start) * 1000, 3),
+            "attributes": span.attributes,
+        }, ensure_ascii=False, default=str)
+        with self._lock:
+            self.stream.write(line + "\n")
+
+
+class OtelTracer(Tracer):
+    """Tracer delegating to the OpenTelemetry API (provider/exporter configured by the OpenTelemetry SDK)"""
+
+    enabled = True
+
+    def __init__(self):
+        # import에 수 ms가 걸리므로 KIS_TRACING=otel일 때만 불러옴 (선택 의존성: pip install -e ".[tracing]")
+        from opentelemetry import trace
+
+        self._tracer = trace.get_tracer("kis-mcp-server")
+
+    def span(self, name: str, **attributes):
+        return self._tracer.start_as_current_span(name, attributes=attributes)
+
+    def record(self, name: str, start: float, end: float, **attributes):
+        span = self._tracer.start_span(name, attributes=attributes, start_time=int((_EPOCH_OFFSET + start) * 1e9))
+        span.end(end_time=int((_EPOCH_OFFSET + end) * 1e9))
+
+
+def tracer_from_env() -> Tracer:
+    """
+    Environment:
+        KIS_TRACING: off (default), console (stderr), file, otel
+        KIS_TRACE_FILE: KIS_TRACING=file일 때 span을 기록할 JSON lines 파일 (default: traces.jsonl)
+    """
+    mode = os.environ.get("KIS_TRACING", "off").lower()
+    if mode in ("", "off", "false", "0", "no"):
+        return Tracer()
+    if mode == "console":
+        return LocalTracer(sys.stderr)
+    if mode == "file":
+        # 줄 단위 버퍼링으로 종료 시 flush 없이도 span이 남도록 함
+        return LocalTracer(open(os.environ.get("KIS_TRACE_FILE", "traces.jsonl"), "a", buffering=1, encoding="utf-8"))
+    if mode == "otel":
+        try:
+            return OtelTracer()
+        except ImportError:
+            logger.warning("KIS_TRACING=otel but 'opentelemetry-api' is not installed, tracing disabled")
+            return Tracer()
+    logger.warning(f"Unknown KIS_TRACING value '{mode}', tracing disabled")
+    return Tracer()